@@ -0,0 +1,90 @@
+"""
+Benchmark for DispatchEngine.
+
+Spreads vehicles over a city-sized area, then times dispatch cycles of
+request batches: small batches are solved optimally with the Hungarian
+algorithm and large ones with the greedy matcher. Indexing the fleet is
+done once, before timing, like a long-running engine would.
+
+Run from the repository root with:
+    PYTHONPATH=src python benchmarks/bench_dispatch.py
+"""
+import argparse
+import random
+import time
+
+from ground_vehicles_system.application.services.dispatch import (
+    DispatchEngine,
+    DispatchRequest
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+# Roughly 30 km across, around Los Angeles.
+MIN_LATITUDE, MAX_LATITUDE = 33.9, 34.2
+MIN_LONGITUDE, MAX_LONGITUDE = -118.4, -118.1
+
+
+def build_fleet(vehicles: int, generator: random.Random) -> Fleet:
+    return Fleet.create(
+        Vehicle.create(
+            coordinates=Coordinates(
+                generator.uniform(MIN_LATITUDE, MAX_LATITUDE),
+                generator.uniform(MIN_LONGITUDE, MAX_LONGITUDE),
+            ),
+            velocity=Velocity(0.0),
+            vehicle_id=f"vehicle_{index}",
+        )
+        for index in range(vehicles)
+    )
+
+
+def build_requests(requests: int, generator: random.Random) -> list[DispatchRequest]:
+    return [
+        DispatchRequest(
+            f"request_{index}",
+            generator.uniform(MIN_LATITUDE, MAX_LATITUDE),
+            generator.uniform(MIN_LONGITUDE, MAX_LONGITUDE),
+        )
+        for index in range(requests)
+    ]
+
+
+def run(engine: DispatchEngine, requests: list[DispatchRequest]) -> tuple[float, int]:
+    started = time.perf_counter()
+    result = engine.dispatch(requests)
+    elapsed = time.perf_counter() - started
+
+    for assignment in result.assignments:
+        engine.complete(assignment.vehicle_id)
+
+    return elapsed * 1000, len(result.assignments)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=100_000)
+    parser.add_argument(
+        "--requests", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    fleet = build_fleet(args.vehicles, generator)
+
+    started = time.perf_counter()
+    engine = DispatchEngine(fleet)
+    print(f"indexed {args.vehicles:,} vehicles in "
+          f"{(time.perf_counter() - started) * 1000:,.0f} ms")
+
+    print(f"{'requests':>9} {'assigned':>9} {'ms':>10}")
+    for requests in args.requests:
+        elapsed_ms, assigned = run(engine, build_requests(requests, generator))
+        print(f"{requests:>9,} {assigned:>9,} {elapsed_ms:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark for ThreadPoolFleetStepper.
+
+Steps the same fleet with 1 to N worker threads and reports vehicle updates
+per second. Speed-ups only show on free-threaded interpreters; with the GIL
+the numbers show the cost of the thread-pool overhead instead.
+
+Run from the repository root with:
+    PYTHONPATH=src python benchmarks/bench_fleet_stepping.py
+"""
+import argparse
+import time
+
+from ground_vehicles_system.application.services.fleet_stepper import (
+    ThreadPoolFleetStepper,
+    free_threading_enabled
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+def build_fleet(vehicles: int) -> Fleet:
+    return Fleet.create(
+        Vehicle.create(
+            coordinates=Coordinates(34.0, -118.0),
+            velocity=Velocity(10.0),
+            vehicle_id=f"vehicle_{index}",
+            heading=Heading(float(index % 360)),
+        )
+        for index in range(vehicles)
+    )
+
+
+def run(workers: int, vehicles: int, ticks: int) -> float:
+    fleet = build_fleet(vehicles)
+
+    with ThreadPoolFleetStepper(fleet, workers=workers) as stepper:
+        started = time.perf_counter()
+        for _ in range(ticks):
+            stepper.step(0.1)
+        elapsed = time.perf_counter() - started
+
+    return vehicles * ticks / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--vehicles", type=int, default=50_000)
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"free-threaded: {free_threading_enabled()}")
+    print(f"{'workers':>8} {'updates/s':>12}")
+    for workers in args.workers:
+        throughput = run(workers, args.vehicles, args.ticks)
+        print(f"{workers:>8} {throughput:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
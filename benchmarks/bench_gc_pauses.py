@@ -0,0 +1,106 @@
+"""
+Benchmark for allocation-light stepping.
+
+Steps the same fleet with Vehicle.move and with FleetWorkingState, and
+reports the elapsed time together with the garbage collections triggered
+and the time spent paused in them, measured with gc.callbacks.
+
+Run from the repository root with:
+    PYTHONPATH=src python benchmarks/bench_gc_pauses.py
+"""
+import argparse
+import gc
+import time
+from typing import Callable
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.entities.working_state import FleetWorkingState
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class GcPauses:
+    """Counts collections and adds up their durations while installed."""
+    def __init__(self) -> None:
+        self.collections = 0
+        self.paused_seconds = 0.0
+        self.longest_seconds = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> "GcPauses":
+        gc.callbacks.append(self._on_gc)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+            return
+
+        pause = time.perf_counter() - self._started
+        self.collections += 1
+        self.paused_seconds += pause
+        self.longest_seconds = max(self.longest_seconds, pause)
+
+
+def build_fleet(vehicles: int) -> Fleet:
+    return Fleet.create(
+        Vehicle.create(
+            coordinates=Coordinates(34.0, -118.0),
+            velocity=Velocity(10.0),
+            vehicle_id=f"vehicle_{index}",
+            heading=Heading(float(index % 360)),
+        )
+        for index in range(vehicles)
+    )
+
+
+def step_vehicles(fleet: Fleet, ticks: int) -> None:
+    for _ in range(ticks):
+        for vehicle in fleet:
+            vehicle.move(0.1, obstacle_found=False, will_hit_obstacle=False)
+
+
+def step_working_state(fleet: Fleet, ticks: int) -> None:
+    working_state = FleetWorkingState(fleet)
+    for _ in range(ticks):
+        working_state.step(0.1)
+    working_state.commit()
+
+
+def run(stepper: Callable[[Fleet, int], None], vehicles: int, ticks: int) -> None:
+    fleet = build_fleet(vehicles)
+    gc.collect()
+
+    with GcPauses() as pauses:
+        started = time.perf_counter()
+        stepper(fleet, ticks)
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"{stepper.__name__:>20} {vehicles * ticks / elapsed:>12,.0f} "
+        f"{pauses.collections:>12,} {pauses.paused_seconds * 1000:>10,.1f} "
+        f"{pauses.longest_seconds * 1000:>11,.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=100_000)
+    parser.add_argument("--ticks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':>20} {'updates/s':>12} {'collections':>12} {'paused ms':>10} "
+        f"{'longest ms':>11}"
+    )
+    run(step_vehicles, args.vehicles, args.ticks)
+    run(step_working_state, args.vehicles, args.ticks)
+
+
+if __name__ == "__main__":
+    main()
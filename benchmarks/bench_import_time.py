@@ -0,0 +1,53 @@
+"""
+Benchmark for the cost of importing the package.
+
+Imports each entry point in a fresh interpreter, as short-lived tools do,
+and reports the median time over the runs, excluding the interpreter's own
+startup.
+
+Run from the repository root with:
+    PYTHONPATH=src python benchmarks/bench_import_time.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_POINTS = (
+    "pass",
+    "import ground_vehicles_system",
+    "from ground_vehicles_system import Vehicle",
+    "import ground_vehicles_system.domain.entities.fleet",
+    "import ground_vehicles_system.application.services.dispatch",
+)
+
+
+def median_seconds(code: str, runs: int) -> float:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    timings = []
+
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        timings.append(time.perf_counter() - started)
+
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    startup = median_seconds(ENTRY_POINTS[0], args.runs)
+    print(f"{'interpreter startup':>60} {startup * 1000:>8.1f} ms")
+
+    for code in ENTRY_POINTS[1:]:
+        elapsed = median_seconds(code, args.runs) - startup
+        print(f"{code:>60} {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Stress benchmark for ConcurrentVehicleCommands.
+
+Every thread issues a mix of accelerate, turn and move commands against a
+shared fleet and the aggregate throughput is reported per thread count.
+
+Run from the repository root with:
+    PYTHONPATH=src python benchmarks/bench_vehicle_contention.py
+"""
+import argparse
+import random
+import threading
+import time
+
+from ground_vehicles_system.application.services.concurrent_vehicle_commands import (
+    ConcurrentVehicleCommands
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+def build_fleet(vehicles: int) -> Fleet:
+    return Fleet.create(
+        Vehicle.create(
+            coordinates=Coordinates(34.0, -118.0),
+            velocity=Velocity(10.0),
+            vehicle_id=f"vehicle_{index}",
+            heading=Heading(90.0),
+        )
+        for index in range(vehicles)
+    )
+
+
+def run(threads: int, operations: int, vehicles: int, stripes: int) -> float:
+    commands = ConcurrentVehicleCommands(build_fleet(vehicles), stripes=stripes)
+    vehicle_ids = [f"vehicle_{index}" for index in range(vehicles)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        generator = random.Random(seed)
+        barrier.wait()
+        for _ in range(operations):
+            vehicle_id = generator.choice(vehicle_ids)
+            command = generator.random()
+            if command < 0.4:
+                commands.accelerate(vehicle_id, 0.1, VelocityUnit.MPS)
+            elif command < 0.6:
+                commands.turn(vehicle_id, 1.0)
+            else:
+                commands.move(vehicle_id, 0.1, False, False)
+
+    workers = [
+        threading.Thread(target=worker, args=(seed,)) for seed in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return threads * operations / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operations", type=int, default=50_000)
+    parser.add_argument("--vehicles", type=int, default=1_000)
+    parser.add_argument("--stripes", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'ops/s':>12}")
+    for threads in args.threads:
+        throughput = run(threads, args.operations, args.vehicles, args.stripes)
+        print(f"{threads:>8} {throughput:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
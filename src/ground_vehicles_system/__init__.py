@@ -0,0 +1,67 @@
+"""
+Ground Vehicles System.
+
+The core domain classes are exported here but only imported on first
+access, so importing the package, or one of its modules, doesn't load
+the rest of it.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+
+# Not imported from typing, which is itself slow to import; type checkers
+# treat this name the same way.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from ground_vehicles_system.domain.entities.fleet import Fleet
+    from ground_vehicles_system.domain.entities.vehicle import (
+        CommandOutcome,
+        Vehicle,
+        VehicleState
+    )
+    from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+    from ground_vehicles_system.domain.value_objects.heading import Heading
+    from ground_vehicles_system.domain.value_objects.velocity import (
+        Velocity,
+        VelocityUnit
+    )
+
+_EXPORTS = {
+    "CommandOutcome": "ground_vehicles_system.domain.entities.vehicle",
+    "Coordinates": "ground_vehicles_system.domain.value_objects.coordinates",
+    "Fleet": "ground_vehicles_system.domain.entities.fleet",
+    "Heading": "ground_vehicles_system.domain.value_objects.heading",
+    "Vehicle": "ground_vehicles_system.domain.entities.vehicle",
+    "VehicleState": "ground_vehicles_system.domain.entities.vehicle",
+    "Velocity": "ground_vehicles_system.domain.value_objects.velocity",
+    "VelocityUnit": "ground_vehicles_system.domain.value_objects.velocity",
+}
+
+# Spelled out rather than derived from _EXPORTS so linters can see that the
+# names imported for type checkers above are exported.
+__all__ = [
+    "CommandOutcome",
+    "Coordinates",
+    "Fleet",
+    "Heading",
+    "Vehicle",
+    "VehicleState",
+    "Velocity",
+    "VelocityUnit",
+]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    # Cached so later accesses skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
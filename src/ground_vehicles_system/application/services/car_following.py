@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import math
+from typing import Iterable
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.common.heading_math import (
+    bearing_degrees,
+    signed_difference
+)
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import CommandOutcome
+from ground_vehicles_system.domain.services.spatial_index import (
+    PointGridIndex,
+    cell_of
+)
+from ground_vehicles_system.domain.value_objects.velocity import VelocityUnit
+
+
+@dataclass(frozen=True)
+class IdmParameters:
+    """Intelligent Driver Model parameters shared by every follower."""
+    desired_speed_mps: float = 30.0
+    time_headway_seconds: float = 1.5
+    minimum_gap_meters: float = 2.0
+    max_acceleration_mps2: float = 1.0
+    comfortable_deceleration_mps2: float = 2.0
+    max_deceleration_mps2: float = 9.0
+    acceleration_exponent: float = 4.0
+    vehicle_length_meters: float = 4.5
+
+    def __post_init__(self):
+        if self.desired_speed_mps <= 0:
+            raise ValueError("desired_speed_mps must be positive.")
+        if self.max_acceleration_mps2 <= 0 or self.comfortable_deceleration_mps2 <= 0:
+            raise ValueError("Accelerations must be positive.")
+
+
+@dataclass(frozen=True)
+class FollowingReport:
+    """Outcome of one car-following step."""
+    followers: int
+    rejected: tuple[str, ...]
+
+
+class CarFollowingModel:
+    """
+    Convoy car following with the Intelligent Driver Model (IDM).
+
+    Each follower is linked to the vehicle ahead of it. A step first gathers
+    the gap and closing speed of every (follower, leader) pair and evaluates
+    all accelerations against the same fleet state, then applies them
+    through Vehicle.accelerate and Vehicle.decelerate so the usual state
+    rules hold. Gaps are bumper-to-bumper under the flat-earth motion model.
+    """
+    def __init__(
+        self,
+        fleet: Fleet,
+        parameters: IdmParameters = IdmParameters(),
+    ) -> None:
+        self._fleet = fleet
+        self._parameters = parameters
+        self._leaders: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._leaders)
+
+    def leader_of(self, follower_id: str) -> str | None:
+        return self._leaders.get(follower_id)
+
+    def link(self, follower_id: str, leader_id: str) -> None:
+        """Makes follower_id follow leader_id, replacing its previous leader."""
+        self._fleet.get(follower_id)
+        self._fleet.get(leader_id)
+
+        if self._would_cycle(follower_id, leader_id):
+            raise ValueError(
+                f"Vehicle {follower_id} can't follow {leader_id}: the convoy "
+                "would become a loop."
+            )
+
+        self._leaders[follower_id] = leader_id
+
+    def unlink(self, follower_id: str) -> None:
+        self._leaders.pop(follower_id, None)
+
+    def link_nearest_leaders(
+        self,
+        follower_ids: Iterable[str],
+        max_gap_meters: float = 100.0,
+        max_heading_difference_degrees: float = 30.0,
+    ) -> int:
+        """
+        Links each follower to the closest vehicle ahead of it, within
+        max_gap_meters and driving in about the same direction. Candidates
+        are found in the neighbouring cells of a point grid instead of by
+        comparing every pair. Returns how many followers got a leader.
+        """
+        if max_gap_meters <= 0:
+            raise ValueError("max_gap_meters must be positive.")
+
+        meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        cell_size = max_gap_meters / meters_per_degree
+        grid: PointGridIndex[str] = PointGridIndex(cell_size)
+
+        for vehicle in self._fleet:
+            grid.insert(
+                vehicle.vehicle_id,
+                vehicle.coordinates.latitude,
+                vehicle.coordinates.longitude
+            )
+
+        linked = 0
+
+        for follower_id in follower_ids:
+            leader_id = self._nearest_leader(
+                follower_id, grid, max_gap_meters, max_heading_difference_degrees
+            )
+            if leader_id is not None:
+                self._leaders[follower_id] = leader_id
+                linked += 1
+
+        return linked
+
+    def accelerations(self) -> tuple[list[str], array]:
+        """
+        Returns the followers and their IDM accelerations in m/s², computed
+        in one pass over all linked pairs.
+        """
+        parameters = self._parameters
+        desired_speed = parameters.desired_speed_mps
+        headway = parameters.time_headway_seconds
+        minimum_gap = parameters.minimum_gap_meters
+        max_acceleration = parameters.max_acceleration_mps2
+        max_deceleration = parameters.max_deceleration_mps2
+        exponent = parameters.acceleration_exponent
+        length = parameters.vehicle_length_meters
+        braking_term = 2 * math.sqrt(
+            max_acceleration * parameters.comfortable_deceleration_mps2
+        )
+
+        follower_ids = list(self._leaders)
+        accelerations = array('d', bytes(8 * len(follower_ids)))
+        vehicles = self._fleet
+
+        for row, follower_id in enumerate(follower_ids):
+            follower = vehicles.get(follower_id)
+            leader = vehicles.get(self._leaders[follower_id])
+            speed = follower.velocity.to_mps()
+            closing_speed = speed - leader.velocity.to_mps()
+            gap = ground_distance_meters(
+                follower.coordinates.latitude,
+                follower.coordinates.longitude,
+                leader.coordinates.latitude,
+                leader.coordinates.longitude
+            ) - length
+
+            if gap <= 0.0:
+                accelerations[row] = -max_deceleration
+                continue
+
+            desired_gap = minimum_gap + max(
+                0.0, speed * headway + speed * closing_speed / braking_term
+            )
+            acceleration = max_acceleration * (
+                1.0
+                - (speed / desired_speed) ** exponent
+                - (desired_gap / gap) ** 2
+            )
+            accelerations[row] = max(-max_deceleration, acceleration)
+
+        return follower_ids, accelerations
+
+    def step(self, time_delta_seconds: float) -> FollowingReport:
+        """
+        Applies one step of car following to every linked follower.
+        Accidented followers can't change speed and are reported as rejected.
+        """
+        follower_ids, accelerations = self.accelerations()
+        rejected = []
+
+        for follower_id, acceleration in zip(follower_ids, accelerations):
+            vehicle = self._fleet.get(follower_id)
+            outcome = vehicle.try_accelerate(
+                acceleration * time_delta_seconds, VelocityUnit.MPS
+            )
+            if outcome is CommandOutcome.REJECTED:
+                rejected.append(follower_id)
+
+        return FollowingReport(len(follower_ids), tuple(rejected))
+
+    def _nearest_leader(
+        self,
+        follower_id: str,
+        grid: PointGridIndex[str],
+        max_gap_meters: float,
+        max_heading_difference_degrees: float,
+    ) -> str | None:
+        follower = self._fleet.get(follower_id)
+        latitude = follower.coordinates.latitude
+        longitude = follower.coordinates.longitude
+        heading = follower.heading.degrees
+        row, column = cell_of(latitude, longitude, grid.cell_size_degrees)
+        # A degree of longitude shrinks with latitude, so more columns are
+        # needed to cover max_gap_meters east and west, but never more than
+        # span the whole globe, which near the poles would be billions.
+        columns = min(
+            math.ceil(1 / max(math.cos(math.radians(latitude)), 1e-9)),
+            math.ceil(360 / grid.cell_size_degrees),
+        )
+        best_gap = max_gap_meters
+        best_id = None
+
+        # Wide ranges are answered from the occupied cells instead of probing
+        # every column.
+        for cell in grid.cells_between(
+            (row - 1, column - columns), (row + 1, column + columns)
+        ):
+            for candidate_id in grid.keys_in_cell(cell):
+                if candidate_id == follower_id:
+                    continue
+
+                other_latitude, other_longitude = grid.position_of(candidate_id)
+                gap = ground_distance_meters(
+                    latitude, longitude, other_latitude, other_longitude
+                )
+                if gap == 0.0 or gap > best_gap:
+                    continue
+
+                bearing = bearing_degrees(
+                    latitude, longitude, other_latitude, other_longitude
+                )
+                if abs(signed_difference(heading, bearing)) >= 90.0:
+                    continue
+
+                candidate_heading = self._fleet.get(candidate_id).heading
+                if abs(
+                    signed_difference(heading, candidate_heading.degrees)
+                ) > max_heading_difference_degrees:
+                    continue
+                if self._would_cycle(follower_id, candidate_id):
+                    continue
+
+                best_gap = gap
+                best_id = candidate_id
+
+        return best_id
+
+    def _would_cycle(self, follower_id: str, leader_id: str) -> bool:
+        current: str | None = leader_id
+
+        while current is not None:
+            if current == follower_id:
+                return True
+            current = self._leaders.get(current)
+
+        return False
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+from typing import Iterator
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.velocity import VelocityUnit
+
+
+class LockStripes:
+    """
+    A fixed pool of locks shared by vehicle id.
+    Each vehicle always maps to the same lock, so commands for one vehicle are
+    serialized while commands for vehicles on other stripes run in parallel,
+    without allocating a lock per vehicle.
+    """
+    def __init__(self, stripes: int = 64) -> None:
+        if stripes <= 0:
+            raise ValueError("stripes must be positive.")
+
+        self._locks = tuple(threading.Lock() for _ in range(stripes))
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def lock_for(self, vehicle_id: str) -> threading.Lock:
+        return self._locks[hash(vehicle_id) % len(self._locks)]
+
+
+class ConcurrentVehicleCommands:
+    """
+    Applies commands to fleet vehicles from any number of threads.
+    Vehicle methods read-modify-write their velocity, heading and state, so
+    every command runs under the lock stripe of its vehicle. A crash recorded
+    by move can therefore never be overwritten by a concurrent accelerate:
+    whichever runs second sees the state left by the first.
+    """
+    def __init__(self, fleet: Fleet, stripes: int = 64) -> None:
+        self._fleet = fleet
+        self._stripes = LockStripes(stripes)
+
+    @contextmanager
+    def locked(self, vehicle_id: str) -> Iterator[Vehicle]:
+        """
+        Holds the vehicle's lock for a compound operation.
+        The vehicle is resolved before locking so an unknown id doesn't block
+        the other vehicles sharing the stripe.
+        """
+        vehicle = self._fleet.get(vehicle_id)
+
+        with self._stripes.lock_for(vehicle_id):
+            yield vehicle
+
+    def accelerate(self, vehicle_id: str, amount: float, unit: VelocityUnit) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.accelerate(amount, unit)
+
+    def decelerate(self, vehicle_id: str, amount: float, unit: VelocityUnit) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.decelerate(amount, unit)
+
+    def brake(self, vehicle_id: str, amount: float, unit: VelocityUnit) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.brake(amount, unit)
+
+    def brake_to_a_stop(self, vehicle_id: str) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.brake_to_a_stop()
+
+    def turn(self, vehicle_id: str, degrees: float) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.turn(degrees)
+
+    def stop_engine(self, vehicle_id: str) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.stop_engine()
+
+    def move(
+        self,
+        vehicle_id: str,
+        time_delta_seconds: float,
+        obstacle_found: bool,
+        will_hit_obstacle: bool
+    ) -> None:
+        with self.locked(vehicle_id) as vehicle:
+            vehicle.move(time_delta_seconds, obstacle_found, will_hit_obstacle)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Sequence
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.services.assignment import (
+    UNASSIGNED,
+    greedy_assignment,
+    solve_assignment
+)
+from ground_vehicles_system.domain.services.spatial_index import PointGridIndex
+
+DISPATCHABLE_STATES = frozenset({VehicleState.STOPPED, VehicleState.DRIVING})
+
+
+@dataclass(frozen=True)
+class DispatchRequest:
+    """A ride or delivery waiting for a vehicle at a pickup position."""
+    request_id: str
+    latitude: float
+    longitude: float
+
+
+@dataclass(frozen=True)
+class Assignment:
+    request_id: str
+    vehicle_id: str
+    distance_meters: float
+
+
+@dataclass
+class DispatchResult:
+    """Assignments of one dispatch cycle, and the requests left waiting."""
+    assignments: list[Assignment] = field(default_factory=list)
+    unassigned: list[str] = field(default_factory=list)
+
+
+class DispatchEngine(VehicleObserver):
+    """
+    Matches batches of requests to nearby available vehicles.
+
+    Stopped and driving vehicles that are not busy are kept in a point grid,
+    updated from their movements and state changes, so a dispatch cycle does
+    not depend on the fleet size. Each request takes its nearest candidates
+    from the grid, and the candidate pairs are matched minimizing the total
+    pickup distance with the Hungarian algorithm for batches of up to
+    optimal_batch_limit requests, or cheapest-pair-first beyond that.
+
+    Assigned vehicles are busy and skipped by later cycles until completed.
+    Vehicles must be changed on the thread that dispatches.
+    """
+    def __init__(
+        self,
+        fleet: Fleet,
+        cell_size_degrees: float = 0.001,
+        candidates_per_request: int = 8,
+        max_pickup_meters: float = 5_000.0,
+        optimal_batch_limit: int = 100,
+    ) -> None:
+        if candidates_per_request <= 0:
+            raise ValueError("candidates_per_request must be positive.")
+
+        self._available: PointGridIndex[str] = PointGridIndex(cell_size_degrees)
+        self._vehicles: dict[str, Vehicle] = {}
+        self._busy: set[str] = set()
+        self._candidates_per_request = candidates_per_request
+        self._max_pickup_meters = max_pickup_meters
+        self._optimal_batch_limit = optimal_batch_limit
+
+        for vehicle in fleet:
+            self.track(vehicle)
+
+    @property
+    def available_count(self) -> int:
+        return len(self._available)
+
+    def is_busy(self, vehicle_id: str) -> bool:
+        return vehicle_id in self._busy
+
+    def track(self, vehicle: Vehicle) -> None:
+        if vehicle.vehicle_id in self._vehicles:
+            return
+
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        vehicle.add_observer(self)
+        self._changed(vehicle)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        del self._vehicles[vehicle_id]
+        self._busy.discard(vehicle_id)
+        if vehicle_id in self._available:
+            self._available.remove(vehicle_id)
+        vehicle.remove_observer(self)
+
+    def complete(self, vehicle_id: str) -> None:
+        """Makes a busy vehicle available for dispatch again."""
+        self._busy.discard(vehicle_id)
+        self._changed(self._vehicles[vehicle_id])
+
+    def dispatch(self, requests: Sequence[DispatchRequest]) -> DispatchResult:
+        """Assigns the batch of requests, marking the chosen vehicles busy."""
+        vehicle_ids: list[str] = []
+        columns: dict[str, int] = {}
+        edges: list[tuple[float, int, int]] = []
+
+        for row, request in enumerate(requests):
+            for distance, vehicle_id in self._available.nearest_many(
+                request.latitude,
+                request.longitude,
+                self._candidates_per_request,
+                self._max_pickup_meters,
+            ):
+                column = columns.get(vehicle_id)
+                if column is None:
+                    column = columns[vehicle_id] = len(vehicle_ids)
+                    vehicle_ids.append(vehicle_id)
+                edges.append((distance, row, column))
+
+        if len(requests) <= self._optimal_batch_limit:
+            costs = [[math.inf] * len(vehicle_ids) for _ in requests]
+            for distance, row, column in edges:
+                costs[row][column] = distance
+            assigned = solve_assignment(costs)
+        else:
+            assigned = greedy_assignment(edges, len(requests))
+
+        distances = {(row, column): distance for distance, row, column in edges}
+        result = DispatchResult()
+
+        for row, request in enumerate(requests):
+            column = assigned[row]
+            if column == UNASSIGNED:
+                result.unassigned.append(request.request_id)
+                continue
+
+            vehicle_id = vehicle_ids[column]
+            self._busy.add(vehicle_id)
+            self._available.remove(vehicle_id)
+            result.assignments.append(
+                Assignment(request.request_id, vehicle_id, distances[row, column])
+            )
+
+        return result
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        self._changed(vehicle)
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        self._changed(vehicle)
+
+    def _changed(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+
+        if vehicle.state in DISPATCHABLE_STATES and vehicle_id not in self._busy:
+            coordinates = vehicle.coordinates
+            self._available.insert(
+                vehicle_id, coordinates.latitude, coordinates.longitude
+            )
+        elif vehicle_id in self._available:
+            self._available.remove(vehicle_id)
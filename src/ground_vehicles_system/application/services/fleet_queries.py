@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+import math
+from typing import Iterator
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.services.sorted_blocks import SortedBlockList
+from ground_vehicles_system.domain.services.spatial_index import (
+    CellKey,
+    PointGridIndex
+)
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+
+@dataclass(frozen=True)
+class VehiclePage:
+    """
+    One page of a query. next_cursor is passed back as `after` to read the
+    following page, and is None on the last one.
+    """
+    vehicles: list[Vehicle]
+    next_cursor: str | None
+
+
+class FleetQueryIndex(VehicleObserver):
+    """
+    Read-side indexes answering fleet queries without scanning the fleet.
+
+    Vehicle ids are kept sorted, overall and per state, so listings are paged
+    with an id cursor found by bisection. The sorted ids are built in bulk
+    when the index is created and stored in blocks, so a later state change
+    costs O(log n + block size) rather than shifting a fleet-sized list.
+    Positions live in a point grid, and
+    spatial results are ordered by grid cell then id so their cursors resume
+    in the middle of a cell. The indexes follow tracked vehicles by observing
+    them; vehicles added to or removed from the fleet afterwards have to be
+    tracked or untracked explicitly.
+    """
+    def __init__(self, fleet: Fleet, cell_size_degrees: float = 0.01) -> None:
+        self._fleet = fleet
+        self._positions: PointGridIndex[str] = PointGridIndex(cell_size_degrees)
+        ids_by_state: dict[VehicleState, list[str]] = {
+            state: [] for state in VehicleState
+        }
+
+        for vehicle in fleet:
+            coordinates = vehicle.coordinates
+            self._positions.insert(
+                vehicle.vehicle_id, coordinates.latitude, coordinates.longitude
+            )
+            ids_by_state[vehicle.state].append(vehicle.vehicle_id)
+            vehicle.add_observer(self)
+
+        self._all_ids: SortedBlockList[str] = SortedBlockList(
+            vehicle_id for ids in ids_by_state.values() for vehicle_id in ids
+        )
+        self._ids_by_state: dict[VehicleState, SortedBlockList[str]] = {
+            state: SortedBlockList(ids) for state, ids in ids_by_state.items()
+        }
+
+    def track(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+
+        if vehicle_id in self._positions:
+            return
+
+        self._all_ids.add(vehicle_id)
+        self._ids_by_state[vehicle.state].add(vehicle_id)
+        self._positions.insert(
+            vehicle_id, vehicle.coordinates.latitude, vehicle.coordinates.longitude
+        )
+        vehicle.add_observer(self)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        self._positions.remove(vehicle_id)
+        self._all_ids.discard(vehicle_id)
+        self._ids_by_state[vehicle.state].discard(vehicle_id)
+        vehicle.remove_observer(self)
+
+    def get(self, vehicle_id: str) -> Vehicle:
+        """Returns the vehicle with the given id, like Fleet.get."""
+        if vehicle_id not in self._positions:
+            raise VehicleNotFoundError(vehicle_id)
+        return self._fleet.get(vehicle_id)
+
+    def page(
+        self,
+        state: VehicleState | None = None,
+        after: str | None = None,
+        limit: int = 100,
+    ) -> VehiclePage:
+        """Lists vehicles, optionally of one state, in id order."""
+        _check_limit(limit)
+        ids = self._all_ids if state is None else self._ids_by_state[state]
+        # One extra id tells whether another page follows.
+        page_ids = list(islice(ids.after(after), limit + 1))
+        next_cursor = page_ids[limit - 1] if len(page_ids) > limit else None
+        del page_ids[limit:]
+
+        return VehiclePage(
+            [self._fleet.get(vehicle_id) for vehicle_id in page_ids], next_cursor
+        )
+
+    def page_in_box(
+        self,
+        box: BoundingBox,
+        after: str | None = None,
+        limit: int = 100,
+    ) -> VehiclePage:
+        """Lists the vehicles inside the rectangle, bounds included."""
+        _check_limit(limit)
+        return self._page_matches(self._matches_in_box(box, after), limit)
+
+    def page_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_meters: float,
+        after: str | None = None,
+        limit: int = 100,
+    ) -> VehiclePage:
+        """
+        Lists the vehicles at most radius_meters away from the point, using
+        the flat-earth distance of the motion model.
+        """
+        _check_limit(limit)
+        if radius_meters < 0:
+            raise ValueError("radius_meters must not be negative.")
+
+        meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        delta_latitude = radius_meters / meters_per_degree
+        cos_latitude = math.cos(math.radians(latitude))
+        delta_longitude = (
+            180.0
+            if cos_latitude <= 1e-9
+            else min(180.0, radius_meters / (meters_per_degree * cos_latitude))
+        )
+        box = BoundingBox(
+            max(-90.0, latitude - delta_latitude),
+            max(-180.0, longitude - delta_longitude),
+            min(90.0, latitude + delta_latitude),
+            min(180.0, longitude + delta_longitude),
+        )
+        matches = (
+            (cell, vehicle_id)
+            for cell, vehicle_id in self._matches_in_box(box, after)
+            if ground_distance_meters(
+                latitude, longitude, *self._positions.position_of(vehicle_id)
+            ) <= radius_meters
+        )
+
+        return self._page_matches(matches, limit)
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        self._ids_by_state[old_state].discard(vehicle.vehicle_id)
+        self._ids_by_state[new_state].add(vehicle.vehicle_id)
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        self._positions.insert(
+            vehicle.vehicle_id,
+            vehicle.coordinates.latitude,
+            vehicle.coordinates.longitude
+        )
+
+    def _matches_in_box(
+        self,
+        box: BoundingBox,
+        after: str | None,
+    ) -> Iterator[tuple[CellKey, str]]:
+        after_cell: CellKey | None = None
+        after_id = ""
+
+        if after is not None:
+            after_cell, after_id = _parse_spatial_cursor(after)
+
+        # Resumes at the cursor's cell rather than listing every cell again.
+        for cell in self._positions.occupied_cells_in_box(box, after_cell):
+            for vehicle_id in sorted(self._positions.keys_in_cell(cell)):
+                if cell == after_cell and vehicle_id <= after_id:
+                    continue
+                if box.contains(*self._positions.position_of(vehicle_id)):
+                    yield cell, vehicle_id
+
+    def _page_matches(
+        self,
+        matches: Iterator[tuple[CellKey, str]],
+        limit: int,
+    ) -> VehiclePage:
+        # One extra match tells whether another page follows.
+        found = list(islice(matches, limit + 1))
+        page = found[:limit]
+        next_cursor = None
+
+        if len(found) > limit:
+            (row, column), vehicle_id = page[-1]
+            next_cursor = f"{row}:{column}:{vehicle_id}"
+
+        return VehiclePage(
+            [self._fleet.get(vehicle_id) for _, vehicle_id in page], next_cursor
+        )
+
+
+def _check_limit(limit: int) -> None:
+    if limit <= 0:
+        raise ValueError("limit must be positive.")
+
+
+def _parse_spatial_cursor(cursor: str) -> tuple[CellKey, str]:
+    try:
+        row, column, vehicle_id = cursor.split(":", 2)
+        return (int(row), int(column)), vehicle_id
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}.") from None
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Iterable, Iterator
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+PAGE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class VehicleSnapshot:
+    """An immutable copy of a vehicle's observable state and counters."""
+    vehicle_id: str
+    coordinates: Coordinates
+    velocity: Velocity
+    heading: Heading
+    state: VehicleState
+    odometer_meters: float = 0.0
+    driving_seconds: float = 0.0
+    idle_seconds: float = 0.0
+
+    @classmethod
+    def of(cls, vehicle: Vehicle) -> VehicleSnapshot:
+        return cls(
+            vehicle.vehicle_id,
+            vehicle.coordinates,
+            vehicle.velocity,
+            vehicle.heading,
+            vehicle.state,
+            vehicle.odometer_meters,
+            vehicle.driving_seconds,
+            vehicle.idle_seconds
+        )
+
+
+class FleetSnapshot:
+    """
+    An immutable, versioned view of the whole fleet.
+    Rows are stored in fixed-size pages; a new version only copies the pages
+    holding modified rows and shares every other page with its predecessor.
+    """
+    __slots__ = ("_version", "_slots", "_pages", "_size")
+
+    def __init__(
+        self,
+        version: int,
+        slots: dict[str, int],
+        pages: tuple[tuple[VehicleSnapshot | None, ...], ...],
+    ) -> None:
+        self._version = version
+        self._slots = slots
+        self._pages = pages
+        self._size = len(slots)
+
+    @classmethod
+    def empty(cls) -> FleetSnapshot:
+        return cls(0, {}, ())
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, vehicle_id: object) -> bool:
+        return vehicle_id in self._slots
+
+    def __iter__(self) -> Iterator[VehicleSnapshot]:
+        for page in self._pages:
+            for row in page:
+                if row is not None:
+                    yield row
+
+    def get(self, vehicle_id: str) -> VehicleSnapshot:
+        slot = self._slots.get(vehicle_id)
+
+        if slot is None:
+            raise VehicleNotFoundError(vehicle_id)
+
+        row = self._pages[slot // PAGE_SIZE][slot % PAGE_SIZE]
+        assert row is not None
+        return row
+
+
+class FleetSnapshotStore:
+    """
+    Publishes fleet snapshots from a single writer to any number of readers.
+    Readers take store.current without locking: publishing builds the next
+    snapshot aside and swaps a single reference, so a snapshot a reader holds
+    is never modified while the writer advances.
+    """
+    def __init__(self) -> None:
+        self._current = FleetSnapshot.empty()
+        self._free_slots: list[int] = []
+        self._slot_count = 0
+        self._write_lock = threading.Lock()
+
+    @property
+    def current(self) -> FleetSnapshot:
+        return self._current
+
+    def publish(
+        self,
+        changed: Iterable[Vehicle] = (),
+        removed: Iterable[str] = (),
+    ) -> FleetSnapshot:
+        """
+        Publishes a new version with the given vehicles updated or added and
+        the given ids removed. Rows equal to the published ones are skipped,
+        so passing unchanged vehicles does not copy their pages.
+        """
+        with self._write_lock:
+            previous = self._current
+            slots = previous._slots
+            pages = list(previous._pages)
+            dirty: dict[int, list[VehicleSnapshot | None]] = {}
+            slots_copied = False
+
+            def writable_page(page_index: int) -> list[VehicleSnapshot | None]:
+                page = dirty.get(page_index)
+                if page is None:
+                    if page_index < len(pages):
+                        page = list(pages[page_index])
+                    else:
+                        pages.append(())
+                        page = [None] * PAGE_SIZE
+                    dirty[page_index] = page
+                return page
+
+            for vehicle_id in removed:
+                slot = slots.get(vehicle_id)
+                if slot is None:
+                    continue
+                if not slots_copied:
+                    slots = dict(slots)
+                    slots_copied = True
+                del slots[vehicle_id]
+                writable_page(slot // PAGE_SIZE)[slot % PAGE_SIZE] = None
+                self._free_slots.append(slot)
+
+            for vehicle in changed:
+                row = VehicleSnapshot.of(vehicle)
+                slot = slots.get(row.vehicle_id)
+
+                if slot is None:
+                    if not slots_copied:
+                        slots = dict(slots)
+                        slots_copied = True
+                    slot = self._allocate_slot()
+                    slots[row.vehicle_id] = slot
+                else:
+                    page = dirty.get(slot // PAGE_SIZE) or pages[slot // PAGE_SIZE]
+                    if page[slot % PAGE_SIZE] == row:
+                        continue
+
+                writable_page(slot // PAGE_SIZE)[slot % PAGE_SIZE] = row
+
+            for page_index, page in dirty.items():
+                pages[page_index] = tuple(page)
+
+            self._current = FleetSnapshot(
+                previous.version + 1, slots, tuple(pages)
+            )
+            return self._current
+
+    def publish_fleet(self, fleet: Fleet) -> FleetSnapshot:
+        """
+        Publishes the fleet as a whole, detecting changed and removed vehicles
+        by comparing against the current snapshot.
+        """
+        removed = [
+            vehicle_id
+            for vehicle_id in self._current._slots
+            if vehicle_id not in fleet
+        ]
+        return self.publish(fleet, removed)
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        self._slot_count += 1
+        return self._slot_count - 1
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Sequence
+
+from ground_vehicles_system.domain.common.motion import latitude_rate, longitude_rate
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class FleetStateEstimator:
+    """
+    Smooths sparse GPS fixes with a per-vehicle Kalman filter.
+
+    Between fixes each vehicle is dead-reckoned with the same motion model as
+    Vehicle.move, using the speed and course of its last fix. A new fix is
+    fused with the prediction instead of teleporting the vehicle, weighting
+    each by its uncertainty. Latitude and longitude are filtered as two
+    independent axes whose variances are tracked in square meters.
+
+    The state of the whole fleet lives in parallel columns, so predict and
+    update each run as a single pass over arrays.
+    """
+    def __init__(
+        self,
+        measurement_noise_meters: float = 5.0,
+        process_noise_m2_per_second: float = 1.0,
+    ) -> None:
+        if measurement_noise_meters <= 0:
+            raise ValueError("measurement_noise_meters must be positive.")
+        if process_noise_m2_per_second < 0:
+            raise ValueError("process_noise_m2_per_second must not be negative.")
+
+        self._measurement_variance = measurement_noise_meters ** 2
+        self._process_noise = process_noise_m2_per_second
+        self._rows: dict[str, int] = {}
+        self._vehicle_ids: list[str] = []
+        self._latitudes = array('d')
+        self._longitudes = array('d')
+        self._latitude_variances = array('d')
+        self._longitude_variances = array('d')
+        self._speeds_mps = array('d')
+        self._headings_radians = array('d')
+
+    def __len__(self) -> int:
+        return len(self._vehicle_ids)
+
+    def __contains__(self, vehicle_id: object) -> bool:
+        return vehicle_id in self._rows
+
+    def estimate(self, vehicle_id: str) -> tuple[float, float]:
+        """Returns the current (latitude, longitude) estimate of a vehicle."""
+        row = self._rows[vehicle_id]
+        return self._latitudes[row], self._longitudes[row]
+
+    def uncertainty_meters(self, vehicle_id: str) -> float:
+        """Returns the standard deviation of the position estimate."""
+        row = self._rows[vehicle_id]
+        return math.sqrt(
+            (self._latitude_variances[row] + self._longitude_variances[row]) / 2
+        )
+
+    def predict(self, time_delta_seconds: float) -> None:
+        """Advances every estimate by dead reckoning and grows its variance."""
+        latitudes = self._latitudes
+        longitudes = self._longitudes
+        speeds = self._speeds_mps
+        headings = self._headings_radians
+        latitude_variances = self._latitude_variances
+        longitude_variances = self._longitude_variances
+        added_variance = self._process_noise * time_delta_seconds
+
+        for row in range(len(latitudes)):
+            speed = speeds[row]
+
+            if speed != 0.0:
+                heading = headings[row]
+                latitude = latitudes[row]
+                latitudes[row] = latitude + (
+                    latitude_rate(speed, math.cos(heading)) * time_delta_seconds
+                )
+                longitudes[row] += (
+                    longitude_rate(speed, math.sin(heading), latitude)
+                    * time_delta_seconds
+                )
+
+            latitude_variances[row] += added_variance
+            longitude_variances[row] += added_variance
+
+    def update(
+        self,
+        vehicle_ids: Sequence[str],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        speeds_mps: Sequence[float],
+        courses_degrees: Sequence[float],
+    ) -> None:
+        """
+        Fuses a batch of fixes given as parallel columns.
+        Vehicles seen for the first time start at their fix.
+        """
+        if not (
+            len(vehicle_ids)
+            == len(latitudes)
+            == len(longitudes)
+            == len(speeds_mps)
+            == len(courses_degrees)
+        ):
+            raise ValueError("Fix columns must have the same length.")
+
+        measurement_variance = self._measurement_variance
+
+        for index, vehicle_id in enumerate(vehicle_ids):
+            row = self._rows.get(vehicle_id)
+
+            if row is None:
+                self._append(
+                    vehicle_id,
+                    latitudes[index],
+                    longitudes[index],
+                    speeds_mps[index],
+                    courses_degrees[index]
+                )
+                continue
+
+            variance = self._latitude_variances[row]
+            gain = variance / (variance + measurement_variance)
+            self._latitudes[row] += gain * (latitudes[index] - self._latitudes[row])
+            self._latitude_variances[row] = (1 - gain) * variance
+
+            variance = self._longitude_variances[row]
+            gain = variance / (variance + measurement_variance)
+            self._longitudes[row] += gain * (
+                longitudes[index] - self._longitudes[row]
+            )
+            self._longitude_variances[row] = (1 - gain) * variance
+
+            self._speeds_mps[row] = speeds_mps[index]
+            self._headings_radians[row] = math.radians(courses_degrees[index])
+
+    def apply(self, fleet: Fleet) -> None:
+        """Writes the estimates into the matching fleet vehicles."""
+        for vehicle_id, row in self._rows.items():
+            vehicle = fleet.find(vehicle_id)
+
+            if vehicle is None:
+                continue
+
+            latitude = min(90.0, max(-90.0, self._latitudes[row]))
+            longitude = (self._longitudes[row] + 180.0) % 360.0 - 180.0
+            vehicle.update_from_telemetry(
+                Coordinates.from_validated(latitude, longitude),
+                Velocity(self._speeds_mps[row]),
+                Heading(math.degrees(self._headings_radians[row]) % 360)
+            )
+
+    def forget(self, vehicle_id: str) -> None:
+        """Stops tracking a vehicle, moving the last row into its place."""
+        row = self._rows.pop(vehicle_id)
+        last = len(self._vehicle_ids) - 1
+
+        for column in (
+            self._latitudes,
+            self._longitudes,
+            self._latitude_variances,
+            self._longitude_variances,
+            self._speeds_mps,
+            self._headings_radians,
+        ):
+            column[row] = column[last]
+            column.pop()
+
+        moved_id = self._vehicle_ids.pop()
+        if row != last:
+            self._vehicle_ids[row] = moved_id
+            self._rows[moved_id] = row
+
+    def _append(
+        self,
+        vehicle_id: str,
+        latitude: float,
+        longitude: float,
+        speed_mps: float,
+        course_degrees: float
+    ) -> None:
+        self._rows[vehicle_id] = len(self._vehicle_ids)
+        self._vehicle_ids.append(vehicle_id)
+        self._latitudes.append(latitude)
+        self._longitudes.append(longitude)
+        self._latitude_variances.append(self._measurement_variance)
+        self._longitude_variances.append(self._measurement_variance)
+        self._speeds_mps.append(speed_mps)
+        self._headings_radians.append(math.radians(course_degrees))
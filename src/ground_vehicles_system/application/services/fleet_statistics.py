@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from typing import Callable, Iterable
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+
+
+class SlidingWindowSum:
+    """
+    Sum of the values added during the last window_seconds.
+
+    The window is split into fixed buckets kept in a ring, so adding and
+    reading are constant-time; values leave the window one bucket at a time,
+    which makes the window up to one bucket longer than requested.
+    """
+    def __init__(
+        self,
+        window_seconds: float,
+        buckets: int = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive.")
+        if buckets <= 0:
+            raise ValueError("buckets must be positive.")
+
+        self._bucket_seconds = window_seconds / buckets
+        self._buckets = [0.0] * buckets
+        self._clock = clock
+        self._current = math.floor(clock() / self._bucket_seconds)
+        self._total = 0.0
+
+    def add(self, value: float) -> None:
+        self._advance()
+        self._buckets[self._current % len(self._buckets)] += value
+        self._total += value
+
+    def total(self) -> float:
+        self._advance()
+        return self._total
+
+    def _advance(self) -> None:
+        bucket = math.floor(self._clock() / self._bucket_seconds)
+
+        if bucket <= self._current:
+            return
+
+        buckets = self._buckets
+        expired = min(bucket - self._current, len(buckets))
+
+        for offset in range(1, expired + 1):
+            index = (self._current + offset) % len(buckets)
+            self._total -= buckets[index]
+            buckets[index] = 0.0
+
+        if expired == len(buckets):
+            # Avoids carrying rounding residue once the whole window is empty.
+            self._total = 0.0
+        self._current = bucket
+
+
+class FleetStatistics(VehicleObserver):
+    """
+    Dashboard aggregates kept up to date by observing the tracked vehicles.
+
+    Every change notified by a vehicle updates the aggregates in constant
+    (amortized logarithmic for the max speed) time, so reading them never
+    iterates over the fleet. Windowed figures cover the last window_seconds.
+
+    Vehicles stepped or commanded on different threads notify the same
+    statistics concurrently, so updates and reads are serialized by a lock.
+    """
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._speeds_mps: dict[str, float] = {}
+        self._state_counts = {state: 0 for state in VehicleState}
+        self._speed_sum = 0.0
+        # Max-heap of (-speed, vehicle_id); entries whose speed is no longer
+        # the vehicle's current one are dropped when they reach the top.
+        self._speed_heap: list[tuple[float, str]] = []
+        self._total_distance_meters = 0.0
+        self._recent_distance = SlidingWindowSum(window_seconds, clock=clock)
+        self._recent_entries = {
+            state: SlidingWindowSum(window_seconds, clock=clock)
+            for state in VehicleState
+        }
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls,
+        vehicles: Iterable[Vehicle],
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> FleetStatistics:
+        """Factory method creating statistics that track the given vehicles."""
+        statistics = cls(window_seconds, clock)
+
+        for vehicle in vehicles:
+            statistics.track(vehicle)
+
+        return statistics
+
+    def __len__(self) -> int:
+        return len(self._speeds_mps)
+
+    def __contains__(self, vehicle_id: object) -> bool:
+        return vehicle_id in self._speeds_mps
+
+    def track(self, vehicle: Vehicle) -> None:
+        """Starts observing a vehicle and adds it to the aggregates."""
+        with self._lock:
+            if vehicle.vehicle_id in self._speeds_mps:
+                return
+
+            speed = vehicle.velocity.to_mps()
+            self._speeds_mps[vehicle.vehicle_id] = speed
+            self._state_counts[vehicle.state] += 1
+            self._speed_sum += speed
+            heapq.heappush(self._speed_heap, (-speed, vehicle.vehicle_id))
+            vehicle.add_observer(self)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        """Stops observing a vehicle and removes it from the aggregates."""
+        with self._lock:
+            speed = self._speeds_mps.pop(vehicle.vehicle_id)
+            self._state_counts[vehicle.state] -= 1
+            self._speed_sum -= speed
+            vehicle.remove_observer(self)
+            self._discard_stale_speeds()
+
+    def count(self, state: VehicleState) -> int:
+        return self._state_counts[state]
+
+    def counts(self) -> dict[VehicleState, int]:
+        with self._lock:
+            return dict(self._state_counts)
+
+    def mean_speed_mps(self) -> float:
+        with self._lock:
+            if not self._speeds_mps:
+                return 0.0
+            return max(0.0, self._speed_sum / len(self._speeds_mps))
+
+    def max_speed_mps(self) -> float:
+        with self._lock:
+            if not self._speed_heap:
+                return 0.0
+            return -self._speed_heap[0][0]
+
+    def total_distance_meters(self) -> float:
+        """Distance driven by the tracked vehicles since they were tracked."""
+        return self._total_distance_meters
+
+    def recent_distance_meters(self) -> float:
+        """Distance driven by the tracked vehicles during the window."""
+        with self._lock:
+            return self._recent_distance.total()
+
+    def recent_entries(self, state: VehicleState) -> int:
+        """How many times a tracked vehicle entered the state during the window."""
+        with self._lock:
+            return round(self._recent_entries[state].total())
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        with self._lock:
+            self._state_counts[old_state] -= 1
+            self._state_counts[new_state] += 1
+            self._recent_entries[new_state].add(1)
+
+    def on_velocity_changed(
+        self,
+        vehicle: Vehicle,
+        old_mps: float,
+        new_mps: float
+    ) -> None:
+        with self._lock:
+            self._speeds_mps[vehicle.vehicle_id] = new_mps
+            self._speed_sum += new_mps - old_mps
+            heapq.heappush(self._speed_heap, (-new_mps, vehicle.vehicle_id))
+            self._discard_stale_speeds()
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        if distance_meters:
+            with self._lock:
+                self._total_distance_meters += distance_meters
+                self._recent_distance.add(distance_meters)
+
+    def _discard_stale_speeds(self) -> None:
+        heap = self._speed_heap
+        speeds = self._speeds_mps
+
+        while heap and speeds.get(heap[0][1]) != -heap[0][0]:
+            heapq.heappop(heap)
+
+        if len(heap) > 2 * len(speeds) + 64:
+            self._speed_heap = [
+                (-speed, vehicle_id) for vehicle_id, speed in speeds.items()
+            ]
+            heapq.heapify(self._speed_heap)
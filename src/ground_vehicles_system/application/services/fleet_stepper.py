@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import os
+import sys
+from typing import Callable, Mapping, Sequence
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import (
+    CommandOutcome,
+    Vehicle,
+    VehicleState
+)
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.errors.vehicle_errors import (
+    CannotChangeVelocityOfAccidentedVehicle
+)
+
+VehicleCommand = Callable[[Vehicle], None]
+ObstacleSensor = Callable[[Vehicle], tuple[bool, bool]]
+
+
+def _no_obstacles(vehicle: Vehicle) -> tuple[bool, bool]:
+    return False, False
+
+
+def free_threading_enabled() -> bool:
+    """Returns whether the interpreter runs without the GIL (PEP 703)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class _DeferredNotifications(VehicleObserver):
+    """
+    Stands in for the observers of a chunk's vehicles on a worker thread,
+    recording their notifications so they can be replayed on another thread.
+    """
+    def __init__(self) -> None:
+        self._observers: dict[str, tuple[VehicleObserver, ...]] = {}
+        self._calls: list[tuple[Vehicle, str, tuple[object, ...]]] = []
+
+    def capture(self, vehicle: Vehicle) -> None:
+        observers = vehicle.replace_observers((self,))
+        if observers:
+            self._observers[vehicle.vehicle_id] = observers
+        else:
+            vehicle.replace_observers(())
+
+    def release(self, vehicle: Vehicle) -> None:
+        observers = self._observers.get(vehicle.vehicle_id)
+        if observers is not None:
+            vehicle.replace_observers(observers)
+
+    def replay(self) -> None:
+        for vehicle, callback, arguments in self._calls:
+            for observer in self._observers[vehicle.vehicle_id]:
+                getattr(observer, callback)(vehicle, *arguments)
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        self._calls.append((vehicle, "on_state_changed", (old_state, new_state)))
+
+    def on_velocity_changed(
+        self,
+        vehicle: Vehicle,
+        old_mps: float,
+        new_mps: float
+    ) -> None:
+        self._calls.append((vehicle, "on_velocity_changed", (old_mps, new_mps)))
+
+    def on_turned(
+        self,
+        vehicle: Vehicle,
+        old_degrees: float,
+        new_degrees: float
+    ) -> None:
+        self._calls.append((vehicle, "on_turned", (old_degrees, new_degrees)))
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        self._calls.append((vehicle, "on_moved", (distance_meters,)))
+
+
+@dataclass(frozen=True)
+class StepReport:
+    """Outcome of one fleet tick."""
+    crashed: tuple[str, ...]
+    rejected_commands: tuple[str, ...]
+
+
+class ThreadPoolFleetStepper:
+    """
+    Advances every vehicle of a fleet by one tick on a pool of threads.
+    The fleet is split into disjoint chunks, one per worker, so each vehicle
+    is only ever touched by a single thread. The fleet itself must not gain
+    or lose vehicles while a step is running.
+
+    Observers are usually shared by many vehicles, so with several workers
+    their notifications are recorded per chunk and replayed on the calling
+    thread once every chunk is done, in fleet order. Observers therefore
+    never run concurrently, but they see each vehicle as it is at the end of
+    the tick.
+
+    On free-threaded interpreters the default is one worker per CPU. With the
+    GIL threads can't step vehicles in parallel, so the default falls back to
+    stepping inline on the calling thread.
+    """
+    def __init__(
+        self,
+        fleet: Fleet,
+        workers: int | None = None,
+        obstacle_sensor: ObstacleSensor = _no_obstacles,
+    ) -> None:
+        if workers is None:
+            workers = (os.cpu_count() or 1) if free_threading_enabled() else 1
+        if workers <= 0:
+            raise ValueError("workers must be positive.")
+
+        self._fleet = fleet
+        self._workers = workers
+        self._obstacle_sensor = obstacle_sensor
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        )
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def __enter__(self) -> ThreadPoolFleetStepper:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def step(
+        self,
+        time_delta_seconds: float,
+        commands: Mapping[str, Sequence[VehicleCommand]] | None = None,
+    ) -> StepReport:
+        """
+        Applies the pending commands of each vehicle, then moves it.
+        Commands rejected because the vehicle is accidented and vehicles that
+        crash while moving are reported instead of aborting the tick. Any
+        other error is re-raised once the vehicles that did move have been
+        notified.
+        """
+        commands = commands if commands is not None else {}
+        vehicles = list(self._fleet)
+
+        if self._executor is None or len(vehicles) < 2:
+            results = [
+                self._step_chunk(vehicles, time_delta_seconds, commands, None)
+            ]
+        else:
+            chunk_size = -(-len(vehicles) // self._workers)
+            deferred = [
+                _DeferredNotifications()
+                for _ in range(0, len(vehicles), chunk_size)
+            ]
+            futures = [
+                self._executor.submit(
+                    self._step_chunk,
+                    vehicles[start:start + chunk_size],
+                    time_delta_seconds,
+                    commands,
+                    notifications
+                )
+                for start, notifications in zip(
+                    range(0, len(vehicles), chunk_size), deferred
+                )
+            ]
+            wait(futures)
+
+            for notifications in deferred:
+                notifications.replay()
+
+            # Collected only after the replay, so a failing chunk is re-raised
+            # once observers have heard about every vehicle that did move.
+            results = [future.result() for future in futures]
+
+        crashed: list[str] = []
+        rejected: list[str] = []
+
+        for chunk_crashed, chunk_rejected in results:
+            crashed.extend(chunk_crashed)
+            rejected.extend(chunk_rejected)
+
+        return StepReport(tuple(crashed), tuple(rejected))
+
+    def _step_chunk(
+        self,
+        vehicles: list[Vehicle],
+        time_delta_seconds: float,
+        commands: Mapping[str, Sequence[VehicleCommand]],
+        deferred: _DeferredNotifications | None,
+    ) -> tuple[list[str], list[str]]:
+        crashed: list[str] = []
+        rejected: list[str] = []
+
+        for vehicle in vehicles:
+            if deferred is None:
+                self._step_vehicle(
+                    vehicle, time_delta_seconds, commands, crashed, rejected
+                )
+                continue
+
+            deferred.capture(vehicle)
+            try:
+                self._step_vehicle(
+                    vehicle, time_delta_seconds, commands, crashed, rejected
+                )
+            finally:
+                deferred.release(vehicle)
+
+        return crashed, rejected
+
+    def _step_vehicle(
+        self,
+        vehicle: Vehicle,
+        time_delta_seconds: float,
+        commands: Mapping[str, Sequence[VehicleCommand]],
+        crashed: list[str],
+        rejected: list[str],
+    ) -> None:
+        for command in commands.get(vehicle.vehicle_id, ()):
+            try:
+                command(vehicle)
+            except CannotChangeVelocityOfAccidentedVehicle:
+                rejected.append(vehicle.vehicle_id)
+
+        obstacle_found, will_hit_obstacle = self._obstacle_sensor(vehicle)
+
+        outcome = vehicle.try_move(
+            time_delta_seconds, obstacle_found, will_hit_obstacle
+        )
+        if outcome is CommandOutcome.CRASHED:
+            crashed.append(vehicle.vehicle_id)
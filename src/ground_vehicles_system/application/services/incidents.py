@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from itertools import count
+import time
+from typing import Callable
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.errors.incident_errors import (
+    IncidentNotFoundError,
+    InvalidIncidentTransitionError
+)
+from ground_vehicles_system.domain.services.spatial_index import PointGridIndex
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+
+class IncidentStatus(StrEnum):
+    """Enumeration for the steps of handling a crash."""
+    OPEN = "open"
+    TOWING = "towing"
+    RESOLVED = "resolved"
+
+
+@dataclass(frozen=True)
+class Incident:
+    """
+    A crash, with where and how fast the vehicle was going at impact.
+    previous_incident_id links to the vehicle's earlier incident when it was
+    still unresolved at the time of this crash.
+    """
+    incident_id: int
+    vehicle_id: str
+    occurred_at: float
+    latitude: float
+    longitude: float
+    speed_mps: float
+    heading_degrees: float
+    status: IncidentStatus = IncidentStatus.OPEN
+    resolved_at: float | None = None
+    previous_incident_id: int | None = None
+
+
+class IncidentStore(VehicleObserver):
+    """
+    Records an incident whenever an observed vehicle becomes accidented.
+
+    Incidents are indexed by time, in a sorted list, and by position, in a
+    point grid. Area queries limited to a time window start from whichever
+    index yields fewer candidates, so "incidents in this area in the last
+    hour" stays cheap both for busy areas and for long histories.
+
+    The recovery workflow moves an incident from OPEN to TOWING and then to
+    RESOLVED, which recovers the vehicle. A vehicle has at most one
+    unresolved incident: crashing again, after being recovered outside the
+    workflow, resolves the earlier one and links it from the new one.
+    """
+    def __init__(
+        self,
+        fleet: Fleet | None = None,
+        cell_size_degrees: float = 0.01,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._incidents: dict[int, Incident] = {}
+        self._by_time: list[tuple[float, int]] = []
+        self._positions: PointGridIndex[int] = PointGridIndex(cell_size_degrees)
+        self._open: dict[str, int] = {}
+        self._vehicles: dict[str, Vehicle] = {}
+        self._ids = count(1)
+
+        for vehicle in fleet or ():
+            self.track(vehicle)
+
+    def __len__(self) -> int:
+        return len(self._incidents)
+
+    def track(self, vehicle: Vehicle) -> None:
+        if vehicle.vehicle_id in self._vehicles:
+            return
+
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        vehicle.add_observer(self)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        del self._vehicles[vehicle.vehicle_id]
+        vehicle.remove_observer(self)
+
+    def get(self, incident_id: int) -> Incident:
+        incident = self._incidents.get(incident_id)
+        if incident is None:
+            raise IncidentNotFoundError(incident_id)
+
+        return incident
+
+    def open_incident_of(self, vehicle_id: str) -> Incident | None:
+        """Returns the vehicle's unresolved incident, if any."""
+        incident_id = self._open.get(vehicle_id)
+        return None if incident_id is None else self._incidents[incident_id]
+
+    def record(self, vehicle: Vehicle) -> Incident:
+        """
+        Records a crash of the vehicle at its current position and speed.
+        An incident of the vehicle still unresolved is resolved, without
+        recovering the vehicle, and linked from the new one.
+        """
+        coordinates = vehicle.coordinates
+        occurred_at = self._clock()
+        previous_id = self._open.get(vehicle.vehicle_id)
+
+        if previous_id is not None:
+            self._update(replace(
+                self._incidents[previous_id],
+                status=IncidentStatus.RESOLVED,
+                resolved_at=occurred_at,
+            ))
+
+        incident = Incident(
+            next(self._ids),
+            vehicle.vehicle_id,
+            occurred_at,
+            coordinates.latitude,
+            coordinates.longitude,
+            vehicle.velocity.to_mps(),
+            vehicle.heading.degrees,
+            previous_incident_id=previous_id,
+        )
+        incident_id = incident.incident_id
+        self._incidents[incident_id] = incident
+        insort(self._by_time, (incident.occurred_at, incident_id))
+        self._positions.insert(incident_id, incident.latitude, incident.longitude)
+        self._open[vehicle.vehicle_id] = incident_id
+        return incident
+
+    def dispatch_tow(self, incident_id: int) -> Incident:
+        """Marks an open incident as having a tow truck on the way."""
+        incident = self.get(incident_id)
+        if incident.status is not IncidentStatus.OPEN:
+            raise InvalidIncidentTransitionError(incident_id, IncidentStatus.TOWING)
+
+        return self._update(replace(incident, status=IncidentStatus.TOWING))
+
+    def resolve(self, incident_id: int) -> Incident:
+        """
+        Closes the incident and recovers its vehicle, when the vehicle is
+        tracked and still accidented.
+        """
+        incident = self.get(incident_id)
+        if incident.status is IncidentStatus.RESOLVED:
+            raise InvalidIncidentTransitionError(incident_id, IncidentStatus.RESOLVED)
+
+        resolved = self._update(replace(
+            incident, status=IncidentStatus.RESOLVED, resolved_at=self._clock()
+        ))
+        if self._open.get(incident.vehicle_id) == incident_id:
+            del self._open[incident.vehicle_id]
+
+        vehicle = self._vehicles.get(incident.vehicle_id)
+        if vehicle is not None and vehicle.state == VehicleState.ACCIDENTED:
+            vehicle.recover()
+
+        return resolved
+
+    def between(self, start: float, end: float) -> list[Incident]:
+        """Returns the incidents that occurred in [start, end], oldest first."""
+        low, high = self._time_range(start, end)
+        return [
+            self._incidents[incident_id]
+            for _, incident_id in self._by_time[low:high]
+        ]
+
+    def in_area(
+        self,
+        box: BoundingBox,
+        start: float = float("-inf"),
+        end: float = float("inf"),
+    ) -> list[Incident]:
+        """Returns the incidents inside the box and in [start, end], oldest first."""
+        low, high = self._time_range(start, end)
+        in_window = high - low
+        cells = self._positions.cells_in_box(box)
+        in_cells = 0
+
+        for cell in cells:
+            in_cells += len(self._positions.keys_in_cell(cell))
+            if in_cells > in_window:
+                break
+
+        if in_cells > in_window:
+            candidates = [
+                self._incidents[incident_id]
+                for _, incident_id in self._by_time[low:high]
+            ]
+        else:
+            candidates = sorted(
+                (
+                    self._incidents[incident_id]
+                    for cell in cells
+                    for incident_id in self._positions.keys_in_cell(cell)
+                ),
+                key=lambda incident: (incident.occurred_at, incident.incident_id),
+            )
+
+        return [
+            incident
+            for incident in candidates
+            if start <= incident.occurred_at <= end
+            and box.contains(incident.latitude, incident.longitude)
+        ]
+
+    def recent_in_area(self, box: BoundingBox, window_seconds: float) -> list[Incident]:
+        """Returns the incidents inside the box in the last window_seconds."""
+        now = self._clock()
+        return self.in_area(box, now - window_seconds, now)
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        if new_state == VehicleState.ACCIDENTED:
+            self.record(vehicle)
+
+    def _update(self, incident: Incident) -> Incident:
+        self._incidents[incident.incident_id] = incident
+        return incident
+
+    def _time_range(self, start: float, end: float) -> tuple[int, int]:
+        low = bisect_left(self._by_time, (start, 0))
+        high = bisect_right(self._by_time, (end, float("inf")))
+        return low, high
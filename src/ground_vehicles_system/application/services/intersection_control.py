@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+import math
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.common.heading_math import (
+    bearing_degrees,
+    signed_difference
+)
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import (
+    CommandOutcome,
+    Vehicle,
+    VehicleState
+)
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.errors.junction_errors import (
+    DuplicateJunctionError,
+    JunctionNotFoundError
+)
+from ground_vehicles_system.domain.services.spatial_index import (
+    BoxGridIndex,
+    PointGridIndex
+)
+from ground_vehicles_system.domain.services.timer_wheel import TimerWheel
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.velocity import VelocityUnit
+
+# A vehicle is on an approach when the junction is within this many degrees
+# of its heading.
+APPROACH_HALF_ANGLE_DEGREES = 45.0
+
+# Vehicles the controller neither brakes nor releases.
+_IGNORED_STATES = frozenset((VehicleState.PARKING, VehicleState.ACCIDENTED))
+
+
+class JunctionControl(StrEnum):
+    """Enumeration for how a junction assigns the right of way."""
+    SIGNAL = "signal"
+    STOP_SIGN = "stop_sign"
+
+
+class SignalPhase(StrEnum):
+    """Enumeration for the axis a traffic light currently lets through."""
+    NORTH_SOUTH = "north_south"
+    EAST_WEST = "east_west"
+
+
+@dataclass(frozen=True)
+class Junction:
+    """
+    An intersection controlled by a traffic light or by stop signs.
+    Vehicles within approach_meters and heading towards it are on one of its
+    approaches. Signals alternate green between the axes every green_seconds.
+    """
+    junction_id: str
+    latitude: float
+    longitude: float
+    control: JunctionControl = JunctionControl.SIGNAL
+    approach_meters: float = 50.0
+    green_seconds: float = 30.0
+
+    def __post_init__(self):
+        if self.approach_meters <= 0:
+            raise ValueError("approach_meters must be positive.")
+        if self.green_seconds <= 0:
+            raise ValueError("green_seconds must be positive.")
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        latitude_span = self.approach_meters / meters_per_degree
+        # Near the poles the span would cover the globe many times over,
+        # so it is clamped, like the bounds, to valid coordinates.
+        longitude_span = min(
+            latitude_span / max(math.cos(math.radians(self.latitude)), 1e-9),
+            180.0,
+        )
+        return BoundingBox(
+            max(self.latitude - latitude_span, -90.0),
+            max(self.longitude - longitude_span, -180.0),
+            min(self.latitude + latitude_span, 90.0),
+            min(self.longitude + longitude_span, 180.0),
+        )
+
+
+@dataclass(frozen=True)
+class RightOfWayDecisions:
+    """Vehicles that must brake to a stop and stopped vehicles that may go."""
+    brake: list[str] = field(default_factory=list)
+    go: list[str] = field(default_factory=list)
+
+
+def axis_of(heading_degrees: float) -> SignalPhase:
+    """Returns the signal axis a vehicle driving at the heading travels on."""
+    if (
+        abs(signed_difference(0.0, heading_degrees)) <= 45.0
+        or abs(signed_difference(180.0, heading_degrees)) <= 45.0
+    ):
+        return SignalPhase.NORTH_SOUTH
+    return SignalPhase.EAST_WEST
+
+
+class IntersectionController(VehicleObserver):
+    """
+    Decides which vehicles must stop at junctions and which may go.
+
+    Junctions are registered in a grid index and every junction keeps the
+    vehicles on its approaches in arrival order. Both are maintained from
+    the vehicles' movements, so a tick only looks at junctions with
+    vehicles waiting instead of testing every vehicle against every
+    junction. Signal phases flip on a timer wheel.
+
+    At a signal, moving vehicles facing red brake and stopped vehicles
+    facing green go. At stop signs every vehicle stops first, then the
+    earliest arrival among the stopped ones goes once the previous vehicle
+    it let through has left the junction. Only vehicles the controller
+    braked itself are released; parked vehicles and ones that stopped on
+    their own are left alone. Vehicles must be changed on the thread that
+    ticks the controller.
+    """
+    def __init__(
+        self,
+        fleet: Fleet,
+        cell_size_degrees: float = 0.01,
+        slot_seconds: float = 0.1,
+        release_speed_mps: float = 5.0,
+    ) -> None:
+        if release_speed_mps <= 0:
+            raise ValueError("release_speed_mps must be positive.")
+
+        self._junctions: dict[str, Junction] = {}
+        self._index: BoxGridIndex[str] = BoxGridIndex(cell_size_degrees)
+        self._positions: PointGridIndex[str] = PointGridIndex(cell_size_degrees)
+        self._phases: dict[str, SignalPhase] = {}
+        self._timers: TimerWheel[str] = TimerWheel(slot_seconds)
+        self._vehicles: dict[str, Vehicle] = {}
+        self._approach_of: dict[str, str] = {}
+        self._approaching: dict[str, dict[str, None]] = {}
+        self._cleared: dict[str, str] = {}
+        self._braked: set[str] = set()
+        self._release_speed_mps = release_speed_mps
+
+        for vehicle in fleet:
+            self.track(vehicle)
+
+    def __len__(self) -> int:
+        return len(self._junctions)
+
+    def add_junction(self, junction: Junction) -> None:
+        """
+        Registers a junction, picking up the vehicles already approaching it.
+        Signals start green on the north-south axis.
+        """
+        junction_id = junction.junction_id
+        if junction_id in self._junctions:
+            raise DuplicateJunctionError(junction_id)
+
+        box = junction.bounding_box
+        self._junctions[junction_id] = junction
+        self._index.insert(junction_id, box)
+
+        if junction.control is JunctionControl.SIGNAL:
+            self._phases[junction_id] = SignalPhase.NORTH_SOUTH
+            self._timers.schedule(junction_id, junction.green_seconds)
+
+        for cell in self._positions.cells_in_box(box):
+            for vehicle_id in list(self._positions.keys_in_cell(cell)):
+                self._changed(self._vehicles[vehicle_id])
+
+    def remove_junction(self, junction_id: str) -> None:
+        if junction_id not in self._junctions:
+            raise JunctionNotFoundError(junction_id)
+
+        del self._junctions[junction_id]
+        self._index.remove(junction_id)
+        self._phases.pop(junction_id, None)
+        self._timers.cancel(junction_id)
+
+        for vehicle_id in self._approaching.pop(junction_id, {}):
+            del self._approach_of[vehicle_id]
+            self._cleared.pop(vehicle_id, None)
+            self._braked.discard(vehicle_id)
+
+    def phase(self, junction_id: str) -> SignalPhase | None:
+        """Returns the green axis of a signal, or None for stop signs."""
+        if junction_id not in self._junctions:
+            raise JunctionNotFoundError(junction_id)
+
+        return self._phases.get(junction_id)
+
+    def approaching(self, junction_id: str) -> list[str]:
+        """Returns the vehicles on the junction's approaches, in arrival order."""
+        if junction_id not in self._junctions:
+            raise JunctionNotFoundError(junction_id)
+
+        return list(self._approaching.get(junction_id, ()))
+
+    def track(self, vehicle: Vehicle) -> None:
+        if vehicle.vehicle_id in self._vehicles:
+            return
+
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        vehicle.add_observer(self)
+        self._changed(vehicle)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        del self._vehicles[vehicle_id]
+        self._positions.remove(vehicle_id)
+        self._leave(vehicle_id)
+        vehicle.remove_observer(self)
+
+    def tick(self, elapsed_seconds: float) -> RightOfWayDecisions:
+        """Advances the signal phases and returns this tick's decisions."""
+        for junction_id in self._timers.advance(elapsed_seconds):
+            junction = self._junctions[junction_id]
+            self._phases[junction_id] = (
+                SignalPhase.EAST_WEST
+                if self._phases[junction_id] is SignalPhase.NORTH_SOUTH
+                else SignalPhase.NORTH_SOUTH
+            )
+            self._timers.schedule(junction_id, junction.green_seconds)
+
+        return self.decide()
+
+    def decide(self) -> RightOfWayDecisions:
+        """Returns the brake and go decisions for every occupied junction."""
+        decisions = RightOfWayDecisions()
+
+        for junction_id, vehicle_ids in self._approaching.items():
+            if junction_id in self._phases:
+                self._decide_signal(junction_id, vehicle_ids, decisions)
+            else:
+                self._decide_stop_sign(junction_id, vehicle_ids, decisions)
+
+        return decisions
+
+    def apply(self, decisions: RightOfWayDecisions) -> list[str]:
+        """
+        Brakes and releases the decided vehicles through the vehicle rules.
+        Returns the ids of accidented vehicles that couldn't be changed.
+        """
+        rejected = []
+
+        for vehicle_id in decisions.brake:
+            outcome = self._vehicles[vehicle_id].try_brake_to_a_stop()
+            if outcome is CommandOutcome.REJECTED:
+                rejected.append(vehicle_id)
+            elif vehicle_id in self._approach_of:
+                self._braked.add(vehicle_id)
+
+        for vehicle_id in decisions.go:
+            junction_id = self._approach_of.get(vehicle_id)
+            if junction_id is not None and junction_id not in self._phases:
+                self._cleared[vehicle_id] = junction_id
+            self._braked.discard(vehicle_id)
+
+            outcome = self._vehicles[vehicle_id].try_accelerate(
+                self._release_speed_mps, VelocityUnit.MPS
+            )
+            if outcome is CommandOutcome.REJECTED:
+                rejected.append(vehicle_id)
+
+        return rejected
+
+    def on_turned(
+        self,
+        vehicle: Vehicle,
+        old_degrees: float,
+        new_degrees: float
+    ) -> None:
+        self._changed(vehicle)
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        self._changed(vehicle)
+
+    def _decide_signal(
+        self,
+        junction_id: str,
+        vehicle_ids: dict[str, None],
+        decisions: RightOfWayDecisions
+    ) -> None:
+        green = self._phases[junction_id]
+
+        for vehicle_id in vehicle_ids:
+            vehicle = self._vehicles[vehicle_id]
+            if vehicle.state in _IGNORED_STATES:
+                continue
+
+            moving = vehicle.velocity.to_mps() > 0.0
+            has_green = axis_of(vehicle.heading.degrees) is green
+
+            if moving and not has_green:
+                decisions.brake.append(vehicle_id)
+            elif not moving and has_green and vehicle_id in self._braked:
+                decisions.go.append(vehicle_id)
+
+    def _decide_stop_sign(
+        self,
+        junction_id: str,
+        vehicle_ids: dict[str, None],
+        decisions: RightOfWayDecisions
+    ) -> None:
+        crossing = False
+        next_to_go = None
+
+        for vehicle_id in vehicle_ids:
+            if self._cleared.get(vehicle_id) == junction_id:
+                crossing = True
+                continue
+
+            vehicle = self._vehicles[vehicle_id]
+            if vehicle.state in _IGNORED_STATES:
+                continue
+
+            if vehicle.velocity.to_mps() > 0.0:
+                decisions.brake.append(vehicle_id)
+            elif next_to_go is None and vehicle_id in self._braked:
+                next_to_go = vehicle_id
+
+        if next_to_go is not None and not crossing:
+            decisions.go.append(next_to_go)
+
+    def _changed(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        latitude = vehicle.coordinates.latitude
+        longitude = vehicle.coordinates.longitude
+        heading = vehicle.heading.degrees
+        self._positions.insert(vehicle_id, latitude, longitude)
+
+        nearest = None
+        nearest_distance = math.inf
+
+        for junction_id in self._index.candidates_at(latitude, longitude):
+            junction = self._junctions[junction_id]
+            distance = ground_distance_meters(
+                latitude, longitude, junction.latitude, junction.longitude
+            )
+            if distance == 0.0 or distance > junction.approach_meters:
+                continue
+            if distance >= nearest_distance:
+                continue
+
+            bearing = bearing_degrees(
+                latitude, longitude, junction.latitude, junction.longitude
+            )
+            if abs(signed_difference(heading, bearing)) < APPROACH_HALF_ANGLE_DEGREES:
+                nearest = junction_id
+                nearest_distance = distance
+
+        previous = self._approach_of.get(vehicle_id)
+        if previous == nearest:
+            return
+
+        self._leave(vehicle_id)
+
+        if nearest is not None:
+            self._approach_of[vehicle_id] = nearest
+            self._approaching.setdefault(nearest, {})[vehicle_id] = None
+
+    def _leave(self, vehicle_id: str) -> None:
+        self._cleared.pop(vehicle_id, None)
+        self._braked.discard(vehicle_id)
+        junction_id = self._approach_of.pop(vehicle_id, None)
+        if junction_id is None:
+            return
+
+        vehicle_ids = self._approaching[junction_id]
+        del vehicle_ids[vehicle_id]
+        if not vehicle_ids:
+            del self._approaching[junction_id]
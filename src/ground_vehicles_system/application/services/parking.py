@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.errors.parking_errors import (
+    DuplicateParkingLotError,
+    DuplicateParkingSpotError,
+    NoFreeParkingSpotError,
+    ParkingLotNotFoundError
+)
+from ground_vehicles_system.domain.services.spatial_index import PointGridIndex
+
+
+@dataclass(frozen=True)
+class ParkingSpot:
+    """A single parking space."""
+    spot_id: str
+    latitude: float
+    longitude: float
+
+
+@dataclass(frozen=True)
+class ParkingLot:
+    """A named group of parking spots, such as a depot or a street segment."""
+    lot_id: str
+    spots: tuple[ParkingSpot, ...]
+
+
+class ParkingAllocator(VehicleObserver):
+    """
+    Reserves the nearest free parking spot for vehicles.
+
+    Only free spots are kept in a point grid, so the nearest one is found by
+    searching the few cells around the vehicle, and reserving or releasing a
+    spot moves it out of or back into the grid. Reservations are taken under
+    one lock, so concurrent requests never get the same spot.
+
+    Vehicles parked through park() are observed, and their spot is released
+    as soon as they leave the PARKING state.
+    """
+    def __init__(self, cell_size_degrees: float = 0.001) -> None:
+        self._lots: dict[str, ParkingLot] = {}
+        self._spots: dict[str, ParkingSpot] = {}
+        self._lot_of: dict[str, str] = {}
+        self._free: PointGridIndex[str] = PointGridIndex(cell_size_degrees)
+        self._occupants: dict[str, str] = {}
+        self._reservations: dict[str, str] = {}
+        # Reentrant because releasing a spot can be triggered by a vehicle
+        # change made while the lock is held.
+        self._lock = threading.RLock()
+
+    @property
+    def free_count(self) -> int:
+        return len(self._free)
+
+    def add_lot(self, lot: ParkingLot) -> None:
+        """Registers a lot; all its spots start free."""
+        with self._lock:
+            if lot.lot_id in self._lots:
+                raise DuplicateParkingLotError(lot.lot_id)
+
+            spot_ids = set()
+            for spot in lot.spots:
+                if spot.spot_id in self._spots or spot.spot_id in spot_ids:
+                    raise DuplicateParkingSpotError(spot.spot_id)
+                spot_ids.add(spot.spot_id)
+
+            self._lots[lot.lot_id] = lot
+
+            for spot in lot.spots:
+                self._spots[spot.spot_id] = spot
+                self._lot_of[spot.spot_id] = lot.lot_id
+                self._free.insert(spot.spot_id, spot.latitude, spot.longitude)
+
+    def occupancy(self, lot_id: str) -> tuple[int, int]:
+        """Returns how many spots of the lot are reserved, and how many exist."""
+        lot = self._lots.get(lot_id)
+        if lot is None:
+            raise ParkingLotNotFoundError(lot_id)
+
+        reserved = sum(1 for spot in lot.spots if spot.spot_id in self._occupants)
+        return reserved, len(lot.spots)
+
+    def lot_of(self, spot: ParkingSpot) -> ParkingLot:
+        return self._lots[self._lot_of[spot.spot_id]]
+
+    def spot_of(self, vehicle_id: str) -> ParkingSpot | None:
+        """Returns the spot reserved for the vehicle, if any."""
+        spot_id = self._reservations.get(vehicle_id)
+        return None if spot_id is None else self._spots[spot_id]
+
+    def reserve(
+        self,
+        vehicle_id: str,
+        latitude: float,
+        longitude: float
+    ) -> ParkingSpot:
+        """
+        Reserves the free spot nearest to the position for the vehicle.
+        A vehicle holding a reservation keeps its spot.
+        """
+        with self._lock:
+            reserved = self.spot_of(vehicle_id)
+            if reserved is not None:
+                return reserved
+
+            spot_id = self._free.nearest(latitude, longitude)
+            if spot_id is None:
+                raise NoFreeParkingSpotError()
+
+            self._free.remove(spot_id)
+            self._occupants[spot_id] = vehicle_id
+            self._reservations[vehicle_id] = spot_id
+            return self._spots[spot_id]
+
+    def release(self, vehicle_id: str) -> ParkingSpot | None:
+        """Frees the vehicle's spot, returning it, or None if it had none."""
+        with self._lock:
+            spot_id = self._reservations.pop(vehicle_id, None)
+            if spot_id is None:
+                return None
+
+            del self._occupants[spot_id]
+            spot = self._spots[spot_id]
+            self._free.insert(spot_id, spot.latitude, spot.longitude)
+            return spot
+
+    def park(self, vehicle: Vehicle) -> ParkingSpot:
+        """
+        Reserves the spot nearest to the stopped vehicle and parks it.
+        A spot already reserved for the vehicle is used instead. If the vehicle
+        can't be parked, a reservation made by this call is undone.
+        """
+        coordinates = vehicle.coordinates
+
+        with self._lock:
+            had_reservation = vehicle.vehicle_id in self._reservations
+            spot = self.reserve(
+                vehicle.vehicle_id, coordinates.latitude, coordinates.longitude
+            )
+
+            try:
+                vehicle.park()
+            except ValueError:
+                if not had_reservation:
+                    self.release(vehicle.vehicle_id)
+                raise
+
+            # Parking again must not register the allocator twice.
+            vehicle.remove_observer(self)
+            vehicle.add_observer(self)
+            return spot
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        if old_state == VehicleState.PARKING and new_state != VehicleState.PARKING:
+            vehicle.remove_observer(self)
+            self.release(vehicle.vehicle_id)
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import hashlib
+import struct
+import time
+from typing import Callable, Sequence, Union
+
+from ground_vehicles_system.application.services.fleet_snapshots import (
+    FleetSnapshot,
+    FleetSnapshotStore
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.errors.coordinates_errors import (
+    InvalidLatitudeError,
+    InvalidLongitudeError
+)
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.errors.vehicle_errors import (
+    CannotChangeVelocityOfAccidentedVehicle,
+    CrashedVehicleError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+_CHECKSUM_ROW = struct.Struct("<qqqq")
+
+# Errors of a single recorded event; the event is reported as rejected and
+# the replay goes on.
+_REJECTED_EVENT_ERRORS = (
+    CannotChangeVelocityOfAccidentedVehicle,
+    VehicleNotFoundError,
+    InvalidLatitudeError,
+    InvalidLongitudeError,
+)
+
+
+def fleet_checksum(fleet: Fleet) -> str:
+    """
+    Returns a digest of the observable state of every vehicle.
+    Values are quantized (micro-degrees, mm/s, milli-degrees) so the digest
+    doesn't depend on the last bits of floating point results.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    for vehicle in sorted(fleet, key=lambda vehicle: vehicle.vehicle_id):
+        digest.update(vehicle.vehicle_id.encode())
+        digest.update(_CHECKSUM_ROW.pack(
+            round(vehicle.coordinates.latitude * 1_000_000),
+            round(vehicle.coordinates.longitude * 1_000_000),
+            round(vehicle.velocity.to_mps() * 1_000),
+            round(vehicle.heading.degrees * 1_000)
+        ))
+        digest.update(vehicle.state.value.encode())
+
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class AccelerateCommand:
+    vehicle_id: str
+    amount: float
+    unit: VelocityUnit
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        fleet.get(self.vehicle_id).accelerate(self.amount, self.unit)
+
+
+@dataclass(frozen=True)
+class TurnCommand:
+    vehicle_id: str
+    degrees: float
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        fleet.get(self.vehicle_id).turn(self.degrees)
+
+
+@dataclass(frozen=True)
+class StopEngineCommand:
+    vehicle_id: str
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        fleet.get(self.vehicle_id).stop_engine()
+
+
+@dataclass(frozen=True)
+class MoveTick:
+    """Moves every vehicle; the listed ones hit or merely detect obstacles."""
+    time_delta_seconds: float
+    hitting_vehicle_ids: frozenset[str] = frozenset()
+    blocked_vehicle_ids: frozenset[str] = frozenset()
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        for vehicle in fleet:
+            hits = vehicle.vehicle_id in self.hitting_vehicle_ids
+            blocked = hits or vehicle.vehicle_id in self.blocked_vehicle_ids
+            try:
+                vehicle.move(self.time_delta_seconds, blocked, hits)
+            except CrashedVehicleError:
+                report.crashes.append((timestamp, vehicle.vehicle_id))
+
+
+@dataclass(frozen=True)
+class TelemetryFix:
+    vehicle_id: str
+    latitude: float
+    longitude: float
+    speed_mps: float
+    course_degrees: float
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        fleet.get(self.vehicle_id).update_from_telemetry(
+            Coordinates(self.latitude, self.longitude),
+            Velocity(self.speed_mps),
+            Heading(self.course_degrees % 360)
+        )
+
+
+@dataclass(frozen=True)
+class ChecksumMark:
+    """The fleet_checksum recorded in production at this point of the session."""
+    checksum: str
+
+    def apply(self, fleet: Fleet, report: ReplayReport, timestamp: float) -> None:
+        actual = fleet_checksum(fleet)
+        if actual != self.checksum:
+            report.mismatches.append(
+                ChecksumMismatch(timestamp, self.checksum, actual)
+            )
+
+
+ReplayPayload = Union[
+    AccelerateCommand,
+    TurnCommand,
+    StopEngineCommand,
+    MoveTick,
+    TelemetryFix,
+    ChecksumMark,
+]
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    """A recorded input, stamped with seconds since the session started."""
+    timestamp: float
+    payload: ReplayPayload
+
+
+@dataclass(frozen=True)
+class ChecksumMismatch:
+    timestamp: float
+    expected: str
+    actual: str
+
+
+@dataclass
+class ReplayReport:
+    """
+    What happened while replaying part of a session. rejected_commands holds
+    every event that couldn't be applied: commands to accidented or unknown
+    vehicles and telemetry fixes with invalid coordinates.
+    """
+    events_applied: int = 0
+    crashes: list[tuple[float, str]] = field(default_factory=list)
+    rejected_commands: list[tuple[float, str]] = field(default_factory=list)
+    mismatches: list[ChecksumMismatch] = field(default_factory=list)
+
+
+class VirtualClock:
+    """Session time, advanced by the replay instead of by the wall clock."""
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+
+@dataclass(frozen=True)
+class _Checkpoint:
+    position: int
+    timestamp: float
+    snapshot: FleetSnapshot
+
+
+class ReplayEngine:
+    """
+    Re-runs a recorded session through the domain model on a virtual clock.
+
+    By default events are applied as fast as the CPU allows; with a speed
+    multiple the replay is paced so one recorded second takes 1/speed wall
+    seconds. Every checkpoint_interval events the fleet state is saved as a
+    copy-on-write snapshot, so seeking restores the closest earlier
+    checkpoint and only replays the events after it. Events the domain
+    rejects are reported instead of aborting the replay.
+    """
+    def __init__(
+        self,
+        events: Sequence[RecordedEvent],
+        initial_fleet: Fleet,
+        checkpoint_interval: int = 1_000,
+        speed: float | None = None,
+        wall_clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval must be positive.")
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive.")
+        if any(
+            later.timestamp < earlier.timestamp
+            for earlier, later in zip(events, events[1:])
+        ):
+            raise ValueError("Recorded events must be sorted by timestamp.")
+
+        self._events = events
+        self._timestamps = [event.timestamp for event in events]
+        self._fleet = initial_fleet
+        self._checkpoint_interval = checkpoint_interval
+        self._speed = speed
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._clock = VirtualClock(events[0].timestamp if events else 0.0)
+        self._position = 0
+        self._snapshots = FleetSnapshotStore()
+        self._checkpoints = [_Checkpoint(
+            0, self._clock.now, self._snapshots.publish_fleet(initial_fleet)
+        )]
+
+    @property
+    def fleet(self) -> Fleet:
+        """The fleet being replayed; seeking backwards replaces it."""
+        return self._fleet
+
+    @property
+    def clock(self) -> VirtualClock:
+        return self._clock
+
+    @property
+    def finished(self) -> bool:
+        return self._position >= len(self._events)
+
+    def run(self, until: float | None = None) -> ReplayReport:
+        """Replays the events up to and including the given session time."""
+        return self._replay(until, paced=self._speed is not None)
+
+    def seek(self, timestamp: float) -> ReplayReport:
+        """
+        Moves the replay to the given session time without pacing.
+        Events at exactly that time are applied.
+        """
+        stop = bisect_right(self._timestamps, timestamp)
+        checkpoint = max(
+            (
+                checkpoint
+                for checkpoint in self._checkpoints
+                if checkpoint.position <= stop
+            ),
+            key=lambda checkpoint: checkpoint.position,
+        )
+
+        if stop < self._position or checkpoint.position > self._position:
+            self._restore(checkpoint)
+
+        report = self._replay(timestamp, paced=False)
+        self._clock.now = max(self._clock.now, timestamp)
+        return report
+
+    def _replay(self, until: float | None, paced: bool) -> ReplayReport:
+        report = ReplayReport()
+        stop = (
+            len(self._events)
+            if until is None
+            else bisect_right(self._timestamps, until)
+        )
+        wall_start = self._wall_clock()
+        session_start = self._clock.now
+
+        while self._position < stop:
+            event = self._events[self._position]
+
+            if paced:
+                assert self._speed is not None
+                due = wall_start + (event.timestamp - session_start) / self._speed
+                delay = due - self._wall_clock()
+                if delay > 0:
+                    self._sleep(delay)
+
+            self._clock.now = event.timestamp
+            try:
+                event.payload.apply(self._fleet, report, event.timestamp)
+            except _REJECTED_EVENT_ERRORS:
+                vehicle_id = getattr(event.payload, "vehicle_id", "")
+                report.rejected_commands.append((event.timestamp, vehicle_id))
+
+            self._position += 1
+            report.events_applied += 1
+
+            if self._position % self._checkpoint_interval == 0 and (
+                self._position > self._checkpoints[-1].position
+            ):
+                self._checkpoints.append(_Checkpoint(
+                    self._position,
+                    self._clock.now,
+                    self._snapshots.publish_fleet(self._fleet)
+                ))
+
+        return report
+
+    def _restore(self, checkpoint: _Checkpoint) -> None:
+        self._fleet = Fleet.create(
+            (
+                Vehicle(
+                    row.vehicle_id,
+                    row.coordinates,
+                    row.velocity,
+                    row.heading,
+                    row.state,
+                    row.odometer_meters,
+                    row.driving_seconds,
+                    row.idle_seconds
+                )
+                for row in checkpoint.snapshot
+            ),
+            fleet_id=self._fleet.fleet_id,
+        )
+        self._position = checkpoint.position
+        self._clock.now = checkpoint.timestamp
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from itertools import count
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.services.spatial_index import (
+    BoxGridIndex,
+    PointGridIndex
+)
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+_NOBODY: frozenset[int] = frozenset()
+
+
+class ViewportSubscription:
+    """
+    A client's viewport and the vehicle changes waiting to be sent to it.
+    Pending changes are keyed by vehicle id, so a vehicle that changes many
+    times between two sends is sent once, with its latest state. A None entry
+    means the vehicle left the viewport.
+    """
+    def __init__(
+        self,
+        subscription_id: int,
+        box: BoundingBox,
+        update_interval_seconds: float
+    ) -> None:
+        self._id = subscription_id
+        self._box = box
+        self._update_interval_seconds = update_interval_seconds
+        self._pending: dict[str, Vehicle | None] = {}
+        self._visible: set[str] = set()
+
+    @property
+    def subscription_id(self) -> int:
+        return self._id
+
+    @property
+    def box(self) -> BoundingBox:
+        return self._box
+
+    @property
+    def update_interval_seconds(self) -> float:
+        return self._update_interval_seconds
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def drain(self) -> dict[str, Vehicle | None]:
+        """Returns the pending changes and starts collecting new ones."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+
+class ViewportFanout(VehicleObserver):
+    """
+    Routes vehicle changes to the subscriptions whose viewport contains them.
+
+    Viewports are registered in a grid index, so a change costs one cell
+    lookup plus an exact test per viewport sharing that cell, no matter how
+    many clients are connected. Vehicle positions are kept in a point grid to
+    fill a new or moved viewport with the vehicles already inside it.
+    Vehicles must be changed on the thread that drains the subscriptions.
+    """
+    def __init__(self, fleet: Fleet, cell_size_degrees: float = 0.01) -> None:
+        self._viewports: BoxGridIndex[int] = BoxGridIndex(cell_size_degrees)
+        self._positions: PointGridIndex[str] = PointGridIndex(cell_size_degrees)
+        self._subscriptions: dict[int, ViewportSubscription] = {}
+        self._vehicles: dict[str, Vehicle] = {}
+        self._watchers: dict[str, set[int]] = {}
+        self._ids = count(1)
+
+        for vehicle in fleet:
+            self.track(vehicle)
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def track(self, vehicle: Vehicle) -> None:
+        if vehicle.vehicle_id in self._vehicles:
+            return
+
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        vehicle.add_observer(self)
+        self._changed(vehicle)
+
+    def untrack(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        del self._vehicles[vehicle_id]
+        self._positions.remove(vehicle_id)
+        vehicle.remove_observer(self)
+
+        for subscription_id in self._watchers.pop(vehicle_id, _NOBODY):
+            subscription = self._subscriptions[subscription_id]
+            subscription._visible.discard(vehicle_id)
+            subscription._pending[vehicle_id] = None
+
+    def subscribe(
+        self,
+        box: BoundingBox,
+        update_rate_hz: float
+    ) -> ViewportSubscription:
+        """
+        Registers a viewport, queueing every vehicle already inside it.
+        update_rate_hz is how often the client wants to receive changes.
+        """
+        if update_rate_hz <= 0:
+            raise ValueError("update_rate_hz must be positive.")
+
+        subscription = ViewportSubscription(next(self._ids), box, 1 / update_rate_hz)
+        self._subscriptions[subscription.subscription_id] = subscription
+        self._show(subscription)
+        return subscription
+
+    def move_viewport(
+        self,
+        subscription: ViewportSubscription,
+        box: BoundingBox
+    ) -> None:
+        """Replaces the viewport; vehicles left outside are queued as removed."""
+        self._hide(subscription)
+        subscription._box = box
+        self._show(subscription)
+
+    def unsubscribe(self, subscription: ViewportSubscription) -> None:
+        self._hide(subscription)
+        del self._subscriptions[subscription.subscription_id]
+
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        self._changed(vehicle)
+
+    def on_velocity_changed(
+        self,
+        vehicle: Vehicle,
+        old_mps: float,
+        new_mps: float
+    ) -> None:
+        self._changed(vehicle)
+
+    def on_turned(
+        self,
+        vehicle: Vehicle,
+        old_degrees: float,
+        new_degrees: float
+    ) -> None:
+        self._changed(vehicle)
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        self._changed(vehicle)
+
+    def _changed(self, vehicle: Vehicle) -> None:
+        vehicle_id = vehicle.vehicle_id
+        latitude = vehicle.coordinates.latitude
+        longitude = vehicle.coordinates.longitude
+        self._positions.insert(vehicle_id, latitude, longitude)
+
+        previous = self._watchers.get(vehicle_id, _NOBODY)
+        current = {
+            subscription_id
+            for subscription_id in self._viewports.candidates_at(latitude, longitude)
+            if self._subscriptions[subscription_id].box.contains(latitude, longitude)
+        }
+
+        for subscription_id in previous - current:
+            subscription = self._subscriptions[subscription_id]
+            subscription._visible.discard(vehicle_id)
+            subscription._pending[vehicle_id] = None
+
+        for subscription_id in current:
+            subscription = self._subscriptions[subscription_id]
+            subscription._visible.add(vehicle_id)
+            subscription._pending[vehicle_id] = vehicle
+
+        if current:
+            self._watchers[vehicle_id] = current
+        elif previous:
+            del self._watchers[vehicle_id]
+
+    def _show(self, subscription: ViewportSubscription) -> None:
+        box = subscription.box
+        subscription_id = subscription.subscription_id
+        self._viewports.insert(subscription_id, box)
+
+        for cell in self._positions.cells_in_box(box):
+            for vehicle_id in self._positions.keys_in_cell(cell):
+                if box.contains(*self._positions.position_of(vehicle_id)):
+                    self._watchers.setdefault(vehicle_id, set()).add(subscription_id)
+                    subscription._visible.add(vehicle_id)
+                    subscription._pending[vehicle_id] = self._vehicles[vehicle_id]
+
+    def _hide(self, subscription: ViewportSubscription) -> None:
+        subscription_id = subscription.subscription_id
+        self._viewports.remove(subscription_id)
+
+        for vehicle_id in subscription._visible:
+            watchers = self._watchers[vehicle_id]
+            watchers.discard(subscription_id)
+            if not watchers:
+                del self._watchers[vehicle_id]
+            subscription._pending[vehicle_id] = None
+
+        subscription._visible = set()
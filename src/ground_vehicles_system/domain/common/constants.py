@@ -1,4 +1,4 @@
 class GeodeticConstants:
     """A collection of geodetic constants."""
     METERS_PER_DEGREE_LATITUDE = 111139.0
-    KM_PER_MPH = 1.60934
+    KM_PER_MPH = 1.609344
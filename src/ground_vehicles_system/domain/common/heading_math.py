@@ -0,0 +1,99 @@
+from array import array
+import math
+from typing import Sequence
+
+
+def normalize_degrees(headings: Sequence[float]) -> array:
+    """Wraps every heading into [0, 360)."""
+    return array('d', [heading % 360.0 for heading in headings])
+
+
+def turn_headings(
+    headings: Sequence[float],
+    deltas: Sequence[float] | float
+) -> array:
+    """
+    Turns every heading by its delta, or all of them by the same delta,
+    like Heading.turn does for one heading.
+    """
+    if isinstance(deltas, (int, float)):
+        delta = float(deltas)
+        return array('d', [(heading + delta) % 360.0 for heading in headings])
+
+    if len(headings) != len(deltas):
+        raise ValueError("headings and deltas must have the same length.")
+
+    return array(
+        'd', [(heading + delta) % 360.0 for heading, delta in zip(headings, deltas)]
+    )
+
+
+def signed_difference(from_degrees: float, to_degrees: float) -> float:
+    """Returns the shortest signed turn in degrees, in [-180, 180)."""
+    return (to_degrees - from_degrees + 180.0) % 360.0 - 180.0
+
+
+def signed_differences(
+    from_degrees: Sequence[float],
+    to_degrees: Sequence[float]
+) -> array:
+    """Element-wise signed_difference of two heading columns."""
+    if len(from_degrees) != len(to_degrees):
+        raise ValueError("Heading columns must have the same length.")
+
+    return array(
+        'd',
+        [
+            (target - origin + 180.0) % 360.0 - 180.0
+            for origin, target in zip(from_degrees, to_degrees)
+        ]
+    )
+
+
+def bearing_degrees(
+    latitude: float,
+    longitude: float,
+    target_latitude: float,
+    target_longitude: float
+) -> float:
+    """
+    Returns the heading, in [0, 360), that drives from a point to a nearby
+    target under the flat-earth model of the motion rates.
+    """
+    north = target_latitude - latitude
+    east = (target_longitude - longitude) * math.cos(
+        math.radians((latitude + target_latitude) / 2)
+    )
+    return math.degrees(math.atan2(east, north)) % 360.0
+
+
+def bearings_degrees(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    target_latitudes: Sequence[float],
+    target_longitudes: Sequence[float]
+) -> array:
+    """Element-wise bearing_degrees of parallel coordinate columns."""
+    rows = len(latitudes)
+    if not (
+        len(longitudes) == len(target_latitudes) == len(target_longitudes) == rows
+    ):
+        raise ValueError("Coordinate columns must have the same length.")
+
+    bearings = array('d', bytes(8 * rows))
+    atan2 = math.atan2
+    cos = math.cos
+    degrees_per_radian = 180.0 / math.pi
+    radians_per_degree = math.pi / 180.0
+
+    for row in range(rows):
+        latitude = latitudes[row]
+        target_latitude = target_latitudes[row]
+        east = (target_longitudes[row] - longitudes[row]) * cos(
+            (latitude + target_latitude) * 0.5 * radians_per_degree
+        )
+        bearings[row] = (
+            atan2(east, target_latitude - latitude) * degrees_per_radian
+        ) % 360.0
+
+    return bearings
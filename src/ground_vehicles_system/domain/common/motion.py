@@ -0,0 +1,50 @@
+import math
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+
+
+def latitude_rate(velocity_mps: float, heading_cos: float) -> float:
+    """
+    Returns the latitude change, in degrees per second, of a moving body.
+    Takes the cosine of the heading, so callers can pass Heading.cos.
+    """
+    return (
+        velocity_mps * heading_cos
+    ) / GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+
+
+def longitude_rate(
+    velocity_mps: float,
+    heading_sin: float,
+    latitude: float
+) -> float:
+    """
+    Returns the longitude change, in degrees per second, of a moving body,
+    given the sine of its heading. Meridians converge towards the poles, so
+    the rate depends on latitude.
+    """
+    return (
+        velocity_mps * heading_sin
+    ) / (
+        GeodeticConstants.METERS_PER_DEGREE_LATITUDE * math.cos(
+            math.radians(latitude)
+        )
+    )
+
+
+def ground_distance_meters(
+    latitude: float,
+    longitude: float,
+    other_latitude: float,
+    other_longitude: float
+) -> float:
+    """
+    Returns the distance between two nearby points under the same flat-earth
+    approximation as the rates, measured at their mean latitude.
+    """
+    meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+    north = (other_latitude - latitude) * meters_per_degree
+    east = (other_longitude - longitude) * meters_per_degree * math.cos(
+        math.radians((latitude + other_latitude) / 2)
+    )
+    return math.hypot(north, east)
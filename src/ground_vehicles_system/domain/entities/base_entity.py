@@ -24,3 +24,13 @@ class Entity(ABC, Generic[IdType]):
         This identifier is used to distinguish between different entities in the system.
         """
         return self._id
+
+
+def new_entity_id() -> str:
+    """
+    Returns a random hexadecimal identifier for a new entity.
+    uuid is imported on first use, since most callers pass their own ids.
+    """
+    from uuid import uuid4
+
+    return uuid4().hex
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+from ground_vehicles_system.domain.entities.base_entity import Entity, new_entity_id
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.errors.fleet_errors import (
+    DuplicateVehicleError,
+    VehicleNotFoundError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import VelocityUnit
+
+
+class Fleet(Entity[str]):
+    """
+    Aggregate holding the vehicles that are simulated together.
+    Vehicles are indexed by id so lookups never scan the whole fleet.
+    """
+    def __init__(self, fleet_id: str, vehicles: dict[str, Vehicle]) -> None:
+        self._id = fleet_id
+        self._vehicles = vehicles
+
+    @classmethod
+    def create(
+        cls,
+        vehicles: Iterable[Vehicle] = (),
+        fleet_id: str | None = None,
+    ) -> Fleet:
+        """Factory method to create a Fleet instance."""
+        id = fleet_id if fleet_id is not None else new_entity_id()
+        fleet = cls(id, {})
+
+        for vehicle in vehicles:
+            fleet.add(vehicle)
+
+        return fleet
+
+    @property
+    def fleet_id(self) -> str:
+        return self._id
+
+    def __len__(self) -> int:
+        return len(self._vehicles)
+
+    def __iter__(self) -> Iterator[Vehicle]:
+        return iter(self._vehicles.values())
+
+    def __contains__(self, vehicle_id: object) -> bool:
+        return vehicle_id in self._vehicles
+
+    def add(self, vehicle: Vehicle) -> None:
+        """Adds a vehicle, raising DuplicateVehicleError if its id is taken."""
+        if vehicle.vehicle_id in self._vehicles:
+            raise DuplicateVehicleError(vehicle.vehicle_id)
+
+        self._vehicles[vehicle.vehicle_id] = vehicle
+
+    def remove(self, vehicle_id: str) -> Vehicle:
+        """Removes and returns the vehicle with the given id."""
+        try:
+            return self._vehicles.pop(vehicle_id)
+        except KeyError:
+            raise VehicleNotFoundError(vehicle_id) from None
+
+    def get(self, vehicle_id: str) -> Vehicle:
+        """Returns the vehicle with the given id."""
+        try:
+            return self._vehicles[vehicle_id]
+        except KeyError:
+            raise VehicleNotFoundError(vehicle_id) from None
+
+    def find(self, vehicle_id: str) -> Vehicle | None:
+        """Returns the vehicle with the given id, or None if it isn't here."""
+        return self._vehicles.get(vehicle_id)
+
+    def position_at(self, vehicle_id: str, elapsed_seconds: float) -> Coordinates:
+        """
+        Returns where the vehicle will be after elapsed_seconds.
+        See Vehicle.position_at for the motion model being evaluated.
+        """
+        return self.get(vehicle_id).position_at(elapsed_seconds)
+
+    def positions_at(
+        self,
+        vehicle_ids: Sequence[str],
+        elapsed_seconds: Sequence[float]
+    ) -> tuple[list[float], list[float]]:
+        """
+        Evaluates many (vehicle, elapsed time) queries in one pass.
+        The motion rates of each vehicle are computed once and reused by all
+        of its samples, so dense sampling only costs two multiply-adds per
+        query. Returns the latitudes and longitudes as parallel lists; the
+        values are not wrapped in Coordinates to skip per-sample validation.
+        """
+        if len(vehicle_ids) != len(elapsed_seconds):
+            raise ValueError(
+                "vehicle_ids and elapsed_seconds must have the same length."
+            )
+
+        rates: dict[str, tuple[float, float, float, float]] = {}
+        latitudes = [0.0] * len(vehicle_ids)
+        longitudes = [0.0] * len(vehicle_ids)
+
+        for index, (vehicle_id, seconds) in enumerate(
+            zip(vehicle_ids, elapsed_seconds)
+        ):
+            motion = rates.get(vehicle_id)
+
+            if motion is None:
+                vehicle = self.get(vehicle_id)
+                delta_lat_per_second, delta_lon_per_second = (
+                    vehicle.coordinate_rates()
+                )
+                motion = (
+                    vehicle.coordinates.latitude,
+                    vehicle.coordinates.longitude,
+                    delta_lat_per_second,
+                    delta_lon_per_second
+                )
+                rates[vehicle_id] = motion
+
+            latitude, longitude, delta_lat_per_second, delta_lon_per_second = motion
+            latitudes[index] = latitude + delta_lat_per_second * seconds
+            longitudes[index] = longitude + delta_lon_per_second * seconds
+
+        return latitudes, longitudes
+
+    def accelerate_many(
+        self,
+        vehicle_ids: Sequence[str],
+        amounts: Sequence[float],
+        unit: VelocityUnit
+    ) -> bytearray:
+        """
+        Accelerates each vehicle by its amount, negative amounts decelerating.
+        Returns one CommandOutcome code per vehicle instead of raising, so
+        accidented vehicles don't interrupt the batch.
+        """
+        if len(vehicle_ids) != len(amounts):
+            raise ValueError("vehicle_ids and amounts must have the same length.")
+
+        outcomes = bytearray(len(vehicle_ids))
+
+        for row, vehicle_id in enumerate(vehicle_ids):
+            outcomes[row] = self.get(vehicle_id).try_accelerate(amounts[row], unit)
+
+        return outcomes
+
+    def turn_many(
+        self,
+        vehicle_ids: Sequence[str],
+        degrees: Sequence[float]
+    ) -> bytearray:
+        """Turns each vehicle, returning one CommandOutcome code per vehicle."""
+        if len(vehicle_ids) != len(degrees):
+            raise ValueError("vehicle_ids and degrees must have the same length.")
+
+        outcomes = bytearray(len(vehicle_ids))
+
+        for row, vehicle_id in enumerate(vehicle_ids):
+            outcomes[row] = self.get(vehicle_id).try_turn(degrees[row])
+
+        return outcomes
+
+    def move_all(
+        self,
+        time_delta_seconds: float,
+        obstacles: dict[str, tuple[bool, bool]] | None = None,
+    ) -> tuple[list[str], bytearray]:
+        """
+        Moves every vehicle by one tick. obstacles maps the ids of vehicles
+        that sensed an obstacle to (obstacle_found, will_hit_obstacle).
+        Returns the vehicle ids and, row by row, their CommandOutcome codes;
+        crashed vehicles are marked CRASHED instead of raising.
+        """
+        obstacles = obstacles if obstacles is not None else {}
+        no_obstacle = (False, False)
+        vehicle_ids = list(self._vehicles)
+        outcomes = bytearray(len(vehicle_ids))
+
+        for row, vehicle in enumerate(self._vehicles.values()):
+            obstacle_found, will_hit_obstacle = obstacles.get(
+                vehicle.vehicle_id, no_obstacle
+            )
+            outcomes[row] = vehicle.try_move(
+                time_delta_seconds, obstacle_found, will_hit_obstacle
+            )
+
+        return vehicle_ids, outcomes
+
+    def odometry_columns(self) -> tuple[list[str], array, array, array]:
+        """
+        Exports the odometry counters of every vehicle as parallel columns:
+        ids, odometer in meters, driving seconds and idle seconds.
+        The counters are packed into float arrays, eight bytes per value.
+        """
+        vehicle_ids = list(self._vehicles)
+        vehicles = self._vehicles.values()
+
+        return (
+            vehicle_ids,
+            array('d', [vehicle.odometer_meters for vehicle in vehicles]),
+            array('d', [vehicle.driving_seconds for vehicle in vehicles]),
+            array('d', [vehicle.idle_seconds for vehicle in vehicles]),
+        )
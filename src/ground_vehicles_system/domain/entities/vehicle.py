@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 import logging
-import math
-from uuid import uuid4
 
-from ground_vehicles_system.domain.common.constants import GeodeticConstants
-from ground_vehicles_system.domain.entities.base_entity import Entity
+from ground_vehicles_system.domain.common.motion import latitude_rate, longitude_rate
+from ground_vehicles_system.domain.entities.base_entity import Entity, new_entity_id
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
 from ground_vehicles_system.domain.errors.vehicle_errors import (
     CannotChangeVelocityOfAccidentedVehicle,
-    CrashedVehicleError
+    CannotParkMovingVehicleError,
+    CrashedVehicleError,
+    VehicleNotAccidentedError
 )
 from ground_vehicles_system.domain.value_objects.velocity import (
     Velocity,
-    VelocityConstants,
-    VelocityUnit
+    VelocityUnit,
+    conversion_factor
 )
 from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
 from ground_vehicles_system.domain.value_objects.heading import Heading
@@ -30,6 +31,16 @@ class VehicleState(StrEnum):
     ACCIDENTED = "accidented"
 
 
+class CommandOutcome(IntEnum):
+    """
+    Result of a try_* vehicle command, for callers that batch commands and
+    would rather check a code than catch an exception per vehicle.
+    """
+    OK = 0
+    REJECTED = 1
+    CRASHED = 2
+
+
 class Vehicle(Entity[str]):
     def __init__(
         self,
@@ -37,13 +48,20 @@ class Vehicle(Entity[str]):
         coordinates: Coordinates,
         velocity: Velocity,
         heading: Heading,
-        state: VehicleState
+        state: VehicleState,
+        odometer_meters: float = 0.0,
+        driving_seconds: float = 0.0,
+        idle_seconds: float = 0.0,
     ) -> None:
         self._id = vehicle_id
         self._coordinates = coordinates
         self._velocity = velocity
         self._heading = heading
         self._state = state
+        self._observers: tuple[VehicleObserver, ...] = ()
+        self._odometer_meters = odometer_meters
+        self._driving_seconds = driving_seconds
+        self._idle_seconds = idle_seconds
 
     @classmethod
     def create(
@@ -54,8 +72,8 @@ class Vehicle(Entity[str]):
         heading: Heading | None = None,
     ) -> Vehicle:
         """Factory method to create a Vehicle instance."""
-        id = vehicle_id if vehicle_id is not None else uuid4().hex
-        heading = heading if heading is not None else Heading(0.0)
+        id = vehicle_id if vehicle_id is not None else new_entity_id()
+        heading = heading if heading is not None else Heading.of(0.0)
         state = VehicleState.STOPPED if velocity.value == 0 else VehicleState.DRIVING
 
         return cls(id, coordinates, velocity, heading, state)
@@ -76,20 +94,66 @@ class Vehicle(Entity[str]):
     def heading(self) -> Heading:
         return self._heading
 
+    @property
+    def state(self) -> VehicleState:
+        return self._state
+
+    @property
+    def odometer_meters(self) -> float:
+        return self._odometer_meters
+
+    @property
+    def driving_seconds(self) -> float:
+        """Time spent moving while simulated by move."""
+        return self._driving_seconds
+
+    @property
+    def idle_seconds(self) -> float:
+        """Time spent standing still, but not accidented, while simulated by move."""
+        return self._idle_seconds
+
+    def add_observer(self, observer: VehicleObserver) -> None:
+        """Registers an observer to be notified of this vehicle's changes."""
+        self._observers = (*self._observers, observer)
+
+    def remove_observer(self, observer: VehicleObserver) -> None:
+        self._observers = tuple(
+            registered for registered in self._observers if registered is not observer
+        )
+
+    def replace_observers(
+        self,
+        observers: tuple[VehicleObserver, ...]
+    ) -> tuple[VehicleObserver, ...]:
+        """Registers exactly the given observers, returning the ones replaced."""
+        replaced = self._observers
+        self._observers = observers
+        return replaced
+
     def accelerate(self, amount: float, unit: VelocityUnit) -> None:
         """
         Accelerates the vehicle by the given amount.
         Returns a new Vehicle instance with the updated velocity and state.
         """
+        if self.try_accelerate(amount, unit) is not CommandOutcome.OK:
+            raise CannotChangeVelocityOfAccidentedVehicle()
+
+    def try_accelerate(self, amount: float, unit: VelocityUnit) -> CommandOutcome:
+        """
+        Like accelerate, but returns REJECTED instead of raising when the
+        vehicle is accidented.
+        """
         if self._state == VehicleState.ACCIDENTED:
             _logger.info(
                 f"Cannot accelerate: Vehicle {self._id} is in an accident."
             )
-            raise CannotChangeVelocityOfAccidentedVehicle()
+            return CommandOutcome.REJECTED
 
         delta = self._convert_velocity(amount, unit)
-        new_mps = max(0.0, self._velocity.to_mps() + delta)
-        self._velocity = Velocity(new_mps)
+        old_mps = self._velocity.to_mps()
+        new_mps = max(0.0, old_mps + delta)
+        if new_mps != old_mps:
+            self._velocity = Velocity(new_mps) if new_mps else Velocity.zero()
 
         old_state = self._state
 
@@ -104,6 +168,9 @@ class Vehicle(Entity[str]):
         if old_state != self._state:
             _logger.info(f"Vehicle {self._id} is now {self._state.value}.")
 
+        self._notify_changes(old_state, old_mps)
+        return CommandOutcome.OK
+
     def decelerate(self, amount: float, unit: VelocityUnit) -> None:
         """
         Decelerates the vehicle by the given amount.
@@ -126,22 +193,36 @@ class Vehicle(Entity[str]):
         """
         self.accelerate(-self._velocity.to_mps(), VelocityUnit.MPS)
 
+    def try_brake_to_a_stop(self) -> CommandOutcome:
+        """Like brake_to_a_stop, but returns REJECTED instead of raising."""
+        return self.try_accelerate(-self._velocity.to_mps(), VelocityUnit.MPS)
+
     def turn(self, degrees: float) -> None:
         """
         Turns the vehicle by the given degrees.
         The heading is updated by adding the degrees to the current heading.
         Returns a new Vehicle instance with the updated heading.
         """
+        if self.try_turn(degrees) is not CommandOutcome.OK:
+            raise CannotChangeVelocityOfAccidentedVehicle()
+
+    def try_turn(self, degrees: float) -> CommandOutcome:
+        """Like turn, but returns REJECTED instead of raising."""
         if self._state == VehicleState.ACCIDENTED:
             _logger.info(f"Cannot turn: Vehicle {self._id} is in an accident.")
-            raise CannotChangeVelocityOfAccidentedVehicle()
+            return CommandOutcome.REJECTED
 
+        old_heading = self._heading
         self._heading = self._heading.turn(degrees)
 
+        for observer in self._observers:
+            observer.on_turned(self, old_heading.degrees, self._heading.degrees)
+
         _logger.info(
             f"Vehicle {self._id} is now heading {self._heading.degrees:.2f} "
             "degrees."
         )
+        return CommandOutcome.OK
 
     def stop_engine(self) -> None:
         """
@@ -153,8 +234,78 @@ class Vehicle(Entity[str]):
                 f"Vehicle {self._id} is already in an accident."
             )
 
+        old_state = self._state
+        old_mps = self._velocity.to_mps()
         self._state = VehicleState.STOPPED
-        self._velocity = Velocity(0.0)
+        self._velocity = Velocity.zero()
+
+        self._notify_changes(old_state, old_mps)
+
+    def recover(self) -> None:
+        """
+        Clears the accident once the vehicle has been towed or repaired.
+        The vehicle is left stopped, and only accidented vehicles can recover.
+        """
+        if self._state != VehicleState.ACCIDENTED:
+            _logger.info(f"Cannot recover: Vehicle {self._id} is not accidented.")
+            raise VehicleNotAccidentedError()
+
+        old_mps = self._velocity.to_mps()
+        self._state = VehicleState.STOPPED
+        self._velocity = Velocity.zero()
+        _logger.info(f"Vehicle {self._id} has been recovered.")
+
+        self._notify_changes(VehicleState.ACCIDENTED, old_mps)
+
+    def park(self) -> None:
+        """
+        Parks the stopped vehicle.
+        It stays parked until it accelerates away or is driven by telemetry.
+        """
+        if self._state == VehicleState.ACCIDENTED:
+            _logger.info(f"Cannot park: Vehicle {self._id} is in an accident.")
+            raise CrashedVehicleError()
+        if self._velocity.to_mps() > 0:
+            _logger.info(f"Cannot park: Vehicle {self._id} is still moving.")
+            raise CannotParkMovingVehicleError()
+
+        old_state = self._state
+        self._state = VehicleState.PARKING
+
+        if old_state != self._state:
+            _logger.info(f"Vehicle {self._id} is now {self._state.value}.")
+
+        self._notify_changes(old_state, 0.0)
+
+    def update_from_telemetry(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity,
+        heading: Heading
+    ) -> None:
+        """
+        Overwrites the motion state with a reported position fix.
+        The state is derived from the reported speed like in accelerate, but an
+        accidented vehicle stays accidented until it is recovered.
+        """
+        old_state = self._state
+        old_mps = self._velocity.to_mps()
+        self._coordinates = coordinates
+        self._velocity = velocity
+        self._heading = heading
+
+        if self._state != VehicleState.ACCIDENTED:
+            if velocity.to_mps() > 0:
+                self._state = VehicleState.DRIVING
+            elif self._state != VehicleState.PARKING:
+                self._state = VehicleState.STOPPED
+
+            if old_state != self._state:
+                _logger.info(f"Vehicle {self._id} is now {self._state.value}.")
+
+        for observer in self._observers:
+            observer.on_moved(self, 0.0)
+        self._notify_changes(old_state, old_mps)
 
     def move(
         self,
@@ -166,9 +317,24 @@ class Vehicle(Entity[str]):
         Moves the vehicle based on its current velocity and heading.
         Returns a new Vehicle instance with the updated coordinates and state,
         or raises CrashedVehicleError if it hits an obstacle.
+        The elapsed time is added to the driving or idle time, and the distance
+        driven to the odometer.
         """
+        outcome = self.try_move(time_delta_seconds, obstacle_found, will_hit_obstacle)
+        if outcome is CommandOutcome.CRASHED:
+            raise CrashedVehicleError()
+
+    def try_move(
+        self,
+        time_delta_seconds: float,
+        obstacle_found: bool,
+        will_hit_obstacle: bool
+    ) -> CommandOutcome:
+        """Like move, but returns CRASHED instead of raising on a crash."""
         if self._state != VehicleState.DRIVING:
-            return
+            if self._state != VehicleState.ACCIDENTED:
+                self._idle_seconds += time_delta_seconds
+            return CommandOutcome.OK
 
         if obstacle_found:
             if will_hit_obstacle:
@@ -177,58 +343,116 @@ class Vehicle(Entity[str]):
                     f"now in {VehicleState.ACCIDENTED.value} state."
                 )
                 self._state = VehicleState.ACCIDENTED
-                raise CrashedVehicleError()
+                self._notify_changes(VehicleState.DRIVING, self._velocity.to_mps())
+                return CommandOutcome.CRASHED
             else:
                 _logger.warning(
                     f"Vehicle {self._id} detected an obstacle. "
                     "Stopping movement."
                 )
-                self.brake_to_a_stop()
-                return
+                self.try_brake_to_a_stop()
+                self._idle_seconds += time_delta_seconds
+                return CommandOutcome.OK
 
         velocity_mps = self.velocity.to_mps()
 
         # If the vehicle's velocity is 0, it shouldn't move
         if velocity_mps == 0.0:
-            return
-
-        delta_lat_per_second = (
-            self._calculate_delta_lat(velocity_mps) * time_delta_seconds
-        )
-        delta_lon_per_second = (
-            self._calculate_delta_lon(velocity_mps) * time_delta_seconds
-        )
+            self._idle_seconds += time_delta_seconds
+            return CommandOutcome.OK
 
-        self._coordinates = self._coordinates.move(
-            delta_latitude=delta_lat_per_second,
-            delta_longitude=delta_lon_per_second
-        )
+        self._coordinates = self.position_at(time_delta_seconds)
 
         distance_meters = velocity_mps * time_delta_seconds
+        self._odometer_meters += distance_meters
+        self._driving_seconds += time_delta_seconds
 
         _logger.info(
             f"Vehicle {self._id} moved {distance_meters:.2f} meters to new "
             "position."
         )
 
-    def _calculate_delta_lat(self, velocity_mps: float) -> float:
+        for observer in self._observers:
+            observer.on_moved(self, distance_meters)
+
+        return CommandOutcome.OK
+
+    def commit_motion(
+        self,
+        coordinates: Coordinates,
+        odometer_meters: float,
+        driving_seconds: float,
+        idle_seconds: float
+    ) -> None:
+        """
+        Writes back motion stepped outside the entity, such as by a
+        FleetWorkingState. The counters are absolute values, and observers see
+        a single on_moved for the whole distance covered since the last one.
+        """
+        distance_meters = odometer_meters - self._odometer_meters
+        self._coordinates = coordinates
+        self._odometer_meters = odometer_meters
+        self._driving_seconds = driving_seconds
+        self._idle_seconds = idle_seconds
+
+        if distance_meters > 0:
+            for observer in self._observers:
+                observer.on_moved(self, distance_meters)
+
+    def coordinate_rates(self) -> tuple[float, float]:
+        """
+        Returns the latitude and longitude change per second, in degrees.
+        Within a tick the vehicle keeps a constant velocity and heading, so
+        these rates fully describe its motion until the next command.
+        """
+        velocity_mps = self._velocity.to_mps()
+
+        if self._state != VehicleState.DRIVING or velocity_mps == 0.0:
+            return 0.0, 0.0
+
         return (
-            velocity_mps * math.cos(self.heading.radians)
-        ) / GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+            self._calculate_delta_lat(velocity_mps),
+            self._calculate_delta_lon(velocity_mps)
+        )
+
+    def position_at(self, elapsed_seconds: float) -> Coordinates:
+        """
+        Returns the position the vehicle reaches after elapsed_seconds.
+        The motion model is evaluated in closed form from the current state,
+        so the vehicle itself is not changed.
+        """
+        delta_lat_per_second, delta_lon_per_second = self.coordinate_rates()
+
+        if delta_lat_per_second == 0.0 and delta_lon_per_second == 0.0:
+            return self._coordinates
+
+        return self._coordinates.move(
+            delta_latitude=delta_lat_per_second * elapsed_seconds,
+            delta_longitude=delta_lon_per_second * elapsed_seconds
+        )
+
+    def _notify_changes(self, old_state: VehicleState, old_mps: float) -> None:
+        if not self._observers:
+            return
+
+        new_mps = self._velocity.to_mps()
+
+        for observer in self._observers:
+            if new_mps != old_mps:
+                observer.on_velocity_changed(self, old_mps, new_mps)
+            if self._state != old_state:
+                observer.on_state_changed(self, old_state, self._state)
+
+    def _calculate_delta_lat(self, velocity_mps: float) -> float:
+        return latitude_rate(velocity_mps, self.heading.cos)
 
     def _calculate_delta_lon(self, velocity_mps: float) -> float:
-        return (
-            velocity_mps * math.sin(self.heading.radians)
-        ) / (
-            GeodeticConstants.METERS_PER_DEGREE_LATITUDE * math.cos(
-                math.radians(self.coordinates.latitude)
-            )
+        return longitude_rate(
+            velocity_mps, self.heading.sin, self.coordinates.latitude
         )
 
     def _convert_velocity(self, amount: float, unit: VelocityUnit) -> float:
-        if unit == VelocityUnit.KPH:
-            return amount * VelocityConstants.KILOMETERS_PER_HOUR_TO_METERS_PER_SECOND
-        if unit == VelocityUnit.MPH:
-            return amount * VelocityConstants.MILES_PER_HOUR_TO_METERS_PER_SECOND
-        return amount
+        if unit is VelocityUnit.MPS:
+            return amount
+        return amount * conversion_factor(unit, VelocityUnit.MPS)
 
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+
+
+class VehicleObserver:
+    """
+    Receives the changes of the vehicles it observes, right after they happen.
+    Every callback does nothing by default, so observers only override the
+    changes they care about.
+    """
+    def on_state_changed(
+        self,
+        vehicle: Vehicle,
+        old_state: VehicleState,
+        new_state: VehicleState
+    ) -> None:
+        pass
+
+    def on_velocity_changed(
+        self,
+        vehicle: Vehicle,
+        old_mps: float,
+        new_mps: float
+    ) -> None:
+        pass
+
+    def on_turned(
+        self,
+        vehicle: Vehicle,
+        old_degrees: float,
+        new_degrees: float
+    ) -> None:
+        pass
+
+    def on_moved(self, vehicle: Vehicle, distance_meters: float) -> None:
+        """
+        Called after the vehicle's coordinates change. distance_meters is the
+        distance driven, or 0.0 when the position was overwritten by a fix.
+        """
+        pass
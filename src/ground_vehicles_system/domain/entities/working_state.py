@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Iterable
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+
+
+class FleetWorkingState:
+    """
+    Mutable, columnar copy of the motion of a group of vehicles, for hot
+    stepping loops that would otherwise allocate a Coordinates per vehicle
+    and tick.
+
+    Positions and odometry counters live in float arrays updated in place,
+    and the motion rates are computed once, since velocity, heading and
+    state don't change while stepping. Nothing is written to the vehicles
+    until commit(), which builds one Coordinates per vehicle and notifies
+    observers once. Stepping matches Vehicle.move without obstacles exactly.
+
+    Commands must not be sent to the captured vehicles before commit(), or
+    commit() would overwrite their results.
+    """
+    def __init__(self, vehicles: Iterable[Vehicle]) -> None:
+        self._vehicles = list(vehicles)
+        meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        rows = len(self._vehicles)
+        self._latitudes = array('d', bytes(8 * rows))
+        self._longitudes = array('d', bytes(8 * rows))
+        self._speeds = array('d', bytes(8 * rows))
+        self._latitude_rates = array('d', bytes(8 * rows))
+        self._east_speeds = array('d', bytes(8 * rows))
+        self._odometers = array('d', bytes(8 * rows))
+        self._driving_seconds = array('d', bytes(8 * rows))
+        self._idle_seconds = array('d', bytes(8 * rows))
+        self._moving: list[int] = []
+        self._idle: list[int] = []
+
+        for row, vehicle in enumerate(self._vehicles):
+            speed = vehicle.velocity.to_mps()
+            self._latitudes[row] = vehicle.coordinates.latitude
+            self._longitudes[row] = vehicle.coordinates.longitude
+            self._odometers[row] = vehicle.odometer_meters
+            self._driving_seconds[row] = vehicle.driving_seconds
+            self._idle_seconds[row] = vehicle.idle_seconds
+
+            if vehicle.state == VehicleState.DRIVING and speed != 0.0:
+                heading = vehicle.heading
+                self._speeds[row] = speed
+                self._latitude_rates[row] = speed * heading.cos / meters_per_degree
+                self._east_speeds[row] = speed * heading.sin
+                self._moving.append(row)
+            elif vehicle.state != VehicleState.ACCIDENTED:
+                self._idle.append(row)
+
+    def __len__(self) -> int:
+        return len(self._vehicles)
+
+    @property
+    def latitudes(self) -> array:
+        return self._latitudes
+
+    @property
+    def longitudes(self) -> array:
+        return self._longitudes
+
+    def step(self, time_delta_seconds: float) -> None:
+        """Advances every captured vehicle by one tick, in place."""
+        meters_per_degree = GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        latitudes = self._latitudes
+        longitudes = self._longitudes
+        odometers = self._odometers
+        driving_seconds = self._driving_seconds
+        idle_seconds = self._idle_seconds
+        cos = math.cos
+        radians = math.radians
+
+        for row in self._moving:
+            latitude = latitudes[row]
+            longitude_rate = self._east_speeds[row] / (
+                meters_per_degree * cos(radians(latitude))
+            )
+            latitudes[row] = latitude + self._latitude_rates[row] * time_delta_seconds
+            longitudes[row] += longitude_rate * time_delta_seconds
+            odometers[row] += self._speeds[row] * time_delta_seconds
+            driving_seconds[row] += time_delta_seconds
+
+        for row in self._idle:
+            idle_seconds[row] += time_delta_seconds
+
+    def commit(self) -> None:
+        """
+        Writes the stepped positions and counters back to the vehicles.
+        Raises the Coordinates errors if a vehicle was driven out of range.
+        """
+        for row in self._moving:
+            self._vehicles[row].commit_motion(
+                Coordinates(self._latitudes[row], self._longitudes[row]),
+                self._odometers[row],
+                self._driving_seconds[row],
+                self._idle_seconds[row],
+            )
+
+        for row in self._idle:
+            vehicle = self._vehicles[row]
+            vehicle.commit_motion(
+                vehicle.coordinates,
+                self._odometers[row],
+                self._driving_seconds[row],
+                self._idle_seconds[row],
+            )
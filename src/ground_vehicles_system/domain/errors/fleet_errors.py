@@ -0,0 +1,11 @@
+class VehicleNotFoundError(LookupError):
+    """Raised when a vehicle id is not part of the fleet."""
+    def __init__(self, vehicle_id: str) -> None:
+        self._message = f"Vehicle {vehicle_id} is not part of the fleet."
+        super().__init__(self._message)
+
+class DuplicateVehicleError(ValueError):
+    """Raised when adding a vehicle whose id is already in the fleet."""
+    def __init__(self, vehicle_id: str) -> None:
+        self._message = f"Vehicle {vehicle_id} is already part of the fleet."
+        super().__init__(self._message)
@@ -0,0 +1,11 @@
+class DuplicateZoneError(ValueError):
+    """Raised when adding a geofence zone whose id is already registered."""
+    def __init__(self, zone_id: str) -> None:
+        self._message = f"Geofence zone {zone_id} is already registered."
+        super().__init__(self._message)
+
+class ZoneNotFoundError(LookupError):
+    """Raised when a geofence zone id is not registered."""
+    def __init__(self, zone_id: str) -> None:
+        self._message = f"Geofence zone {zone_id} is not registered."
+        super().__init__(self._message)
@@ -0,0 +1,5 @@
+class InvalidHeadingError(ValueError):
+    """Exception raised for non-finite headings."""
+    def __init__(self):
+        self.message = "Heading must be a finite number of degrees."
+        super().__init__(self.message)
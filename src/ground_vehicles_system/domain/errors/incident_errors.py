@@ -0,0 +1,11 @@
+class IncidentNotFoundError(LookupError):
+    """Raised when an incident id is not recorded."""
+    def __init__(self, incident_id: int) -> None:
+        self._message = f"Incident {incident_id} is not recorded."
+        super().__init__(self._message)
+
+class InvalidIncidentTransitionError(ValueError):
+    """Raised when an incident can't move to the requested status."""
+    def __init__(self, incident_id: int, status: str) -> None:
+        self._message = f"Incident {incident_id} can't become {status}."
+        super().__init__(self._message)
@@ -0,0 +1,11 @@
+class DuplicateJunctionError(ValueError):
+    """Raised when adding a junction whose id is already registered."""
+    def __init__(self, junction_id: str) -> None:
+        self._message = f"Junction {junction_id} is already registered."
+        super().__init__(self._message)
+
+class JunctionNotFoundError(LookupError):
+    """Raised when a junction id is not registered."""
+    def __init__(self, junction_id: str) -> None:
+        self._message = f"Junction {junction_id} is not registered."
+        super().__init__(self._message)
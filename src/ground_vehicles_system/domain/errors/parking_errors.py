@@ -0,0 +1,23 @@
+class DuplicateParkingLotError(ValueError):
+    """Raised when adding a parking lot whose id is already registered."""
+    def __init__(self, lot_id: str) -> None:
+        self._message = f"Parking lot {lot_id} is already registered."
+        super().__init__(self._message)
+
+class DuplicateParkingSpotError(ValueError):
+    """Raised when adding a parking spot whose id is already registered."""
+    def __init__(self, spot_id: str) -> None:
+        self._message = f"Parking spot {spot_id} is already registered."
+        super().__init__(self._message)
+
+class ParkingLotNotFoundError(LookupError):
+    """Raised when a parking lot id is not registered."""
+    def __init__(self, lot_id: str) -> None:
+        self._message = f"Parking lot {lot_id} is not registered."
+        super().__init__(self._message)
+
+class NoFreeParkingSpotError(LookupError):
+    """Raised when every parking spot is reserved."""
+    def __init__(self) -> None:
+        self._message = "There is no free parking spot."
+        super().__init__(self._message)
@@ -0,0 +1,5 @@
+class InvalidPolygonError(ValueError):
+    """Exception raised when a polygon has fewer than three vertices."""
+    def __init__(self):
+        self.message = "A polygon needs at least three vertices."
+        super().__init__(self.message)
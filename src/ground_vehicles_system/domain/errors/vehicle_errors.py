@@ -9,3 +9,15 @@ class CrashedVehicleError(ValueError):
     def __init__(self) -> None:
         self._message = "Vehicle is in an accident state."
         super().__init__(self._message)
+
+class CannotParkMovingVehicleError(ValueError):
+    """Raised when trying to park a vehicle that is still moving."""
+    def __init__(self) -> None:
+        self._message = "Cannot park a moving vehicle."
+        super().__init__(self._message)
+
+class VehicleNotAccidentedError(ValueError):
+    """Raised when recovering a vehicle that is not in an accident state."""
+    def __init__(self) -> None:
+        self._message = "Only an accidented vehicle can be recovered."
+        super().__init__(self._message)
@@ -0,0 +1,5 @@
+class InvalidVelocityError(ValueError):
+    """Exception raised for negative or non-finite speeds."""
+    def __init__(self):
+        self.message = "Velocity must be a finite, non-negative speed."
+        super().__init__(self.message)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Sequence
+
+UNASSIGNED = -1
+
+
+def solve_assignment(costs: Sequence[Sequence[float]]) -> list[int]:
+    """
+    Solves the rectangular assignment problem with the Hungarian algorithm.
+    Returns, for every row, the column assigned to it or UNASSIGNED, so that
+    the total cost is minimal. math.inf marks forbidden pairs; rows left with
+    only forbidden columns stay unassigned. Runs in O(rows² · columns).
+    """
+    rows = len(costs)
+    columns = len(costs[0]) if rows else 0
+    if rows == 0 or columns == 0:
+        return [UNASSIGNED] * rows
+
+    if rows > columns:
+        transposed = [
+            [costs[row][column] for row in range(rows)] for column in range(columns)
+        ]
+        assigned = [UNASSIGNED] * rows
+        for column, row in enumerate(solve_assignment(transposed)):
+            if row != UNASSIGNED:
+                assigned[row] = column
+        return assigned
+
+    # Forbidden pairs get a cost above any feasible total, so they are only
+    # chosen when a row has no feasible column left.
+    finite = [cost for line in costs for cost in line if cost != math.inf]
+    forbidden = (max(finite, default=0.0) + 1.0) * (rows + 1)
+    matrix = [
+        [forbidden if cost == math.inf else cost for cost in line] for line in costs
+    ]
+
+    # Potentials-based formulation with 1-based rows and columns; column 0 is
+    # a virtual column used while augmenting.
+    row_potential = [0.0] * (rows + 1)
+    column_potential = [0.0] * (columns + 1)
+    row_of_column = [0] * (columns + 1)
+    previous = [0] * (columns + 1)
+
+    for row in range(1, rows + 1):
+        row_of_column[0] = row
+        column = 0
+        slack = [math.inf] * (columns + 1)
+        used = [False] * (columns + 1)
+
+        while True:
+            used[column] = True
+            current_row = row_of_column[column]
+            cost_row = matrix[current_row - 1]
+            offset = row_potential[current_row]
+            delta = math.inf
+            next_column = 0
+
+            for candidate in range(1, columns + 1):
+                if used[candidate]:
+                    continue
+                reduced = cost_row[candidate - 1] - offset - column_potential[candidate]
+                if reduced < slack[candidate]:
+                    slack[candidate] = reduced
+                    previous[candidate] = column
+                if slack[candidate] < delta:
+                    delta = slack[candidate]
+                    next_column = candidate
+
+            for candidate in range(columns + 1):
+                if used[candidate]:
+                    row_potential[row_of_column[candidate]] += delta
+                    column_potential[candidate] -= delta
+                else:
+                    slack[candidate] -= delta
+
+            column = next_column
+            if row_of_column[column] == 0:
+                break
+
+        while column:
+            previous_column = previous[column]
+            row_of_column[column] = row_of_column[previous_column]
+            column = previous_column
+
+    assigned = [UNASSIGNED] * rows
+
+    for column in range(1, columns + 1):
+        row = row_of_column[column]
+        if row and matrix[row - 1][column - 1] != forbidden:
+            assigned[row - 1] = column - 1
+
+    return assigned
+
+
+def greedy_assignment(
+    edges: Iterable[tuple[float, int, int]],
+    rows: int
+) -> list[int]:
+    """
+    Assigns rows to columns by taking (cost, row, column) edges cheapest
+    first, skipping rows and columns already taken. Returns the column of
+    every row or UNASSIGNED. Not optimal, but O(E log E) for E edges.
+    """
+    assigned = [UNASSIGNED] * rows
+    taken: set[int] = set()
+
+    for _, row, column in sorted(edges):
+        if assigned[row] == UNASSIGNED and column not in taken:
+            assigned[row] = column
+            taken.add(column)
+
+    return assigned
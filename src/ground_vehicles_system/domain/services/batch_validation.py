@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntEnum
+import math
+from typing import Sequence
+
+from ground_vehicles_system.domain.errors.coordinates_errors import (
+    InvalidLatitudeError,
+    InvalidLongitudeError
+)
+from ground_vehicles_system.domain.errors.heading_errors import InvalidHeadingError
+from ground_vehicles_system.domain.errors.velocity_errors import InvalidVelocityError
+
+
+class RejectionReason(IntEnum):
+    """Why a row failed batch validation; VALID rows passed every check."""
+    VALID = 0
+    INVALID_LATITUDE = 1
+    INVALID_LONGITUDE = 2
+    INVALID_VELOCITY = 3
+    INVALID_HEADING = 4
+    INVALID_VEHICLE_ID = 5
+    INVALID_STATE = 6
+    INVALID_ODOMETRY = 7
+    DUPLICATE_VEHICLE_ID = 8
+
+    def to_error(self) -> ValueError | None:
+        """
+        Returns the error the value objects raise for the same problem, or
+        None when no value object checks it.
+        """
+        if self is RejectionReason.INVALID_LATITUDE:
+            return InvalidLatitudeError()
+        if self is RejectionReason.INVALID_LONGITUDE:
+            return InvalidLongitudeError()
+        if self is RejectionReason.INVALID_VELOCITY:
+            return InvalidVelocityError()
+        if self is RejectionReason.INVALID_HEADING:
+            return InvalidHeadingError()
+        return None
+
+
+@dataclass(frozen=True)
+class BatchValidation:
+    """
+    Outcome of validating a batch of rows.
+    mask holds 1 for valid rows and 0 otherwise, and reasons holds the
+    RejectionReason code of the first failed check of every row; both have
+    one byte per row.
+    """
+    mask: bytearray
+    reasons: bytearray
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    @property
+    def valid_count(self) -> int:
+        return self.mask.count(1)
+
+    def valid_rows(self) -> list[int]:
+        return [row for row, valid in enumerate(self.mask) if valid]
+
+    def invalid_rows(self) -> list[int]:
+        return [row for row, valid in enumerate(self.mask) if not valid]
+
+    def reason(self, row: int) -> RejectionReason:
+        return RejectionReason(self.reasons[row])
+
+    def error(self, row: int) -> ValueError | None:
+        return self.reason(row).to_error()
+
+    def counts(self) -> dict[RejectionReason, int]:
+        """Returns how many rows were rejected for each reason."""
+        return {
+            reason: self.reasons.count(reason)
+            for reason in RejectionReason
+            if reason is not RejectionReason.VALID and reason in self.reasons
+        }
+
+
+def validate_fixes(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    speeds_mps: Sequence[float] | None = None,
+    headings_degrees: Sequence[float] | None = None,
+) -> BatchValidation:
+    """
+    Validates parallel columns in one pass: latitudes in [-90, 90],
+    longitudes in [-180, 180], and, when given, finite non-negative speeds
+    and finite headings. NaN fails every check.
+    """
+    rows = len(latitudes)
+    if len(longitudes) != rows or any(
+        column is not None and len(column) != rows
+        for column in (speeds_mps, headings_degrees)
+    ):
+        raise ValueError("Columns must have the same length.")
+
+    mask = bytearray(b"\x01") * rows
+    reasons = bytearray(rows)
+    inf = math.inf
+
+    # Chained comparisons are False for NaN, so these also reject it.
+    for row in range(rows):
+        if not -90 <= latitudes[row] <= 90:
+            reason = RejectionReason.INVALID_LATITUDE
+        elif not -180 <= longitudes[row] <= 180:
+            reason = RejectionReason.INVALID_LONGITUDE
+        elif speeds_mps is not None and not 0 <= speeds_mps[row] < inf:
+            reason = RejectionReason.INVALID_VELOCITY
+        elif headings_degrees is not None and not (
+            -inf < headings_degrees[row] < inf
+        ):
+            reason = RejectionReason.INVALID_HEADING
+        else:
+            continue
+
+        mask[row] = 0
+        reasons[row] = reason
+
+    return BatchValidation(mask, reasons)
+
+
+def validate_coordinates(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float]
+) -> BatchValidation:
+    """Validates latitude and longitude columns like Coordinates does."""
+    return validate_fixes(latitudes, longitudes)
+
+
+def validate_speeds(speeds_mps: Sequence[float]) -> BatchValidation:
+    """Validates that every speed is finite and non-negative."""
+    rows = len(speeds_mps)
+    mask = bytearray(b"\x01") * rows
+    reasons = bytearray(rows)
+    inf = math.inf
+
+    for row in range(rows):
+        if not 0 <= speeds_mps[row] < inf:
+            mask[row] = 0
+            reasons[row] = RejectionReason.INVALID_VELOCITY
+
+    return BatchValidation(mask, reasons)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Iterable, Sequence
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.errors.geofence_errors import (
+    DuplicateZoneError,
+    ZoneNotFoundError
+)
+from ground_vehicles_system.domain.services.spatial_index import (
+    BoxGridIndex,
+    CellKey,
+    cell_of
+)
+from ground_vehicles_system.domain.value_objects.polygon import Polygon
+
+_NO_ZONES: frozenset[str] = frozenset()
+
+
+class GeofenceTransition(StrEnum):
+    """Enumeration for the ways a vehicle can cross a zone boundary."""
+    ENTER = "enter"
+    EXIT = "exit"
+
+
+@dataclass(frozen=True)
+class GeofenceZone:
+    """A named polygon such as a depot, a restricted area or a city zone."""
+    zone_id: str
+    polygon: Polygon
+
+
+@dataclass(frozen=True)
+class GeofenceEvent:
+    """A vehicle entering or leaving a zone."""
+    vehicle_id: str
+    zone_id: str
+    transition: GeofenceTransition
+
+
+class GeofenceEngine:
+    """
+    Tracks which zones every vehicle is in and reports only the changes.
+    Zones are indexed by the grid cells their bounding boxes overlap, so each
+    vehicle is only tested against the few polygons sharing its cell, and
+    vehicles that have not moved since the last update are skipped.
+    """
+    def __init__(self, cell_size_degrees: float = 0.01) -> None:
+        self._zones: dict[str, GeofenceZone] = {}
+        self._index: BoxGridIndex[str] = BoxGridIndex(cell_size_degrees)
+        self._positions: dict[str, tuple[float, float]] = {}
+        self._memberships: dict[str, frozenset[str]] = {}
+
+    def add_zone(self, zone: GeofenceZone) -> None:
+        """
+        Registers a zone.
+        Vehicles already inside it are reported on the next update.
+        """
+        if zone.zone_id in self._zones:
+            raise DuplicateZoneError(zone.zone_id)
+
+        self._zones[zone.zone_id] = zone
+        self._index.insert(zone.zone_id, zone.polygon.bounding_box)
+        # Cached positions only prove that membership did not change for the
+        # old set of zones, so every vehicle has to be re-tested.
+        self._positions.clear()
+
+    def remove_zone(self, zone_id: str) -> list[GeofenceEvent]:
+        """Unregisters a zone, returning exit events for the vehicles inside."""
+        if zone_id not in self._zones:
+            raise ZoneNotFoundError(zone_id)
+
+        del self._zones[zone_id]
+        self._index.remove(zone_id)
+
+        events = []
+
+        for vehicle_id, zone_ids in self._memberships.items():
+            if zone_id in zone_ids:
+                self._memberships[vehicle_id] = zone_ids - {zone_id}
+                events.append(
+                    GeofenceEvent(vehicle_id, zone_id, GeofenceTransition.EXIT)
+                )
+
+        return events
+
+    def zones_containing(self, latitude: float, longitude: float) -> frozenset[str]:
+        return frozenset(
+            zone_id
+            for zone_id in self._index.candidates_at(latitude, longitude)
+            if self._zones[zone_id].polygon.contains(latitude, longitude)
+        )
+
+    def membership(self, vehicle_id: str) -> frozenset[str]:
+        """Returns the zones the vehicle was in at the last update."""
+        return self._memberships.get(vehicle_id, _NO_ZONES)
+
+    def forget(self, vehicle_id: str) -> list[GeofenceEvent]:
+        """Stops tracking a vehicle, returning exit events for its zones."""
+        self._positions.pop(vehicle_id, None)
+        zone_ids = self._memberships.pop(vehicle_id, _NO_ZONES)
+
+        return [
+            GeofenceEvent(vehicle_id, zone_id, GeofenceTransition.EXIT)
+            for zone_id in sorted(zone_ids)
+        ]
+
+    def update(self, vehicles: Iterable[Vehicle]) -> list[GeofenceEvent]:
+        """Re-evaluates the given vehicles at their current coordinates."""
+        vehicle_ids = []
+        latitudes = []
+        longitudes = []
+
+        for vehicle in vehicles:
+            vehicle_ids.append(vehicle.vehicle_id)
+            latitudes.append(vehicle.coordinates.latitude)
+            longitudes.append(vehicle.coordinates.longitude)
+
+        return self.update_positions(vehicle_ids, latitudes, longitudes)
+
+    def update_positions(
+        self,
+        vehicle_ids: Sequence[str],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float]
+    ) -> list[GeofenceEvent]:
+        """
+        Re-evaluates vehicles from parallel position columns.
+        Moved vehicles are grouped by grid cell and every candidate polygon of
+        a cell tests the whole group in one contains_many call.
+        """
+        if not len(vehicle_ids) == len(latitudes) == len(longitudes):
+            raise ValueError("Position columns must have the same length.")
+
+        cell_size = self._index.cell_size_degrees
+        groups: dict[CellKey, list[int]] = {}
+
+        for index, vehicle_id in enumerate(vehicle_ids):
+            position = (latitudes[index], longitudes[index])
+
+            if self._positions.get(vehicle_id) == position:
+                continue
+
+            self._positions[vehicle_id] = position
+            groups.setdefault(cell_of(*position, cell_size), []).append(index)
+
+        events: list[GeofenceEvent] = []
+
+        for cell, indices in groups.items():
+            inside: dict[int, set[str]] = {index: set() for index in indices}
+            candidates = self._index.candidates_in_cell(cell)
+
+            if candidates:
+                group_latitudes = [latitudes[index] for index in indices]
+                group_longitudes = [longitudes[index] for index in indices]
+
+                for zone_id in candidates:
+                    flags = self._zones[zone_id].polygon.contains_many(
+                        group_latitudes, group_longitudes
+                    )
+                    for index, flag in zip(indices, flags):
+                        if flag:
+                            inside[index].add(zone_id)
+
+            for index in indices:
+                self._record(vehicle_ids[index], frozenset(inside[index]), events)
+
+        return events
+
+    def _record(
+        self,
+        vehicle_id: str,
+        zone_ids: frozenset[str],
+        events: list[GeofenceEvent]
+    ) -> None:
+        previous = self._memberships.get(vehicle_id, _NO_ZONES)
+
+        if zone_ids == previous:
+            return
+
+        for zone_id in sorted(previous - zone_ids):
+            events.append(GeofenceEvent(vehicle_id, zone_id, GeofenceTransition.EXIT))
+        for zone_id in sorted(zone_ids - previous):
+            events.append(
+                GeofenceEvent(vehicle_id, zone_id, GeofenceTransition.ENTER)
+            )
+
+        if zone_ids:
+            self._memberships[vehicle_id] = zone_ids
+        else:
+            self._memberships.pop(vehicle_id, None)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Generic, Iterable, Iterator, TypeVar
+
+KeyType = TypeVar('KeyType')
+
+
+class SortedBlockList(Generic[KeyType]):
+    """
+    Set of keys kept in ascending order, stored as a list of sorted blocks.
+
+    Adding or removing a key bisects the blocks' last keys and then shifts
+    only the block holding it, so an update costs O(log n + block_size)
+    instead of moving half of one flat list. Blocks split once they hold
+    twice block_size keys. Initial keys are sorted once, in bulk.
+    """
+    def __init__(self, keys: Iterable[KeyType] = (), block_size: int = 512) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive.")
+
+        ordered = sorted(set(keys))
+        self._block_size = block_size
+        self._blocks: list[list[KeyType]] = [
+            ordered[start:start + block_size]
+            for start in range(0, len(ordered), block_size)
+        ]
+        self._maxes: list[KeyType] = [block[-1] for block in self._blocks]
+        self._size = len(ordered)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: object) -> bool:
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return False
+
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        return position < len(block) and block[position] == key
+
+    def __iter__(self) -> Iterator[KeyType]:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, key: KeyType) -> None:
+        """Adds the key; adding a key already present does nothing."""
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            self._size = 1
+            return
+
+        index = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if position < len(block) and block[position] == key:
+            return
+
+        block.insert(position, key)
+        self._maxes[index] = block[-1]
+        self._size += 1
+
+        if len(block) > 2 * self._block_size:
+            half = len(block) // 2
+            self._blocks[index:index + 1] = [block[:half], block[half:]]
+            self._maxes[index:index + 1] = [block[half - 1], block[-1]]
+
+    def discard(self, key: KeyType) -> None:
+        """Removes the key if present."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return
+
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if position == len(block) or block[position] != key:
+            return
+
+        del block[position]
+        self._size -= 1
+
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+
+    def after(self, key: KeyType | None = None) -> Iterator[KeyType]:
+        """Iterates, in order, over the keys greater than key, or all of them."""
+        if key is None:
+            yield from self
+            return
+
+        index = bisect_right(self._maxes, key)
+        if index == len(self._blocks):
+            return
+
+        block = self._blocks[index]
+        yield from islice(block, bisect_right(block, key), None)
+        for block in islice(self._blocks, index + 1, None):
+            yield from block
+
+    def starting_at(self, key: KeyType) -> Iterator[KeyType]:
+        """Iterates, in order, over the keys greater than or equal to key."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            return
+
+        block = self._blocks[index]
+        yield from islice(block, bisect_left(block, key), None)
+        for block in islice(self._blocks, index + 1, None):
+            yield from block
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Collection, Generic, Hashable, Iterator, TypeVar
+
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.services.sorted_blocks import SortedBlockList
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+KeyType = TypeVar('KeyType', bound=Hashable)
+
+CellKey = tuple[int, int]
+
+_EMPTY: frozenset = frozenset()
+
+
+def cell_of(latitude: float, longitude: float, cell_size_degrees: float) -> CellKey:
+    """Returns the key of the uniform grid cell containing the point."""
+    return (
+        math.floor(latitude / cell_size_degrees),
+        math.floor(longitude / cell_size_degrees)
+    )
+
+
+class BoxGridIndex(Generic[KeyType]):
+    """
+    Uniform grid index of rectangles.
+    Every rectangle is registered in each cell it overlaps, so finding the
+    rectangles that may contain a point is a single dictionary lookup.
+    Rectangles spanning more than max_cells_per_box cells, such as a
+    zoomed-out map, are kept aside instead and returned as candidates for
+    every point, so registering one never enumerates millions of cells.
+    """
+    def __init__(
+        self,
+        cell_size_degrees: float,
+        max_cells_per_box: int = 4096
+    ) -> None:
+        if cell_size_degrees <= 0:
+            raise ValueError("cell_size_degrees must be positive.")
+        if max_cells_per_box <= 0:
+            raise ValueError("max_cells_per_box must be positive.")
+
+        self._cell_size = cell_size_degrees
+        self._max_cells_per_box = max_cells_per_box
+        self._cells: dict[CellKey, set[KeyType]] = {}
+        self._boxes: dict[KeyType, BoundingBox] = {}
+        self._large: set[KeyType] = set()
+
+    @property
+    def cell_size_degrees(self) -> float:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._boxes
+
+    def insert(self, key: KeyType, box: BoundingBox) -> None:
+        """Registers the rectangle, replacing any previous one for the key."""
+        if key in self._boxes:
+            self.remove(key)
+
+        self._boxes[key] = box
+
+        if self._cell_count(box) > self._max_cells_per_box:
+            self._large.add(key)
+            return
+
+        for cell in self._cells_covering(box):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: KeyType) -> None:
+        box = self._boxes.pop(key)
+
+        if key in self._large:
+            self._large.discard(key)
+            return
+
+        for cell in self._cells_covering(box):
+            members = self._cells[cell]
+            members.discard(key)
+            if not members:
+                del self._cells[cell]
+
+    def candidates_at(self, latitude: float, longitude: float) -> Collection[KeyType]:
+        """
+        Returns the keys whose cells cover the point.
+        The rectangles are only known to share the point's cell; callers still
+        have to run the exact containment test.
+        """
+        return self.candidates_in_cell(cell_of(latitude, longitude, self._cell_size))
+
+    def candidates_in_cell(self, cell: CellKey) -> Collection[KeyType]:
+        keys = self._cells.get(cell, _EMPTY)
+        return keys | self._large if self._large else keys
+
+    def _cell_count(self, box: BoundingBox) -> int:
+        min_row, min_column = cell_of(
+            box.min_latitude, box.min_longitude, self._cell_size
+        )
+        max_row, max_column = cell_of(
+            box.max_latitude, box.max_longitude, self._cell_size
+        )
+        return (max_row - min_row + 1) * (max_column - min_column + 1)
+
+    def _cells_covering(self, box: BoundingBox) -> list[CellKey]:
+        min_row, min_column = cell_of(
+            box.min_latitude, box.min_longitude, self._cell_size
+        )
+        max_row, max_column = cell_of(
+            box.max_latitude, box.max_longitude, self._cell_size
+        )
+        return [
+            (row, column)
+            for row in range(min_row, max_row + 1)
+            for column in range(min_column, max_column + 1)
+        ]
+
+
+class PointGridIndex(Generic[KeyType]):
+    """
+    Uniform grid index of points, each registered in the cell containing it.
+    Moving a point only touches its old and new cells, so the index can follow
+    every position update of a fleet. The occupied cells are also kept in
+    (row, column) order, so box listings can resume from any cell.
+    """
+    def __init__(self, cell_size_degrees: float) -> None:
+        if cell_size_degrees <= 0:
+            raise ValueError("cell_size_degrees must be positive.")
+
+        self._cell_size = cell_size_degrees
+        self._cells: dict[CellKey, set[KeyType]] = {}
+        self._points: dict[KeyType, tuple[float, float, CellKey]] = {}
+        self._occupied: SortedBlockList[CellKey] = SortedBlockList()
+
+    @property
+    def cell_size_degrees(self) -> float:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._points
+
+    def insert(self, key: KeyType, latitude: float, longitude: float) -> None:
+        """Registers the point, moving it if the key is already indexed."""
+        cell = cell_of(latitude, longitude, self._cell_size)
+        previous = self._points.get(key)
+        self._points[key] = (latitude, longitude, cell)
+
+        if previous is not None:
+            if previous[2] == cell:
+                return
+            self._release(key, previous[2])
+
+        members = self._cells.get(cell)
+        if members is None:
+            members = self._cells[cell] = set()
+            self._occupied.add(cell)
+        members.add(key)
+
+    def remove(self, key: KeyType) -> None:
+        _, _, cell = self._points.pop(key)
+        self._release(key, cell)
+
+    def position_of(self, key: KeyType) -> tuple[float, float]:
+        latitude, longitude, _ = self._points[key]
+        return latitude, longitude
+
+    def keys_in_cell(self, cell: CellKey) -> Collection[KeyType]:
+        return self._cells.get(cell, _EMPTY)
+
+    def cells_in_box(self, box: BoundingBox) -> list[CellKey]:
+        """
+        Returns the occupied cells overlapping the rectangle, in (row, column)
+        order. Large rectangles are answered from the occupied cells instead
+        of enumerating every cell they span.
+        """
+        return self.cells_between(*self._cell_range(box))
+
+    def cells_between(self, min_cell: CellKey, max_cell: CellKey) -> list[CellKey]:
+        """
+        Returns the occupied cells whose row and column lie between those of
+        min_cell and max_cell, inclusive, in (row, column) order. Like
+        cells_in_box, ranges spanning more cells than are occupied are
+        answered from the occupied cells.
+        """
+        min_row, min_column = min_cell
+        max_row, max_column = max_cell
+        spanned = (max_row - min_row + 1) * (max_column - min_column + 1)
+
+        if spanned > len(self._cells):
+            return list(self._occupied_cells_between(min_cell, max_cell, min_cell))
+
+        return [
+            (row, column)
+            for row in range(min_row, max_row + 1)
+            for column in range(min_column, max_column + 1)
+            if (row, column) in self._cells
+        ]
+
+    def occupied_cells_in_box(
+        self,
+        box: BoundingBox,
+        start: CellKey | None = None,
+    ) -> Iterator[CellKey]:
+        """
+        Lazily yields the occupied cells overlapping the rectangle, in
+        (row, column) order, from the start cell on when given. The sorted
+        occupied cells are bisected to the start and, on every row, to the
+        rectangle's first column, so resuming a listing costs O(log cells)
+        instead of rescanning the cells before it.
+        """
+        min_cell, max_cell = self._cell_range(box)
+        return self._occupied_cells_between(
+            min_cell, max_cell, min_cell if start is None else max(min_cell, start)
+        )
+
+    def nearest(self, latitude: float, longitude: float) -> KeyType | None:
+        """
+        Returns the key of the point closest to the given position, or None
+        when the index is empty.
+        """
+        found = self.nearest_many(latitude, longitude, 1)
+        return found[0][1] if found else None
+
+    def nearest_many(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+        max_distance_meters: float = math.inf,
+    ) -> list[tuple[float, KeyType]]:
+        """
+        Returns up to count (distance in meters, key) pairs of the points
+        closest to the given position and within max_distance_meters, closest
+        first. Rings of cells around the position are searched outwards until
+        no closer point can exist, falling back to a scan of every point once
+        a ring would visit more cells than are occupied.
+        """
+        if count <= 0 or not self._points:
+            return []
+
+        row, column = cell_of(latitude, longitude, self._cell_size)
+        cell_meters = self._cell_size * GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+        # Longitude cells are narrower away from the equator.
+        cell_meters *= max(math.cos(math.radians(latitude)), 1e-9)
+        # Max-heap of the best points so far, as (-distance, order, key).
+        best: list[tuple[float, int, KeyType]] = []
+        order = 0
+        limit = max_distance_meters
+        ring = 0
+
+        while ring == 0 or (ring - 1) * cell_meters <= limit:
+            if 8 * ring > len(self._cells):
+                return self._nearest_by_scan(
+                    latitude, longitude, count, max_distance_meters
+                )
+
+            for cell in _ring_cells(row, column, ring):
+                for key in self._cells.get(cell, _EMPTY):
+                    point_latitude, point_longitude, _ = self._points[key]
+                    distance = ground_distance_meters(
+                        latitude, longitude, point_latitude, point_longitude
+                    )
+                    if distance > limit:
+                        continue
+
+                    order += 1
+                    if len(best) < count:
+                        heapq.heappush(best, (-distance, order, key))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, order, key))
+
+                    if len(best) == count:
+                        limit = min(max_distance_meters, -best[0][0])
+
+            ring += 1
+
+        best.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [(-distance, key) for distance, _, key in best]
+
+    def _nearest_by_scan(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+        max_distance_meters: float
+    ) -> list[tuple[float, KeyType]]:
+        distances = (
+            (ground_distance_meters(latitude, longitude, point[0], point[1]), key)
+            for key, point in self._points.items()
+        )
+        return heapq.nsmallest(
+            count,
+            (entry for entry in distances if entry[0] <= max_distance_meters),
+            key=lambda entry: entry[0],
+        )
+
+    def _cell_range(self, box: BoundingBox) -> tuple[CellKey, CellKey]:
+        return (
+            cell_of(box.min_latitude, box.min_longitude, self._cell_size),
+            cell_of(box.max_latitude, box.max_longitude, self._cell_size),
+        )
+
+    def _occupied_cells_between(
+        self,
+        min_cell: CellKey,
+        max_cell: CellKey,
+        next_cell: CellKey,
+    ) -> Iterator[CellKey]:
+        _, min_column = min_cell
+        max_row, max_column = max_cell
+
+        while True:
+            for row, column in self._occupied.starting_at(next_cell):
+                if row > max_row:
+                    return
+                if min_column <= column <= max_column:
+                    yield row, column
+                    continue
+
+                # Outside the columns: jump to the next row segment inside them.
+                next_cell = (
+                    (row, min_column) if column < min_column else (row + 1, min_column)
+                )
+                break
+            else:
+                return
+
+    def _release(self, key: KeyType, cell: CellKey) -> None:
+        members = self._cells[cell]
+        members.discard(key)
+        if not members:
+            del self._cells[cell]
+            self._occupied.discard(cell)
+
+
+def _ring_cells(row: int, column: int, ring: int) -> list[CellKey]:
+    """Returns the cells at Chebyshev distance ring from (row, column)."""
+    if ring == 0:
+        return [(row, column)]
+
+    cells = [
+        (row + row_offset, column + column_offset)
+        for row_offset in (-ring, ring)
+        for column_offset in range(-ring, ring + 1)
+    ]
+    cells.extend(
+        (row + row_offset, column + column_offset)
+        for row_offset in range(-ring + 1, ring)
+        for column_offset in (-ring, ring)
+    )
+    return cells
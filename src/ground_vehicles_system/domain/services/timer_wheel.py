@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, Hashable, TypeVar
+
+KeyType = TypeVar('KeyType', bound=Hashable)
+
+
+class TimerWheel(Generic[KeyType]):
+    """
+    Hashed timer wheel firing keyed timers as simulated time advances.
+    Timers are bucketed by the slot their deadline falls in, so scheduling
+    and firing cost O(1) per timer and advancing only visits the slots the
+    clock passes over. Deadlines are rounded up to whole slots.
+    Rescheduling a key replaces its timer.
+    """
+    def __init__(self, slot_seconds: float, slots: int = 256) -> None:
+        if slot_seconds <= 0:
+            raise ValueError("slot_seconds must be positive.")
+        if slots <= 0:
+            raise ValueError("slots must be positive.")
+
+        self._slot_seconds = slot_seconds
+        self._slots: list[list[tuple[int, KeyType]]] = [[] for _ in range(slots)]
+        self._deadlines: dict[KeyType, int] = {}
+        self._now = 0.0
+        self._tick = 0
+
+    @property
+    def now(self) -> float:
+        return self._now
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: KeyType, delay_seconds: float) -> None:
+        """Fires the key once delay_seconds have elapsed from now."""
+        if delay_seconds < 0:
+            raise ValueError("delay_seconds must not be negative.")
+
+        deadline = max(
+            self._tick + 1, math.ceil((self._now + delay_seconds) / self._slot_seconds)
+        )
+        self._deadlines[key] = deadline
+        self._slots[deadline % len(self._slots)].append((deadline, key))
+
+    def cancel(self, key: KeyType) -> None:
+        # The slot entry is left behind and dropped when its slot is visited.
+        self._deadlines.pop(key, None)
+
+    def advance(self, elapsed_seconds: float) -> list[KeyType]:
+        """
+        Moves the clock forward, returning the keys whose timers expired,
+        earliest deadline first.
+        """
+        if elapsed_seconds < 0:
+            raise ValueError("elapsed_seconds must not be negative.")
+
+        self._now += elapsed_seconds
+        target = math.floor(self._now / self._slot_seconds)
+        slot_count = len(self._slots)
+        # A jump of a full turn or more visits every slot once.
+        steps = min(target - self._tick, slot_count)
+        due: list[tuple[int, KeyType]] = []
+
+        for tick in range(self._tick + 1, self._tick + 1 + steps):
+            slot = self._slots[tick % slot_count]
+            pending = []
+
+            for deadline, key in slot:
+                if self._deadlines.get(key) != deadline:
+                    continue
+                if deadline > target:
+                    pending.append((deadline, key))
+                else:
+                    due.append((deadline, key))
+                    del self._deadlines[key]
+
+            slot[:] = pending
+
+        self._tick = max(self._tick, target)
+        due.sort(key=lambda entry: entry[0])
+        return [key for _, key in due]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """
+    A Value Object representing an axis-aligned latitude/longitude rectangle.
+    Bounds are inclusive on every side.
+    """
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+
+    def __post_init__(self):
+        if self.min_latitude > self.max_latitude:
+            raise ValueError("min_latitude must not exceed max_latitude.")
+        if self.min_longitude > self.max_longitude:
+            raise ValueError("min_longitude must not exceed max_longitude.")
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return (
+            self.min_latitude <= latitude <= self.max_latitude
+            and self.min_longitude <= longitude <= self.max_longitude
+        )
+
+    def intersects(self, other: BoundingBox) -> bool:
+        return not (
+            other.min_latitude > self.max_latitude
+            or other.max_latitude < self.min_latitude
+            or other.min_longitude > self.max_longitude
+            or other.max_longitude < self.min_longitude
+        )
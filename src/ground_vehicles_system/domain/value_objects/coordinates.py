@@ -23,6 +23,18 @@ class Coordinates:
         if not (-180 <= self.longitude <= 180):
             raise InvalidLongitudeError()
 
+    @classmethod
+    def from_validated(cls, latitude: float, longitude: float) -> Coordinates:
+        """
+        Builds coordinates whose ranges were already checked in bulk.
+        Skips __post_init__, so callers must only pass values that passed the
+        same latitude and longitude checks.
+        """
+        coordinates = object.__new__(cls)
+        object.__setattr__(coordinates, "latitude", latitude)
+        object.__setattr__(coordinates, "longitude", longitude)
+        return coordinates
+
     def move(self, delta_latitude: float, delta_longitude: float) -> Coordinates:
         new_latitude = self.latitude + delta_latitude
         new_longitude = self.longitude + delta_longitude
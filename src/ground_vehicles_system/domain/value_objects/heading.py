@@ -1,17 +1,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 import math
 
+from ground_vehicles_system.domain.common.heading_math import signed_difference
+
 
 @dataclass(frozen=True)
 class Heading:
+    """
+    A Value Object representing a compass heading in degrees, clockwise from
+    north. Its trigonometric values are computed once per instance.
+    """
     degrees: float
 
-    @property
+    @cached_property
     def radians(self) -> float:
         return math.radians(self.degrees)
 
+    @cached_property
+    def sin(self) -> float:
+        return math.sin(self.radians)
+
+    @cached_property
+    def cos(self) -> float:
+        return math.cos(self.radians)
+
+    @classmethod
+    def of(cls, degrees: float) -> Heading:
+        """
+        Returns a heading, reusing the shared instance for the cardinal
+        directions along with its already computed trigonometry.
+        """
+        cardinal = _CARDINAL_HEADINGS.get(degrees)
+        return cardinal if cardinal is not None else cls(degrees)
+
     def turn(self, delta_degrees: float) -> Heading:
         new_heading = (self.degrees + delta_degrees) % 360
-        return Heading(new_heading)
+        return Heading.of(new_heading)
+
+    def difference_to(self, other: Heading) -> float:
+        """Returns the shortest signed turn, in degrees, towards other."""
+        return signed_difference(self.degrees, other.degrees)
+
+
+_CARDINAL_HEADINGS = {
+    degrees: Heading(degrees) for degrees in (0.0, 90.0, 180.0, 270.0)
+}
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Sequence
+
+from ground_vehicles_system.domain.errors.polygon_errors import InvalidPolygonError
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+
+
+@dataclass(frozen=True)
+class Polygon:
+    """
+    A Value Object representing a simple closed polygon on the map.
+    Vertices are given in order; the last one connects back to the first.
+    Latitude is treated as y and longitude as x, which is accurate enough
+    for zones that don't cross the antimeridian.
+    """
+    vertices: tuple[Coordinates, ...]
+
+    def __post_init__(self):
+        if len(self.vertices) < 3:
+            raise InvalidPolygonError()
+
+    @cached_property
+    def bounding_box(self) -> BoundingBox:
+        latitudes = [vertex.latitude for vertex in self.vertices]
+        longitudes = [vertex.longitude for vertex in self.vertices]
+        return BoundingBox(
+            min(latitudes), min(longitudes), max(latitudes), max(longitudes)
+        )
+
+    @cached_property
+    def _edges(self) -> tuple[tuple[float, float, float, float], ...]:
+        # Each edge is kept as (lat1, lat2, lon1, dlon/dlat) so the crossing
+        # test below needs a single multiply-add. Horizontal edges never
+        # cross a horizontal ray and are dropped.
+        edges = []
+        previous = self.vertices[-1]
+
+        for vertex in self.vertices:
+            if vertex.latitude != previous.latitude:
+                edges.append((
+                    previous.latitude,
+                    vertex.latitude,
+                    previous.longitude,
+                    (vertex.longitude - previous.longitude)
+                    / (vertex.latitude - previous.latitude)
+                ))
+            previous = vertex
+
+        return tuple(edges)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Returns whether the point lies inside the polygon (even-odd rule)."""
+        if not self.bounding_box.contains(latitude, longitude):
+            return False
+
+        inside = False
+
+        for lat1, lat2, lon1, slope in self._edges:
+            if (lat1 > latitude) != (lat2 > latitude):
+                if longitude < lon1 + (latitude - lat1) * slope:
+                    inside = not inside
+
+        return inside
+
+    def contains_many(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float]
+    ) -> list[bool]:
+        """
+        Tests many points at once, returning one flag per point.
+        Points outside the bounding box are rejected before any edge test.
+        """
+        box = self.bounding_box
+        edges = self._edges
+        result = [False] * len(latitudes)
+
+        for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+            if not (
+                box.min_latitude <= latitude <= box.max_latitude
+                and box.min_longitude <= longitude <= box.max_longitude
+            ):
+                continue
+
+            inside = False
+
+            for lat1, lat2, lon1, slope in edges:
+                if (lat1 > latitude) != (lat2 > latitude):
+                    if longitude < lon1 + (latitude - lat1) * slope:
+                        inside = not inside
+
+            result[index] = inside
+
+        return result
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Sequence
 
 
 class VelocityConstants:
@@ -25,6 +27,69 @@ class VelocityUnit(StrEnum):
     MPH = "mph"
 
 
+# Position of each unit in the rows and columns of CONVERSION_MATRIX.
+UNIT_CODES: tuple[VelocityUnit, ...] = (
+    VelocityUnit.MPS,
+    VelocityUnit.KPH,
+    VelocityUnit.MPH,
+)
+_CODE_OF_UNIT = {unit: code for code, unit in enumerate(UNIT_CODES)}
+
+# CONVERSION_MATRIX[from_code][to_code] multiplies a speed from one unit into
+# the other; every conversion in the package goes through it.
+CONVERSION_MATRIX: tuple[tuple[float, ...], ...] = (
+    (
+        1.0,
+        VelocityConstants.METERS_PER_SECOND_TO_KILOMETERS_PER_HOUR,
+        VelocityConstants.METERS_PER_SECOND_TO_MILES_PER_HOUR,
+    ),
+    (
+        VelocityConstants.KILOMETERS_PER_HOUR_TO_METERS_PER_SECOND,
+        1.0,
+        VelocityConstants.KILOMETERS_PER_HOUR_TO_MILES_PER_HOUR,
+    ),
+    (
+        VelocityConstants.MILES_PER_HOUR_TO_METERS_PER_SECOND,
+        VelocityConstants.MILES_PER_HOUR_TO_KILOMETERS_PER_HOUR,
+        1.0,
+    ),
+)
+
+
+def unit_code(unit: VelocityUnit) -> int:
+    return _CODE_OF_UNIT[unit]
+
+
+def conversion_factor(from_unit: VelocityUnit, to_unit: VelocityUnit) -> float:
+    return CONVERSION_MATRIX[_CODE_OF_UNIT[from_unit]][_CODE_OF_UNIT[to_unit]]
+
+
+def convert_speeds(
+    values: Sequence[float],
+    from_unit: VelocityUnit,
+    to_unit: VelocityUnit
+) -> array:
+    """Converts a whole column of speeds with a single factor lookup."""
+    factor = conversion_factor(from_unit, to_unit)
+    if factor == 1.0:
+        return array('d', values)
+    return array('d', [value * factor for value in values])
+
+
+def speeds_to_mps(values: Sequence[float], unit_codes: Sequence[int]) -> array:
+    """
+    Converts speeds given in mixed units to m/s. unit_codes holds, per value,
+    the position of its unit in UNIT_CODES.
+    """
+    if len(values) != len(unit_codes):
+        raise ValueError("values and unit_codes must have the same length.")
+
+    to_mps = [row[0] for row in CONVERSION_MATRIX]
+    return array(
+        'd', [value * to_mps[code] for value, code in zip(values, unit_codes)]
+    )
+
+
 @dataclass(frozen=True)
 class Velocity:
     """
@@ -32,13 +97,26 @@ class Velocity:
     """
     _value_mps: float
 
+    @classmethod
+    def zero(cls) -> Velocity:
+        """Returns the shared zero velocity instead of allocating a new one."""
+        return _ZERO_VELOCITY
+
     @classmethod
     def from_units(cls, value: float, unit: VelocityUnit) -> Velocity:
-        if unit == VelocityUnit.KPH:
-            value *= VelocityConstants.KILOMETERS_PER_HOUR_TO_METERS_PER_SECOND
-        elif unit == VelocityUnit.MPH:
-            value *= VelocityConstants.MILES_PER_HOUR_TO_METERS_PER_SECOND
-        return cls(value)
+        if unit is VelocityUnit.MPS:
+            return cls(value)
+        return cls(value * CONVERSION_MATRIX[_CODE_OF_UNIT[unit]][0])
+
+    @classmethod
+    def many_from_units(
+        cls,
+        values: Sequence[float],
+        units: Sequence[VelocityUnit]
+    ) -> list[Velocity]:
+        """Creates velocities from values that each come with their own unit."""
+        codes = [_CODE_OF_UNIT[unit] for unit in units]
+        return [cls(value) for value in speeds_to_mps(values, codes)]
 
     @property
     def value(self) -> float:
@@ -48,9 +126,13 @@ class Velocity:
         return self._value_mps
 
     def to_kph(self) -> float:
-        return (
-            self._value_mps * VelocityConstants.METERS_PER_SECOND_TO_KILOMETERS_PER_HOUR
-        )
+        return self._value_mps * CONVERSION_MATRIX[0][1]
 
     def to_mph(self) -> float:
-        return self._value_mps * VelocityConstants.METERS_PER_SECOND_TO_MILES_PER_HOUR
+        return self._value_mps * CONVERSION_MATRIX[0][2]
+
+    def to(self, unit: VelocityUnit) -> float:
+        return self._value_mps * CONVERSION_MATRIX[0][_CODE_OF_UNIT[unit]]
+
+
+_ZERO_VELOCITY = Velocity(0.0)
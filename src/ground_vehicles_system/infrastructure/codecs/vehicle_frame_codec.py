@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Sequence
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.infrastructure.errors.codec_errors import (
+    FrameDecodeError,
+    FrameEncodeError
+)
+
+LATITUDE_SCALE = 1_000_000
+LONGITUDE_SCALE = 1_000_000
+SPEED_SCALE = 100
+HEADING_SCALE = 100
+ODOMETER_SCALE = 100
+SECONDS_SCALE = 1000
+
+STATE_CODES: tuple[VehicleState, ...] = (
+    VehicleState.STOPPED,
+    VehicleState.DRIVING,
+    VehicleState.PARKING,
+    VehicleState.ACCIDENTED,
+)
+_CODE_OF_STATE = {state: code for code, state in enumerate(STATE_CODES)}
+
+_FIELDS = 7
+# Slot and deltas are at most 10 bytes each, plus the state byte.
+_MAX_RECORD_BYTES = (1 + _FIELDS) * 10 + 1
+_MAX_ID_HEADER_BYTES = 10
+# Enough for any zigzag delta between two int64 values.
+_MAX_VARINT_BYTES = 10
+# A one-byte slot and one byte per delta, plus the state byte.
+_MIN_RECORD_BYTES = 1 + _FIELDS + 1
+
+
+def _write_varint(buffer: bytearray, offset: int, value: int) -> int:
+    while value >= 0x80:
+        buffer[offset] = (value & 0x7F) | 0x80
+        value >>= 7
+        offset += 1
+    buffer[offset] = value
+    return offset + 1
+
+
+def _read_varint(data: memoryview, offset: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    end = offset + _MAX_VARINT_BYTES
+
+    while offset < end:
+        if offset >= len(data):
+            raise FrameDecodeError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+    raise FrameDecodeError(f"varint longer than {_MAX_VARINT_BYTES} bytes")
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+class FrameColumns:
+    """
+    Reusable column buffers a frame is decoded into.
+    Only the first `size` rows are valid; the arrays keep their capacity
+    between frames so decoding a frame of the same size doesn't reallocate.
+    """
+    def __init__(self) -> None:
+        self.size = 0
+        self.vehicle_ids: list[str] = []
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self.speeds_mps = array('d')
+        self.headings_degrees = array('d')
+        self.states: list[VehicleState] = []
+        self.odometers_meters = array('d')
+        self.driving_seconds = array('d')
+        self.idle_seconds = array('d')
+
+    def _reserve(self, rows: int) -> None:
+        missing = rows - len(self.latitudes)
+
+        if missing <= 0:
+            return
+
+        zeros = array('d', bytes(8 * missing))
+        self.vehicle_ids.extend([""] * missing)
+        self.latitudes.extend(zeros)
+        self.longitudes.extend(zeros)
+        self.speeds_mps.extend(zeros)
+        self.headings_degrees.extend(zeros)
+        self.states.extend([VehicleState.STOPPED] * missing)
+        self.odometers_meters.extend(zeros)
+        self.driving_seconds.extend(zeros)
+        self.idle_seconds.extend(zeros)
+
+
+class VehicleFrameEncoder:
+    """
+    Encodes fleet frames as deltas against the previously encoded frame.
+
+    A frame starts with a flag byte (1 for a keyframe, 0 for a delta frame)
+    and a varint record count. Each record holds:
+
+    - a varint slot number; a slot equal to the number of vehicles known so
+      far introduces a new vehicle and is followed by its varint-prefixed
+      UTF-8 id,
+    - zigzag varint deltas, against the previous frame of the same vehicle,
+      of latitude and longitude in micro-degrees, speed in cm/s, heading in
+      centi-degrees, odometer in centimeters, and driving and idle time in
+      milliseconds,
+    - one byte with the VehicleState code.
+
+    Encoder and decoder keep the previous quantized values per slot, so frames
+    must be decoded in the order they were encoded; a keyframe resets both.
+    Every row is quantized before any of that state changes, so a row that
+    can't be encoded raises FrameEncodeError and leaves the encoder in sync.
+    """
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._previous = array('q')
+
+    def reset(self) -> None:
+        self._slots = {}
+        self._previous = array('q')
+
+    def encode(
+        self,
+        vehicles: Iterable[Vehicle],
+        buffer: bytearray,
+        keyframe: bool = False,
+    ) -> int:
+        """
+        Encodes the vehicles into buffer, growing it only when too small.
+        Returns the number of bytes written from the start of the buffer.
+        """
+        vehicle_ids = []
+        latitudes = []
+        longitudes = []
+        speeds_mps = []
+        headings_degrees = []
+        states = []
+        odometers_meters = []
+        driving_seconds = []
+        idle_seconds = []
+
+        for vehicle in vehicles:
+            vehicle_ids.append(vehicle.vehicle_id)
+            latitudes.append(vehicle.coordinates.latitude)
+            longitudes.append(vehicle.coordinates.longitude)
+            speeds_mps.append(vehicle.velocity.to_mps())
+            headings_degrees.append(vehicle.heading.degrees)
+            states.append(vehicle.state)
+            odometers_meters.append(vehicle.odometer_meters)
+            driving_seconds.append(vehicle.driving_seconds)
+            idle_seconds.append(vehicle.idle_seconds)
+
+        return self.encode_columns(
+            vehicle_ids,
+            latitudes,
+            longitudes,
+            speeds_mps,
+            headings_degrees,
+            states,
+            odometers_meters,
+            driving_seconds,
+            idle_seconds,
+            buffer,
+            keyframe
+        )
+
+    def encode_columns(
+        self,
+        vehicle_ids: Sequence[str],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        speeds_mps: Sequence[float],
+        headings_degrees: Sequence[float],
+        states: Sequence[VehicleState],
+        odometers_meters: Sequence[float],
+        driving_seconds: Sequence[float],
+        idle_seconds: Sequence[float],
+        buffer: bytearray,
+        keyframe: bool = False,
+    ) -> int:
+        """Encodes a frame given as parallel columns; see encode."""
+        rows = len(vehicle_ids)
+        quantized = self._quantize(
+            vehicle_ids,
+            latitudes,
+            longitudes,
+            speeds_mps,
+            headings_degrees,
+            states,
+            odometers_meters,
+            driving_seconds,
+            idle_seconds,
+        )
+
+        if keyframe:
+            self.reset()
+
+        slots = self._slots
+        previous = self._previous
+
+        self._ensure(buffer, 0, 1 + _MAX_ID_HEADER_BYTES)
+        buffer[0] = 1 if keyframe else 0
+        offset = _write_varint(buffer, 1, rows)
+
+        for row in range(rows):
+            vehicle_id = vehicle_ids[row]
+            slot = slots.get(vehicle_id)
+
+            if slot is None:
+                encoded_id = vehicle_id.encode()
+                self._ensure(
+                    buffer,
+                    offset,
+                    _MAX_RECORD_BYTES + _MAX_ID_HEADER_BYTES + len(encoded_id)
+                )
+                slot = len(slots)
+                slots[vehicle_id] = slot
+                previous.extend((0,) * _FIELDS)
+                offset = _write_varint(buffer, offset, slot)
+                offset = _write_varint(buffer, offset, len(encoded_id))
+                buffer[offset:offset + len(encoded_id)] = encoded_id
+                offset += len(encoded_id)
+            else:
+                self._ensure(buffer, offset, _MAX_RECORD_BYTES)
+                offset = _write_varint(buffer, offset, slot)
+
+            base = slot * _FIELDS
+            (
+                latitude,
+                longitude,
+                speed,
+                heading,
+                odometer,
+                driving,
+                idle,
+            ) = quantized[row * _FIELDS:(row + 1) * _FIELDS]
+
+            offset = _write_varint(buffer, offset, _zigzag(latitude - previous[base]))
+            offset = _write_varint(
+                buffer, offset, _zigzag(longitude - previous[base + 1])
+            )
+            offset = _write_varint(buffer, offset, _zigzag(speed - previous[base + 2]))
+            offset = _write_varint(
+                buffer, offset, _zigzag(heading - previous[base + 3])
+            )
+            offset = _write_varint(
+                buffer, offset, _zigzag(odometer - previous[base + 4])
+            )
+            offset = _write_varint(
+                buffer, offset, _zigzag(driving - previous[base + 5])
+            )
+            offset = _write_varint(buffer, offset, _zigzag(idle - previous[base + 6]))
+            buffer[offset] = _CODE_OF_STATE[states[row]]
+            offset += 1
+
+            previous[base] = latitude
+            previous[base + 1] = longitude
+            previous[base + 2] = speed
+            previous[base + 3] = heading
+            previous[base + 4] = odometer
+            previous[base + 5] = driving
+            previous[base + 6] = idle
+
+        return offset
+
+    def _quantize(
+        self,
+        vehicle_ids: Sequence[str],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        speeds_mps: Sequence[float],
+        headings_degrees: Sequence[float],
+        states: Sequence[VehicleState],
+        odometers_meters: Sequence[float],
+        driving_seconds: Sequence[float],
+        idle_seconds: Sequence[float],
+    ) -> array:
+        """
+        Returns the quantized fields of every row, _FIELDS per row.
+        Raises FrameEncodeError on unknown states and on NaN, infinite or
+        int64-overflowing values.
+        """
+        quantized = array('q', bytes(8 * _FIELDS * len(vehicle_ids)))
+
+        for row in range(len(vehicle_ids)):
+            if states[row] not in _CODE_OF_STATE:
+                raise FrameEncodeError(
+                    f"vehicle {vehicle_ids[row]} has unknown state {states[row]}"
+                )
+
+            base = row * _FIELDS
+            try:
+                quantized[base] = round(latitudes[row] * LATITUDE_SCALE)
+                quantized[base + 1] = round(longitudes[row] * LONGITUDE_SCALE)
+                quantized[base + 2] = round(speeds_mps[row] * SPEED_SCALE)
+                quantized[base + 3] = round(headings_degrees[row] * HEADING_SCALE)
+                quantized[base + 4] = round(odometers_meters[row] * ODOMETER_SCALE)
+                quantized[base + 5] = round(driving_seconds[row] * SECONDS_SCALE)
+                quantized[base + 6] = round(idle_seconds[row] * SECONDS_SCALE)
+            except (OverflowError, ValueError) as error:
+                raise FrameEncodeError(
+                    f"vehicle {vehicle_ids[row]} has a value that can't be quantized"
+                ) from error
+
+        return quantized
+
+    def _ensure(self, buffer: bytearray, offset: int, needed: int) -> None:
+        missing = offset + needed - len(buffer)
+
+        if missing > 0:
+            # Grow geometrically so a reused buffer settles after a few frames.
+            buffer.extend(bytes(max(missing, len(buffer))))
+
+
+class VehicleFrameDecoder:
+    """Decodes frames produced by VehicleFrameEncoder, in the same order."""
+    def __init__(self) -> None:
+        self._vehicle_ids: list[str] = []
+        self._previous = array('q')
+
+    def reset(self) -> None:
+        self._vehicle_ids = []
+        self._previous = array('q')
+
+    def decode(
+        self,
+        data: bytes | bytearray | memoryview,
+        columns: FrameColumns | None = None,
+    ) -> FrameColumns:
+        """
+        Decodes one frame into columns, reusing the given buffers if any.
+        Raises FrameDecodeError on truncated frames, record counts the frame
+        can't hold, unknown slots, overlong varints or values overflowing
+        int64. A bad frame leaves the decoder in sync with the encoder: a
+        keyframe is decoded into fresh state that only replaces the current
+        one once it succeeds, and a delta frame logs the slots it touches so
+        they can be rolled back.
+        """
+        columns = columns if columns is not None else FrameColumns()
+        view = memoryview(data)
+
+        if len(view) == 0:
+            raise FrameDecodeError("empty frame")
+
+        keyframe = view[0] == 1
+        if keyframe:
+            vehicle_ids: list[str] = []
+            previous = array('q')
+        else:
+            vehicle_ids = self._vehicle_ids
+            previous = self._previous
+
+        known = len(vehicle_ids)
+        # Values of the known slots before this frame changed them.
+        saved: dict[int, array] = {}
+
+        try:
+            rows = self._decode_records(view, columns, vehicle_ids, previous, saved)
+        except (FrameDecodeError, OverflowError, UnicodeDecodeError) as error:
+            if not keyframe:
+                del vehicle_ids[known:]
+                del previous[known * _FIELDS:]
+                for base, values in saved.items():
+                    previous[base:base + _FIELDS] = values
+
+            if isinstance(error, FrameDecodeError):
+                raise
+            raise FrameDecodeError(
+                "value out of range"
+                if isinstance(error, OverflowError)
+                else "vehicle id is not UTF-8"
+            ) from None
+
+        self._vehicle_ids = vehicle_ids
+        self._previous = previous
+        columns.size = rows
+        return columns
+
+    def _decode_records(
+        self,
+        view: memoryview,
+        columns: FrameColumns,
+        vehicle_ids: list[str],
+        previous: array,
+        saved: dict[int, array],
+    ) -> int:
+        known_fields = len(previous)
+        rows, offset = _read_varint(view, 1)
+        if rows > (len(view) - offset) // _MIN_RECORD_BYTES:
+            raise FrameDecodeError(f"{rows} records don't fit in the frame")
+
+        columns._reserve(rows)
+
+        for row in range(rows):
+            slot, offset = _read_varint(view, offset)
+
+            if slot == len(vehicle_ids):
+                length, offset = _read_varint(view, offset)
+                if offset + length > len(view):
+                    raise FrameDecodeError("truncated vehicle id")
+                vehicle_ids.append(bytes(view[offset:offset + length]).decode())
+                previous.extend((0,) * _FIELDS)
+                offset += length
+            elif slot > len(vehicle_ids):
+                raise FrameDecodeError(f"unknown slot {slot}")
+
+            base = slot * _FIELDS
+            if base < known_fields and base not in saved:
+                saved[base] = previous[base:base + _FIELDS]
+
+            # Storing outside int64 raises OverflowError before any change.
+            delta, offset = _read_varint(view, offset)
+            previous[base] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 1] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 2] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 3] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 4] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 5] += _unzigzag(delta)
+            delta, offset = _read_varint(view, offset)
+            previous[base + 6] += _unzigzag(delta)
+
+            if offset >= len(view):
+                raise FrameDecodeError("truncated state")
+            state_code = view[offset]
+            offset += 1
+            if state_code >= len(STATE_CODES):
+                raise FrameDecodeError(f"unknown state code {state_code}")
+
+            columns.vehicle_ids[row] = vehicle_ids[slot]
+            columns.latitudes[row] = previous[base] / LATITUDE_SCALE
+            columns.longitudes[row] = previous[base + 1] / LONGITUDE_SCALE
+            columns.speeds_mps[row] = previous[base + 2] / SPEED_SCALE
+            columns.headings_degrees[row] = previous[base + 3] / HEADING_SCALE
+            columns.states[row] = STATE_CODES[state_code]
+            columns.odometers_meters[row] = previous[base + 4] / ODOMETER_SCALE
+            columns.driving_seconds[row] = previous[base + 5] / SECONDS_SCALE
+            columns.idle_seconds[row] = previous[base + 6] / SECONDS_SCALE
+
+        return rows
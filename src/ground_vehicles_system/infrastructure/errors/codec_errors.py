@@ -0,0 +1,11 @@
+class FrameDecodeError(ValueError):
+    """Raised when a vehicle frame is truncated or references unknown data."""
+    def __init__(self, reason: str) -> None:
+        self._message = f"Cannot decode vehicle frame: {reason}."
+        super().__init__(self._message)
+
+class FrameEncodeError(ValueError):
+    """Raised when a vehicle's values can't be quantized into a frame."""
+    def __init__(self, reason: str) -> None:
+        self._message = f"Cannot encode vehicle frame: {reason}."
+        super().__init__(self._message)
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.services.batch_validation import RejectionReason
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+DEFAULT_BATCH_ROWS = 65_536
+
+ODOMETRY_COLUMNS = ("odometer_meters", "driving_seconds", "idle_seconds")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet fleet IO; install the "
+            "'arrow' extra."
+        )
+
+
+def fleet_schema(include_odometry: bool = False) -> Any:
+    """Returns the Arrow schema of exported fleets."""
+    _require_pyarrow()
+    fields = [
+        pa.field("vehicle_id", pa.string(), nullable=False),
+        pa.field("latitude", pa.float64(), nullable=False),
+        pa.field("longitude", pa.float64(), nullable=False),
+        pa.field("speed_mps", pa.float64(), nullable=False),
+        pa.field("heading_degrees", pa.float64(), nullable=False),
+        pa.field("state", pa.string(), nullable=False),
+    ]
+
+    if include_odometry:
+        fields.extend(
+            pa.field(name, pa.float64(), nullable=False) for name in ODOMETRY_COLUMNS
+        )
+
+    return pa.schema(fields)
+
+
+def fleet_record_batches(
+    vehicles: Iterable[Vehicle],
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    include_odometry: bool = False,
+) -> Iterator[Any]:
+    """
+    Yields the vehicles as Arrow record batches of at most batch_rows rows.
+    Only one batch of columns is materialized at a time.
+    """
+    _require_pyarrow()
+    if batch_rows <= 0:
+        raise ValueError("batch_rows must be positive.")
+
+    schema = fleet_schema(include_odometry)
+    vehicles = iter(vehicles)
+
+    while chunk := list(islice(vehicles, batch_rows)):
+        columns = [
+            [vehicle.vehicle_id for vehicle in chunk],
+            [vehicle.coordinates.latitude for vehicle in chunk],
+            [vehicle.coordinates.longitude for vehicle in chunk],
+            [vehicle.velocity.to_mps() for vehicle in chunk],
+            [vehicle.heading.degrees for vehicle in chunk],
+            [vehicle.state.value for vehicle in chunk],
+        ]
+
+        if include_odometry:
+            columns.append([vehicle.odometer_meters for vehicle in chunk])
+            columns.append([vehicle.driving_seconds for vehicle in chunk])
+            columns.append([vehicle.idle_seconds for vehicle in chunk])
+
+        yield pa.RecordBatch.from_arrays(
+            [
+                pa.array(column, type=schema.field(index).type)
+                for index, column in enumerate(columns)
+            ],
+            schema=schema,
+        )
+
+
+def fleet_to_table(fleet: Fleet, include_odometry: bool = False) -> Any:
+    """Returns the whole fleet as one Arrow table."""
+    _require_pyarrow()
+    return pa.Table.from_batches(
+        fleet_record_batches(fleet, include_odometry=include_odometry),
+        schema=fleet_schema(include_odometry),
+    )
+
+
+def write_fleet_parquet(
+    fleet: Fleet,
+    path: str,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    include_odometry: bool = False,
+) -> None:
+    """Writes the fleet to a Parquet file, one row group per record batch."""
+    _require_pyarrow()
+    with pq.ParquetWriter(path, fleet_schema(include_odometry)) as writer:
+        for batch in fleet_record_batches(fleet, batch_rows, include_odometry):
+            writer.write_batch(batch)
+
+
+def write_fleet_ipc(
+    fleet: Fleet,
+    sink: Any,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    include_odometry: bool = False,
+) -> None:
+    """Writes the fleet to a path or file as an Arrow IPC stream."""
+    _require_pyarrow()
+    with pa.ipc.new_stream(sink, fleet_schema(include_odometry)) as writer:
+        for batch in fleet_record_batches(fleet, batch_rows, include_odometry):
+            writer.write_batch(batch)
+
+
+@dataclass
+class FleetImportReport:
+    """
+    Rows imported, the positions of the rows rejected, in input order, and
+    how many rows were rejected for each reason.
+    """
+    imported: int = 0
+    rejected_rows: list[int] = field(default_factory=list)
+    rejections: dict[RejectionReason, int] = field(default_factory=dict)
+
+
+class ArrowFleetImporter:
+    """
+    Adds vehicles read from Arrow record batches to a fleet.
+
+    Each batch is validated column-wise with Arrow compute kernels: latitude
+    and longitude ranges, finite non-negative speeds, finite headings,
+    known states and, when the odometry columns are present, finite
+    non-negative odometry. Rows failing any check are reported with the
+    RejectionReason of their first failed check and skipped, and the
+    remaining ones build their Coordinates without repeating validation.
+    A vehicle id already in the fleet, or repeated in the input, is
+    rejected the same way instead of raising DuplicateVehicleError, so the
+    rest of the input is still imported.
+    """
+    def __init__(self, fleet: Fleet) -> None:
+        _require_pyarrow()
+        self._fleet = fleet
+
+    def import_batches(self, batches: Iterable[Any]) -> FleetImportReport:
+        report = FleetImportReport()
+        offset = 0
+
+        for batch in batches:
+            self._import_batch(batch, offset, report)
+            offset += batch.num_rows
+
+        return report
+
+    def import_table(self, table: Any) -> FleetImportReport:
+        return self.import_batches(table.to_batches())
+
+    def import_parquet(
+        self,
+        path: str,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> FleetImportReport:
+        """Streams a Parquet file written by write_fleet_parquet."""
+        parquet_file = pq.ParquetFile(path)
+        return self.import_batches(parquet_file.iter_batches(batch_size=batch_rows))
+
+    def import_ipc(self, source: Any) -> FleetImportReport:
+        """Streams an Arrow IPC stream written by write_fleet_ipc."""
+        with pa.ipc.open_stream(source) as reader:
+            return self.import_batches(reader)
+
+    def _import_batch(
+        self,
+        batch: Any,
+        offset: int,
+        report: FleetImportReport
+    ) -> None:
+        reasons = self._rejection_reasons(batch).to_pylist()
+        vehicle_ids = batch.column("vehicle_id").to_pylist()
+        latitudes = batch.column("latitude").to_pylist()
+        longitudes = batch.column("longitude").to_pylist()
+        speeds = batch.column("speed_mps").to_pylist()
+        headings = batch.column("heading_degrees").to_pylist()
+        states = batch.column("state").to_pylist()
+
+        if all(name in batch.schema.names for name in ODOMETRY_COLUMNS):
+            odometers, driving, idle = (
+                batch.column(name).to_pylist() for name in ODOMETRY_COLUMNS
+            )
+        else:
+            odometers = driving = idle = [0.0] * len(vehicle_ids)
+
+        for row, vehicle_id in enumerate(vehicle_ids):
+            reason = reasons[row]
+            # Checked as rows are added, so this also catches ids repeated
+            # earlier in the same input.
+            if reason == RejectionReason.VALID and vehicle_id in self._fleet:
+                reason = RejectionReason.DUPLICATE_VEHICLE_ID
+
+            if reason != RejectionReason.VALID:
+                reason = RejectionReason(reason)
+                report.rejected_rows.append(offset + row)
+                report.rejections[reason] = report.rejections.get(reason, 0) + 1
+                continue
+
+            self._fleet.add(Vehicle(
+                vehicle_id,
+                Coordinates.from_validated(latitudes[row], longitudes[row]),
+                Velocity(speeds[row]),
+                Heading(headings[row] % 360),
+                VehicleState(states[row]),
+                odometers[row],
+                driving[row],
+                idle[row],
+            ))
+            report.imported += 1
+
+    def _rejection_reasons(self, batch: Any) -> Any:
+        """
+        Returns the RejectionReason code of the first failed check of every
+        row, as a uint8 array holding VALID for rows passing all of them.
+        """
+        latitude = batch.column("latitude")
+        longitude = batch.column("longitude")
+        speed = batch.column("speed_mps")
+        heading = batch.column("heading_degrees")
+        checks = [
+            (RejectionReason.INVALID_VEHICLE_ID, [
+                pc.is_valid(batch.column("vehicle_id")),
+            ]),
+            (RejectionReason.INVALID_LATITUDE, [
+                pc.greater_equal(latitude, -90.0),
+                pc.less_equal(latitude, 90.0),
+            ]),
+            (RejectionReason.INVALID_LONGITUDE, [
+                pc.greater_equal(longitude, -180.0),
+                pc.less_equal(longitude, 180.0),
+            ]),
+            (RejectionReason.INVALID_VELOCITY, [
+                pc.is_finite(speed),
+                pc.greater_equal(speed, 0.0),
+            ]),
+            (RejectionReason.INVALID_HEADING, [
+                pc.is_finite(heading),
+            ]),
+            (RejectionReason.INVALID_STATE, [
+                pc.is_in(
+                    batch.column("state"),
+                    value_set=pa.array([state.value for state in VehicleState]),
+                ),
+            ]),
+        ]
+
+        if all(name in batch.schema.names for name in ODOMETRY_COLUMNS):
+            odometry_checks = []
+            for name in ODOMETRY_COLUMNS:
+                column = batch.column(name)
+                odometry_checks.append(pc.is_finite(column))
+                odometry_checks.append(pc.greater_equal(column, 0.0))
+            checks.append((RejectionReason.INVALID_ODOMETRY, odometry_checks))
+
+        reasons = pa.repeat(pa.scalar(RejectionReason.VALID, pa.uint8()), len(batch))
+
+        # Applied last check first, so the first failed check of a row wins.
+        for reason, passed in reversed(checks):
+            valid = passed[0]
+            for check in passed[1:]:
+                valid = pc.and_kleene(valid, check)
+
+            # Nulls and NaNs compare as null or false; both reject the row.
+            failed = pc.invert(pc.fill_null(valid, False))
+            reasons = pc.if_else(
+                failed, pa.scalar(reason, pa.uint8()), reasons
+            )
+
+        return reasons
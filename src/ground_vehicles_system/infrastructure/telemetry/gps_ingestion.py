@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import socket
+import struct
+from typing import BinaryIO, Callable, Iterable
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.services.batch_validation import (
+    RejectionReason,
+    validate_fixes
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+BINARY_ID_BYTES = 32
+# id (null padded), latitude, longitude, speed in m/s and course in degrees.
+BINARY_FIX = struct.Struct(f"<{BINARY_ID_BYTES}sddff")
+
+_TEXT_BATCH_BYTES = 1 << 20
+
+
+def encode_binary_fix(
+    vehicle_id: str,
+    latitude: float,
+    longitude: float,
+    speed_mps: float,
+    course_degrees: float
+) -> bytes:
+    """
+    Packs one fix in the binary record format read by ingest_binary_stream.
+    Raises ValueError for ids that are empty or longer than BINARY_ID_BYTES
+    once UTF-8 encoded, which the record couldn't carry intact.
+    """
+    encoded_id = vehicle_id.encode()
+    if not encoded_id.rstrip(b"\0"):
+        raise ValueError("vehicle_id must not be empty.")
+    if len(encoded_id) > BINARY_ID_BYTES:
+        raise ValueError(
+            f"vehicle_id must be at most {BINARY_ID_BYTES} bytes once encoded."
+        )
+
+    return BINARY_FIX.pack(
+        encoded_id, latitude, longitude, speed_mps, course_degrees
+    )
+
+
+@dataclass
+class IngestionReport:
+    """Counters of one ingestion run; rejections break down invalid fixes."""
+    created: int = 0
+    updated: int = 0
+    malformed: int = 0
+    dropped: int = 0
+    rejections: dict[RejectionReason, int] = field(default_factory=dict)
+
+    @property
+    def accepted(self) -> int:
+        return self.created + self.updated
+
+
+class GpsTelemetryIngestor:
+    """
+    Upserts fleet vehicles from a feed of GPS fixes (id, lat, lon, speed, course).
+
+    Records are read in batches and applied in place to the vehicle with the
+    same id; unknown ids create new vehicles unless create_missing is False.
+    Each parsed batch is validated column-wise in one pass, so the value
+    objects are built without repeating validation, and no uuid is generated
+    since the feed provides the ids.
+
+    Records that can't be parsed are counted as malformed. Parsed records with
+    out-of-range or non-finite values, or for unknown vehicles when creation is
+    disabled, are counted as dropped.
+    """
+    def __init__(self, fleet: Fleet, create_missing: bool = True) -> None:
+        self._fleet = fleet
+        self._create_missing = create_missing
+
+    def ingest_lines(self, lines: Iterable[bytes | str]) -> IngestionReport:
+        """Ingests comma-separated `id,lat,lon,speed,course` lines."""
+        report = IngestionReport()
+        self._ingest_lines(lines, report)
+        return report
+
+    def ingest_text_stream(self, stream: BinaryIO) -> IngestionReport:
+        """
+        Ingests newline-delimited fixes from a file or pipe until EOF.
+        The complete lines of every read are applied at once, and a partial
+        last line waits for the next read.
+        """
+        report = IngestionReport()
+        read = _read_available(stream)
+        pending = b""
+
+        while True:
+            chunk = read(_TEXT_BATCH_BYTES)
+            if not chunk:
+                break
+
+            data = pending + chunk if pending else chunk
+            end = data.rfind(b"\n") + 1
+            pending = data[end:]
+            if end:
+                self._ingest_lines(data[:end].splitlines(), report)
+
+        if pending:
+            self._ingest_lines([pending], report)
+
+        return report
+
+    def ingest_binary_stream(
+        self,
+        stream: BinaryIO,
+        batch_records: int = 8192
+    ) -> IngestionReport:
+        """
+        Ingests fixed-size binary records (see BINARY_FIX) until EOF.
+        The whole records of every read, up to batch_records, are applied at
+        once, and a partial record waits for the next read. Records with an
+        empty id and a trailing partial record are counted as malformed.
+        """
+        report = IngestionReport()
+        read = _read_available(stream)
+        batch_bytes = BINARY_FIX.size * batch_records
+        pending = b""
+
+        while True:
+            chunk = read(batch_bytes)
+            if not chunk:
+                break
+
+            data = pending + chunk if pending else chunk
+            usable = len(data) - len(data) % BINARY_FIX.size
+            pending = data[usable:]
+            batch = _FixColumns()
+
+            for raw_id, latitude, longitude, speed, course in BINARY_FIX.iter_unpack(
+                memoryview(data)[:usable]
+            ):
+                try:
+                    vehicle_id = raw_id.rstrip(b"\0").decode()
+                except UnicodeDecodeError:
+                    report.malformed += 1
+                    continue
+                if not vehicle_id:
+                    report.malformed += 1
+                    continue
+                batch.append(vehicle_id, latitude, longitude, speed, course)
+
+            self._upsert_batch(batch, report)
+
+        if pending:
+            report.malformed += 1
+
+        return report
+
+    def ingest_socket(
+        self,
+        connection: socket.socket,
+        binary: bool = False
+    ) -> IngestionReport:
+        """
+        Ingests from a connected socket until the peer closes it. Fixes are
+        applied as soon as whole records arrive, so a low-rate live feed
+        isn't held back until a full batch has been received.
+        """
+        with connection.makefile("rb") as stream:
+            if binary:
+                return self.ingest_binary_stream(stream)
+            return self.ingest_text_stream(stream)
+
+    def _ingest_lines(
+        self,
+        lines: Iterable[bytes | str],
+        report: IngestionReport
+    ) -> None:
+        batch = _FixColumns()
+
+        for line in lines:
+            if isinstance(line, bytes):
+                try:
+                    line = line.decode()
+                except UnicodeDecodeError:
+                    report.malformed += 1
+                    continue
+
+            fields = line.split(",")
+
+            if len(fields) != 5:
+                if line.strip():
+                    report.malformed += 1
+                continue
+
+            try:
+                latitude = float(fields[1])
+                longitude = float(fields[2])
+                speed = float(fields[3])
+                course = float(fields[4])
+            except ValueError:
+                report.malformed += 1
+                continue
+
+            vehicle_id = fields[0].strip()
+            if not vehicle_id:
+                report.malformed += 1
+                continue
+
+            batch.append(vehicle_id, latitude, longitude, speed, course)
+
+        self._upsert_batch(batch, report)
+
+    def _upsert_batch(self, batch: _FixColumns, report: IngestionReport) -> None:
+        validation = validate_fixes(
+            batch.latitudes, batch.longitudes, batch.speeds, batch.courses
+        )
+        report.dropped += len(validation) - validation.valid_count
+
+        for reason, count in validation.counts().items():
+            report.rejections[reason] = report.rejections.get(reason, 0) + count
+
+        for row, valid in enumerate(validation.mask):
+            if valid:
+                self._upsert(
+                    batch.vehicle_ids[row],
+                    batch.latitudes[row],
+                    batch.longitudes[row],
+                    batch.speeds[row],
+                    batch.courses[row],
+                    report
+                )
+
+    def _upsert(
+        self,
+        vehicle_id: str,
+        latitude: float,
+        longitude: float,
+        speed: float,
+        course: float,
+        report: IngestionReport
+    ) -> None:
+        coordinates = Coordinates.from_validated(latitude, longitude)
+        velocity = Velocity(speed)
+        heading = Heading(course % 360)
+        vehicle = self._fleet.find(vehicle_id)
+
+        if vehicle is not None:
+            vehicle.update_from_telemetry(coordinates, velocity, heading)
+            report.updated += 1
+        elif self._create_missing:
+            state = VehicleState.DRIVING if speed > 0 else VehicleState.STOPPED
+            self._fleet.add(
+                Vehicle(vehicle_id, coordinates, velocity, heading, state)
+            )
+            report.created += 1
+        else:
+            report.dropped += 1
+
+
+class _FixColumns:
+    """Parsed fixes of one batch, as parallel columns."""
+    def __init__(self) -> None:
+        self.vehicle_ids: list[str] = []
+        self.latitudes: list[float] = []
+        self.longitudes: list[float] = []
+        self.speeds: list[float] = []
+        self.courses: list[float] = []
+
+    def append(
+        self,
+        vehicle_id: str,
+        latitude: float,
+        longitude: float,
+        speed: float,
+        course: float
+    ) -> None:
+        self.vehicle_ids.append(vehicle_id)
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+        self.speeds.append(speed)
+        self.courses.append(course)
+
+
+def _read_available(stream: BinaryIO) -> Callable[[int], bytes]:
+    """
+    Returns the stream's read1 when it has one. Unlike read, it returns the
+    bytes already buffered or received instead of blocking until the whole
+    size has arrived.
+    """
+    return getattr(stream, "read1", stream.read)
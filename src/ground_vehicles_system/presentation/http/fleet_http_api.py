@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import math
+from typing import Any, Callable, Iterable, Iterator, Sequence
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ground_vehicles_system.application.services.fleet_queries import (
+    FleetQueryIndex,
+    VehiclePage
+)
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+
+DEFAULT_LIMIT = 1_000
+MAX_LIMIT = 100_000
+# Vehicles fetched from the indexes, and written, per body chunk.
+STREAM_PAGE_SIZE = 500
+
+PageFetcher = Callable[[str | None, int], VehiclePage]
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A response whose body is produced lazily, one chunk at a time."""
+    status: int
+    body: Iterable[bytes]
+    content_type: str = "application/json"
+
+    @classmethod
+    def json(cls, status: int, payload: Any) -> HttpResponse:
+        return cls(status, (json.dumps(payload).encode(),))
+
+    @classmethod
+    def error(cls, status: int, message: str) -> HttpResponse:
+        return cls.json(status, {"error": message})
+
+
+def vehicle_to_json(vehicle: Vehicle) -> dict[str, Any]:
+    return {
+        "vehicle_id": vehicle.vehicle_id,
+        "latitude": vehicle.coordinates.latitude,
+        "longitude": vehicle.coordinates.longitude,
+        "speed_mps": vehicle.velocity.to_mps(),
+        "heading_degrees": vehicle.heading.degrees,
+        "state": vehicle.state.value,
+    }
+
+
+class FleetHttpApi:
+    """
+    Routes GET requests to the fleet query indexes.
+
+    - `/vehicles/{id}` returns one vehicle.
+    - `/vehicles` lists vehicles in pages of `limit`, resuming after the
+      `after` cursor of the previous page. It is filtered by one of `state`,
+      `bbox=min_lat,min_lon,max_lat,max_lon` or `near=lat,lon&radius_m=r`.
+
+    Listings are streamed: the indexes are read STREAM_PAGE_SIZE vehicles at
+    a time while the body is written, so a large page is never held in memory
+    as a whole.
+    """
+    def __init__(self, queries: FleetQueryIndex) -> None:
+        self._queries = queries
+
+    def handle(self, method: str, target: str) -> HttpResponse:
+        if method != "GET":
+            return HttpResponse.error(405, f"Method {method} is not allowed.")
+
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+
+        try:
+            if path == "/vehicles":
+                return self._list(parse_qs(url.query))
+            if path.startswith("/vehicles/"):
+                vehicle_id = unquote(path[len("/vehicles/"):])
+                return HttpResponse.json(
+                    200, vehicle_to_json(self._queries.get(vehicle_id))
+                )
+        except VehicleNotFoundError as error:
+            return HttpResponse.error(404, str(error))
+        except ValueError as error:
+            return HttpResponse.error(400, str(error))
+
+        return HttpResponse.error(404, f"No route for {url.path}.")
+
+    def _list(self, query: dict[str, list[str]]) -> HttpResponse:
+        after = _single(query, "after")
+        limit = int(_single(query, "limit") or DEFAULT_LIMIT)
+        if not 0 < limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}.")
+
+        state = _single(query, "state")
+        bbox = _single(query, "bbox")
+        near = _single(query, "near")
+        if sum(value is not None for value in (state, bbox, near)) > 1:
+            raise ValueError("Use only one of state, bbox and near.")
+
+        fetch: PageFetcher
+        if bbox is not None:
+            box = bounding_box_of(_floats(bbox, 4, "bbox"))
+
+            def fetch(after: str | None, limit: int) -> VehiclePage:
+                return self._queries.page_in_box(box, after, limit)
+        elif near is not None:
+            latitude, longitude = _floats(near, 2, "near")
+            Coordinates(latitude, longitude)
+            radius = float(_single(query, "radius_m") or "nan")
+            if not 0 <= radius < math.inf:
+                raise ValueError("near needs a finite, non-negative radius_m.")
+
+            def fetch(after: str | None, limit: int) -> VehiclePage:
+                return self._queries.page_within_radius(
+                    latitude, longitude, radius, after, limit
+                )
+        else:
+            vehicle_state = VehicleState(state) if state is not None else None
+
+            def fetch(after: str | None, limit: int) -> VehiclePage:
+                return self._queries.page(vehicle_state, after, limit)
+
+        # The first page is read eagerly so bad cursors still become a 400.
+        first = fetch(after, min(limit, STREAM_PAGE_SIZE))
+        return HttpResponse(200, _stream_pages(fetch, first, limit))
+
+
+def bounding_box_of(bounds: Sequence[float]) -> BoundingBox:
+    """
+    Builds the box of a client's min_lat, min_lon, max_lat, max_lon bounds,
+    rejecting NaN, infinite and out-of-range ones with a ValueError before
+    they reach the grid indexes.
+    """
+    if len(bounds) != 4:
+        raise ValueError("A bounding box needs 4 bounds.")
+
+    min_latitude, min_longitude, max_latitude, max_longitude = bounds
+    Coordinates(min_latitude, min_longitude)
+    Coordinates(max_latitude, max_longitude)
+    return BoundingBox(min_latitude, min_longitude, max_latitude, max_longitude)
+
+
+def _stream_pages(
+    fetch: PageFetcher,
+    page: VehiclePage,
+    limit: int,
+) -> Iterator[bytes]:
+    yield b'{"vehicles":['
+    remaining = limit
+    separator = b""
+
+    while True:
+        if page.vehicles:
+            yield separator + b",".join(
+                json.dumps(vehicle_to_json(vehicle)).encode()
+                for vehicle in page.vehicles
+            )
+            separator = b","
+
+        remaining -= len(page.vehicles)
+        if page.next_cursor is None or remaining == 0:
+            break
+
+        try:
+            page = fetch(page.next_cursor, min(remaining, STREAM_PAGE_SIZE))
+        except VehicleNotFoundError as error:
+            # The status line is already sent, so the body ends with what was
+            # written, the cursor to resume from and the error.
+            yield (
+                b'],"next_cursor":' + json.dumps(page.next_cursor).encode()
+                + b',"error":' + json.dumps(str(error)).encode() + b"}"
+            )
+            return
+
+    yield b'],"next_cursor":' + json.dumps(page.next_cursor).encode() + b"}"
+
+
+def _single(query: dict[str, list[str]], name: str) -> str | None:
+    values = query.get(name)
+    return values[-1] if values else None
+
+
+def _floats(value: str, count: int, name: str) -> list[float]:
+    numbers = [float(part) for part in value.split(",")]
+    if len(numbers) != count:
+        raise ValueError(f"{name} needs {count} comma-separated numbers.")
+    return numbers
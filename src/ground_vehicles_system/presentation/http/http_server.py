@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+import logging
+
+from ground_vehicles_system.presentation.http.fleet_http_api import (
+    FleetHttpApi,
+    HttpResponse
+)
+
+_logger = logging.getLogger(__name__)
+
+_MAX_HEADERS = 100
+
+
+class HttpServer:
+    """
+    Minimal asyncio HTTP/1.1 server for a FleetHttpApi.
+    It answers one request per connection and sends every body with chunked
+    transfer encoding, waiting for the socket to drain after each chunk so a
+    slow reader holds back the producer instead of growing a buffer. A body
+    that fails midway is logged and the connection closed without the final
+    chunk, so the client can tell the response is incomplete.
+    """
+    def __init__(
+        self,
+        api: FleetHttpApi,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> None:
+        self._api = api
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The bound host and port, useful when started on port 0."""
+        if self._server is None:
+            raise RuntimeError("The server is not started.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._serve_connection, self._host, self._port
+        )
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> HttpServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _serve_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            response = await self._read_request(reader)
+            await self._write_response(writer, response)
+        except ConnectionError:
+            _logger.info("HTTP client disconnected before the response ended.")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> HttpResponse:
+        request_line = (await reader.readline()).decode("latin-1").split()
+
+        for _ in range(_MAX_HEADERS):
+            if (await reader.readline()) in (b"\r\n", b"\n", b""):
+                break
+        else:
+            return HttpResponse.error(431, "Too many headers.")
+
+        if len(request_line) != 3 or not request_line[2].startswith("HTTP/"):
+            return HttpResponse.error(400, "Malformed request line.")
+
+        method, target, _ = request_line
+        return self._api.handle(method, target)
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        response: HttpResponse
+    ) -> None:
+        writer.write(
+            f"HTTP/1.1 {response.status} {HTTPStatus(response.status).phrase}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "Connection: close\r\n"
+            "\r\n".encode("latin-1")
+        )
+
+        body = iter(response.body)
+
+        while True:
+            try:
+                chunk = next(body, None)
+            except Exception:
+                # Without the final chunk the client sees a truncated body
+                # instead of a complete one.
+                _logger.exception("HTTP response body failed midway.")
+                return
+            if chunk is None:
+                break
+            if chunk:
+                writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+                await writer.drain()
+
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import json
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ClientResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    chunk_count: int
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class LocalHttpClient:
+    """
+    Small HTTP/1.1 client for talking to an HttpServer in tests and scripts.
+    It understands exactly what the server sends: one response per connection
+    with a chunked body.
+    """
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+
+    async def get(self, target: str) -> ClientResponse:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+
+        try:
+            writer.write(
+                f"GET {target} HTTP/1.1\r\n"
+                f"Host: {self._host}:{self._port}\r\n"
+                "Connection: close\r\n"
+                "\r\n".encode("latin-1")
+            )
+            await writer.drain()
+            return await self._read_response(reader)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> ClientResponse:
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = bytearray()
+        chunk_count = 0
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("The response ended before its last chunk.")
+            size = int(line.strip(), 16)
+            if size == 0:
+                await reader.readline()
+                break
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+            chunk_count += 1
+
+        return ClientResponse(status, headers, bytes(body), chunk_count)
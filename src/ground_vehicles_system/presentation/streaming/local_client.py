@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+
+class LocalStreamClient:
+    """
+    Small client for a SubscriptionServer, for tests and scripts.
+    Messages are returned as the decoded JSON objects the server sent.
+    """
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(
+            self._host, self._port
+        )
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._reader = self._writer = None
+
+    async def __aenter__(self) -> LocalStreamClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def subscribe(self, box: BoundingBox, rate_hz: float = 1.0) -> None:
+        """Subscribes to a viewport, or moves the current one."""
+        if self._writer is None:
+            raise RuntimeError("The client is not connected.")
+
+        message = {
+            "bbox": [
+                box.min_latitude,
+                box.min_longitude,
+                box.max_latitude,
+                box.max_longitude,
+            ],
+            "rate_hz": rate_hz,
+        }
+        self._writer.write(json.dumps(message).encode() + b"\n")
+        await self._writer.drain()
+
+    async def receive(self, timeout: float | None = None) -> dict[str, Any]:
+        """Waits for the next message; raises EOFError if the server closed."""
+        if self._reader is None:
+            raise RuntimeError("The client is not connected.")
+
+        line = await asyncio.wait_for(self._reader.readline(), timeout)
+        if not line:
+            raise EOFError("The server closed the stream.")
+        return json.loads(line)
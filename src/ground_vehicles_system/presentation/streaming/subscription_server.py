@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+from typing import Any
+
+from ground_vehicles_system.application.services.viewport_fanout import (
+    ViewportFanout,
+    ViewportSubscription
+)
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.presentation.http.fleet_http_api import (
+    bounding_box_of,
+    vehicle_to_json
+)
+
+_logger = logging.getLogger(__name__)
+
+# Faster requested rates are lowered to this one.
+MAX_RATE_HZ = 30.0
+
+
+def parse_viewport(line: bytes) -> tuple[BoundingBox, float]:
+    """
+    Parses a client message `{"bbox": [min_lat, min_lon, max_lat, max_lon],
+    "rate_hz": 5}`. Raises ValueError when it is malformed, when a bound is
+    not a finite latitude or longitude, or when rate_hz is not finite and
+    positive. Rates above MAX_RATE_HZ are lowered to it.
+    """
+    try:
+        message = json.loads(line)
+        box = bounding_box_of([float(value) for value in message["bbox"]])
+        rate_hz = float(message.get("rate_hz", 1.0))
+    except (AttributeError, KeyError, TypeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Malformed subscription: {error}") from None
+
+    if not 0 < rate_hz < math.inf:
+        raise ValueError("rate_hz must be finite and positive.")
+    return box, min(rate_hz, MAX_RATE_HZ)
+
+
+class SubscriptionServer:
+    """
+    Streams vehicle changes to map clients as newline-delimited JSON.
+
+    A client subscribes by sending a viewport message (see parse_viewport),
+    and may send another one at any time to move its viewport. The server
+    then sends at most one batch per update interval, made of
+    `{"type": "update", "vehicle": {...}}` and
+    `{"type": "remove", "vehicle_id": "..."}` lines. Changes coalesce in the
+    subscription until the client has drained the previous batch, so a slow
+    client receives fewer, fresher updates instead of a growing backlog.
+    """
+    def __init__(
+        self,
+        fanout: ViewportFanout,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> None:
+        self._fanout = fanout
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The bound host and port, useful when started on port 0."""
+        if self._server is None:
+            raise RuntimeError("The server is not started.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._serve_client, self._host, self._port
+        )
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> SubscriptionServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _serve_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        subscription: ViewportSubscription | None = None
+        sender: asyncio.Task | None = None
+
+        try:
+            while line := await reader.readline():
+                try:
+                    box, rate_hz = parse_viewport(line)
+
+                    if subscription is None:
+                        subscription = self._fanout.subscribe(box, rate_hz)
+                        sender = asyncio.create_task(
+                            self._send_updates(subscription, writer)
+                        )
+                    else:
+                        self._fanout.move_viewport(subscription, box)
+                except ValueError as error:
+                    await self._send(
+                        writer, [{"type": "error", "message": str(error)}]
+                    )
+        except ConnectionError:
+            pass
+        finally:
+            if sender is not None:
+                sender.cancel()
+            if subscription is not None:
+                self._fanout.unsubscribe(subscription)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _send_updates(
+        self,
+        subscription: ViewportSubscription,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                if subscription.has_pending():
+                    await self._send(writer, [
+                        {"type": "update", "vehicle": vehicle_to_json(vehicle)}
+                        if vehicle is not None
+                        else {"type": "remove", "vehicle_id": vehicle_id}
+                        for vehicle_id, vehicle in subscription.drain().items()
+                    ])
+                await asyncio.sleep(subscription.update_interval_seconds)
+        except ConnectionError:
+            _logger.info(
+                f"Subscription {subscription.subscription_id} lost its client."
+            )
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        messages: list[dict[str, Any]]
+    ) -> None:
+        writer.write(b"".join(
+            json.dumps(message).encode() + b"\n" for message in messages
+        ))
+        await writer.drain()
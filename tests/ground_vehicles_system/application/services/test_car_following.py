@@ -0,0 +1,152 @@
+import pytest
+
+from ground_vehicles_system.application.services.car_following import (
+    CarFollowingModel,
+    IdmParameters
+)
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.errors.vehicle_errors import CrashedVehicleError
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+METERS = 1 / GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+
+
+def _vehicle(
+    vehicle_id: str,
+    north_meters: float,
+    speed_mps: float,
+    heading_degrees: float = 0.0
+) -> Vehicle:
+    latitude = north_meters / GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+    return Vehicle.create(
+        Coordinates(latitude, 0.0),
+        Velocity(speed_mps),
+        vehicle_id=vehicle_id,
+        heading=Heading(heading_degrees),
+    )
+
+
+class TestCarFollowingModel:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            _vehicle("leader", 100.0, 20.0),
+            _vehicle("middle", 60.0, 20.0),
+            _vehicle("tail", 20.0, 20.0),
+            _vehicle("oncoming", 80.0, 20.0, heading_degrees=180.0),
+        ])
+
+    def test_link_when_loop_then_raises_exception(self, fleet: Fleet) -> None:
+        model = CarFollowingModel(fleet)
+        model.link("tail", "middle")
+        model.link("middle", "leader")
+
+        with pytest.raises(ValueError):
+            model.link("leader", "tail")
+
+    def test_link_when_unknown_vehicle_then_raises_exception(
+        self,
+        fleet: Fleet
+    ) -> None:
+        model = CarFollowingModel(fleet)
+
+        with pytest.raises(VehicleNotFoundError):
+            model.link("tail", "ghost")
+
+    def test_link_nearest_leaders_when_convoy_then_links_vehicle_ahead(
+        self,
+        fleet: Fleet
+    ) -> None:
+        model = CarFollowingModel(fleet)
+
+        linked = model.link_nearest_leaders(["leader", "middle", "tail"])
+
+        assert linked == 2
+        assert model.leader_of("tail") == "middle"
+        assert model.leader_of("middle") == "leader"
+        assert model.leader_of("leader") is None
+
+    def test_link_nearest_leaders_when_at_pole_then_bounded_search(self) -> None:
+        fleet = Fleet.create([
+            Vehicle.create(
+                Coordinates(90.0 - 50.0 * METERS, 0.0),
+                Velocity(10.0),
+                vehicle_id="leader",
+                heading=Heading(180.0),
+            ),
+            Vehicle.create(
+                Coordinates(90.0, 0.0),
+                Velocity(10.0),
+                vehicle_id="follower",
+                heading=Heading(180.0),
+            ),
+        ])
+        model = CarFollowingModel(fleet)
+
+        linked = model.link_nearest_leaders(["follower"])
+
+        assert linked == 1
+        assert model.leader_of("follower") == "leader"
+
+    def test_accelerations_when_gap_too_small_then_brakes(self) -> None:
+        fleet = Fleet.create([
+            _vehicle("leader", 15.0, 0.0),
+            _vehicle("follower", 0.0, 15.0),
+        ])
+        model = CarFollowingModel(fleet)
+        model.link("follower", "leader")
+
+        follower_ids, accelerations = model.accelerations()
+
+        assert follower_ids == ["follower"]
+        assert accelerations[0] == -IdmParameters().max_deceleration_mps2
+
+    def test_accelerations_when_leader_far_ahead_then_free_road_acceleration(
+        self
+    ) -> None:
+        fleet = Fleet.create([
+            _vehicle("leader", 5_000.0, 0.0),
+            _vehicle("follower", 0.0, 0.0),
+        ])
+        model = CarFollowingModel(fleet)
+        model.link("follower", "leader")
+
+        _, accelerations = model.accelerations()
+
+        assert accelerations[0] == pytest.approx(1.0, abs=1e-3)
+
+    def test_step_when_following_then_applies_through_vehicle_rules(self) -> None:
+        fleet = Fleet.create([
+            _vehicle("leader", 5_000.0, 0.0),
+            _vehicle("follower", 0.0, 0.0),
+        ])
+        model = CarFollowingModel(fleet)
+        model.link("follower", "leader")
+
+        report = model.step(2.0)
+
+        follower = fleet.get("follower")
+        assert report.followers == 1
+        assert follower.velocity.to_mps() == pytest.approx(2.0, abs=1e-2)
+        assert follower.state == VehicleState.DRIVING
+
+    def test_step_when_follower_accidented_then_rejected(self) -> None:
+        fleet = Fleet.create([
+            _vehicle("leader", 5_000.0, 0.0),
+            _vehicle("follower", 0.0, 10.0),
+        ])
+        with pytest.raises(CrashedVehicleError):
+            fleet.get("follower").move(
+                1.0, obstacle_found=True, will_hit_obstacle=True
+            )
+        model = CarFollowingModel(fleet)
+        model.link("follower", "leader")
+
+        report = model.step(1.0)
+
+        assert report.rejected == ("follower",)
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from ground_vehicles_system.application.services.concurrent_vehicle_commands import (
+    ConcurrentVehicleCommands,
+    LockStripes
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.errors.vehicle_errors import (
+    CannotChangeVelocityOfAccidentedVehicle,
+    CrashedVehicleError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class TestLockStripes:
+    def test_init_when_stripes_not_positive_then_raises_exception(self) -> None:
+        with pytest.raises(ValueError):
+            LockStripes(0)
+
+    def test_lock_for_when_same_vehicle_id_then_same_lock(self) -> None:
+        stripes = LockStripes(8)
+
+        assert stripes.lock_for("vehicle_1") is stripes.lock_for("vehicle_1")
+
+
+class TestConcurrentVehicleCommands:
+    @pytest.fixture
+    def vehicle(self) -> Vehicle:
+        return Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(34.0522, -118.2437),
+            velocity=Velocity(10.0),
+            heading=Heading(90.0),
+            state=VehicleState.DRIVING
+        )
+
+    @pytest.fixture
+    def commands(self, vehicle: Vehicle) -> ConcurrentVehicleCommands:
+        return ConcurrentVehicleCommands(Fleet.create([vehicle]), stripes=4)
+
+    def test_locked_when_unknown_vehicle_then_raises_exception(
+        self,
+        commands: ConcurrentVehicleCommands
+    ) -> None:
+        with pytest.raises(VehicleNotFoundError):
+            with commands.locked("vehicle_2"):
+                pass
+
+    def test_accelerate_when_many_threads_then_no_update_is_lost(
+        self,
+        commands: ConcurrentVehicleCommands,
+        vehicle: Vehicle
+    ) -> None:
+        def accelerate() -> None:
+            for _ in range(200):
+                commands.accelerate("vehicle_1", 1.0, VelocityUnit.MPS)
+
+        threads = [threading.Thread(target=accelerate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected_velocity = 10.0 + 8 * 200
+        assert vehicle.velocity.to_mps() == expected_velocity
+
+    def test_accelerate_when_vehicle_crashed_then_state_stays_accidented(
+        self,
+        commands: ConcurrentVehicleCommands,
+        vehicle: Vehicle
+    ) -> None:
+        with pytest.raises(CrashedVehicleError):
+            commands.move("vehicle_1", 1.0, True, True)
+
+        with pytest.raises(CannotChangeVelocityOfAccidentedVehicle):
+            commands.accelerate("vehicle_1", 5.0, VelocityUnit.MPS)
+
+        assert vehicle.state == VehicleState.ACCIDENTED
+
+    def test_commands_when_called_then_delegate_to_vehicle(
+        self,
+        commands: ConcurrentVehicleCommands,
+        vehicle: Vehicle
+    ) -> None:
+        commands.decelerate("vehicle_1", 2.0, VelocityUnit.MPS)
+        commands.brake("vehicle_1", 3.0, VelocityUnit.MPS)
+        commands.turn("vehicle_1", 90.0)
+        commands.move("vehicle_1", 1.0, False, False)
+
+        assert vehicle.velocity.to_mps() == 5.0
+        assert vehicle.heading == Heading(180.0)
+
+        commands.brake_to_a_stop("vehicle_1")
+        assert vehicle.state == VehicleState.STOPPED
+
+        commands.accelerate("vehicle_1", 5.0, VelocityUnit.MPS)
+        commands.stop_engine("vehicle_1")
+        assert vehicle.velocity.to_mps() == 0.0
@@ -0,0 +1,111 @@
+import pytest
+
+from ground_vehicles_system.application.services.dispatch import (
+    DispatchEngine,
+    DispatchRequest
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class TestDispatchEngine:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            Vehicle.create(
+                Coordinates(34.0, -118.0 + index * 0.001),
+                Velocity(0.0),
+                vehicle_id=f"vehicle_{index}",
+            )
+            for index in range(5)
+        ])
+
+    def test_dispatch_when_requests_then_nearest_vehicles_assigned(
+        self,
+        fleet: Fleet
+    ) -> None:
+        engine = DispatchEngine(fleet)
+
+        result = engine.dispatch([
+            DispatchRequest("request_1", 34.0, -118.0),
+            DispatchRequest("request_2", 34.0, -117.996),
+        ])
+
+        assert {
+            assignment.request_id: assignment.vehicle_id
+            for assignment in result.assignments
+        } == {"request_1": "vehicle_0", "request_2": "vehicle_4"}
+        assert result.unassigned == []
+        assert engine.is_busy("vehicle_0")
+        assert engine.available_count == 3
+
+    def test_dispatch_when_small_batch_then_minimizes_total_distance(
+        self
+    ) -> None:
+        fleet = Fleet.create([
+            Vehicle.create(
+                Coordinates(0.0, 0.0), Velocity(0.0), vehicle_id="vehicle_0"
+            ),
+            Vehicle.create(
+                Coordinates(0.0, 0.001), Velocity(0.0), vehicle_id="vehicle_1"
+            ),
+        ])
+        # Cheapest pair first would give vehicle_1 to request_1 and send
+        # vehicle_0 all the way to request_2.
+        requests = [
+            DispatchRequest("request_1", 0.0, 0.0006),
+            DispatchRequest("request_2", 0.0, 0.0015),
+        ]
+
+        optimal = DispatchEngine(fleet).dispatch(requests)
+
+        assert [assignment.vehicle_id for assignment in optimal.assignments] == [
+            "vehicle_0",
+            "vehicle_1",
+        ]
+
+    def test_dispatch_when_large_batch_then_greedy_assigns_all(
+        self,
+        fleet: Fleet
+    ) -> None:
+        engine = DispatchEngine(fleet, optimal_batch_limit=1)
+
+        result = engine.dispatch([
+            DispatchRequest(f"request_{index}", 34.0, -118.0) for index in range(6)
+        ])
+
+        assert len(result.assignments) == 5
+        assert len(result.unassigned) == 1
+        assert result.assignments[0].vehicle_id == "vehicle_0"
+
+    def test_dispatch_when_beyond_max_pickup_then_unassigned(
+        self,
+        fleet: Fleet
+    ) -> None:
+        engine = DispatchEngine(fleet, max_pickup_meters=100.0)
+
+        result = engine.dispatch([DispatchRequest("request_1", 35.0, -118.0)])
+
+        assert result.unassigned == ["request_1"]
+
+    def test_complete_when_busy_then_available_again(self, fleet: Fleet) -> None:
+        engine = DispatchEngine(fleet)
+        engine.dispatch([DispatchRequest("request_1", 34.0, -118.0)])
+
+        engine.complete("vehicle_0")
+
+        assert not engine.is_busy("vehicle_0")
+        assert engine.available_count == 5
+
+    def test_on_state_changed_when_parked_then_not_dispatchable(
+        self,
+        fleet: Fleet
+    ) -> None:
+        engine = DispatchEngine(fleet)
+
+        fleet.get("vehicle_0").park()
+
+        result = engine.dispatch([DispatchRequest("request_1", 34.0, -118.0)])
+        assert result.assignments[0].vehicle_id == "vehicle_1"
@@ -0,0 +1,112 @@
+import pytest
+
+from ground_vehicles_system.application.services.fleet_queries import (
+    FleetQueryIndex
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class TestFleetQueryIndex:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create(
+            Vehicle.create(
+                Coordinates(10.0 + index * 0.001, 20.0),
+                Velocity(10.0 if index % 2 else 0.0),
+                vehicle_id=f"vehicle_{index:02d}",
+                heading=Heading(0.0),
+            )
+            for index in range(20)
+        )
+
+    def test_page_when_paged_with_cursor_then_every_vehicle_once(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet)
+        seen = []
+        cursor = None
+
+        while True:
+            page = queries.page(after=cursor, limit=7)
+            seen.extend(vehicle.vehicle_id for vehicle in page.vehicles)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected_ids = sorted(vehicle.vehicle_id for vehicle in fleet)
+        assert seen == expected_ids
+
+    def test_page_when_state_changes_then_state_index_follows(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet)
+
+        fleet.get("vehicle_00").accelerate(5.0, VelocityUnit.MPS)
+        page = queries.page(VehicleState.STOPPED, limit=100)
+
+        assert len(page.vehicles) == 9
+        assert "vehicle_00" not in [vehicle.vehicle_id for vehicle in page.vehicles]
+        assert page.next_cursor is None
+
+    def test_page_in_box_when_vehicle_moves_out_then_not_listed(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet, cell_size_degrees=0.005)
+        box = BoundingBox(9.9995, 19.999, 10.0035, 20.001)
+
+        fleet.get("vehicle_01").move(60.0, False, False)
+        page = queries.page_in_box(box)
+
+        expected_ids = ["vehicle_00", "vehicle_02", "vehicle_03"]
+        assert [vehicle.vehicle_id for vehicle in page.vehicles] == expected_ids
+
+    def test_page_in_box_when_paged_then_cursor_resumes_inside_cell(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet, cell_size_degrees=1.0)
+        box = BoundingBox(0.0, 0.0, 50.0, 50.0)
+
+        first = queries.page_in_box(box, limit=15)
+        second = queries.page_in_box(box, after=first.next_cursor, limit=15)
+
+        assert len(first.vehicles) == 15
+        assert len(second.vehicles) == 5
+        assert second.next_cursor is None
+
+    def test_page_within_radius_when_points_around_then_only_close_ones(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet)
+
+        page = queries.page_within_radius(10.0, 20.0, radius_meters=250.0)
+
+        expected_ids = ["vehicle_00", "vehicle_01", "vehicle_02"]
+        assert [vehicle.vehicle_id for vehicle in page.vehicles] == expected_ids
+
+    def test_get_when_untracked_then_raises_exception(self, fleet: Fleet) -> None:
+        queries = FleetQueryIndex(fleet)
+
+        queries.untrack(fleet.get("vehicle_03"))
+
+        with pytest.raises(VehicleNotFoundError):
+            queries.get("vehicle_03")
+
+    def test_page_in_box_when_cursor_malformed_then_raises_exception(
+        self,
+        fleet: Fleet
+    ) -> None:
+        queries = FleetQueryIndex(fleet)
+
+        with pytest.raises(ValueError):
+            queries.page_in_box(BoundingBox(0.0, 0.0, 1.0, 1.0), after="nope")
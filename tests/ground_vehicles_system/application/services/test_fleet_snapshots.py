@@ -0,0 +1,160 @@
+import threading
+
+import pytest
+
+from ground_vehicles_system.application.services.fleet_snapshots import (
+    PAGE_SIZE,
+    FleetSnapshotStore,
+    VehicleSnapshot
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.fleet_errors import VehicleNotFoundError
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+def make_vehicle(index: int) -> Vehicle:
+    return Vehicle(
+        vehicle_id=f"vehicle_{index}",
+        coordinates=Coordinates(10.0, 20.0),
+        velocity=Velocity(10.0),
+        heading=Heading(90.0),
+        state=VehicleState.DRIVING
+    )
+
+
+class TestVehicleSnapshot:
+    def test_of_when_vehicle_then_copies_observable_state(self) -> None:
+        vehicle = make_vehicle(1)
+
+        snapshot = VehicleSnapshot.of(vehicle)
+
+        assert snapshot.vehicle_id == "vehicle_1"
+        assert snapshot.coordinates == vehicle.coordinates
+        assert snapshot.velocity == vehicle.velocity
+        assert snapshot.heading == vehicle.heading
+        assert snapshot.state == VehicleState.DRIVING
+
+    def test_of_when_vehicle_has_driven_then_copies_odometry(self) -> None:
+        vehicle = make_vehicle(1)
+        vehicle.move(2.0, obstacle_found=False, will_hit_obstacle=False)
+
+        snapshot = VehicleSnapshot.of(vehicle)
+
+        assert snapshot.odometer_meters == vehicle.odometer_meters
+        assert snapshot.driving_seconds == 2.0
+        assert snapshot.idle_seconds == 0.0
+
+
+class TestFleetSnapshotStore:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create(make_vehicle(index) for index in range(PAGE_SIZE * 3))
+
+    def test_current_when_nothing_published_then_empty_snapshot(self) -> None:
+        store = FleetSnapshotStore()
+
+        snapshot = store.current
+
+        assert len(snapshot) == 0
+        assert snapshot.version == 0
+
+    def test_publish_fleet_when_fleet_then_snapshot_holds_all_vehicles(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+
+        snapshot = store.publish_fleet(fleet)
+
+        assert len(snapshot) == len(fleet)
+        assert snapshot.version == 1
+        assert {row.vehicle_id for row in snapshot} == {
+            vehicle.vehicle_id for vehicle in fleet
+        }
+
+    def test_publish_when_vehicle_changes_then_old_snapshot_is_untouched(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+        old_snapshot = store.publish_fleet(fleet)
+        vehicle = fleet.get("vehicle_0")
+
+        vehicle.move(10.0, False, False)
+        new_snapshot = store.publish([vehicle])
+
+        assert old_snapshot.get("vehicle_0").coordinates == Coordinates(10.0, 20.0)
+        assert new_snapshot.get("vehicle_0").coordinates == vehicle.coordinates
+
+    def test_publish_when_one_vehicle_changes_then_other_pages_are_shared(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+        old_snapshot = store.publish_fleet(fleet)
+        vehicle = fleet.get("vehicle_0")
+
+        vehicle.accelerate(5.0, VelocityUnit.MPS)
+        new_snapshot = store.publish_fleet(fleet)
+
+        assert new_snapshot._pages[0] is not old_snapshot._pages[0]
+        assert new_snapshot._pages[1] is old_snapshot._pages[1]
+        assert new_snapshot._pages[2] is old_snapshot._pages[2]
+        assert new_snapshot._slots is old_snapshot._slots
+
+    def test_publish_when_removed_then_vehicle_not_in_snapshot(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+        store.publish_fleet(fleet)
+
+        fleet.remove("vehicle_1")
+        snapshot = store.publish_fleet(fleet)
+
+        assert "vehicle_1" not in snapshot
+        assert len(snapshot) == len(fleet)
+        with pytest.raises(VehicleNotFoundError):
+            snapshot.get("vehicle_1")
+
+    def test_publish_when_slot_was_freed_then_new_vehicle_reuses_it(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+        store.publish_fleet(fleet)
+        store.publish(removed=["vehicle_1"])
+
+        snapshot = store.publish([make_vehicle(10_000)])
+
+        expected_pages = 3
+        assert len(snapshot._pages) == expected_pages
+        assert snapshot.get("vehicle_10000").vehicle_id == "vehicle_10000"
+
+    def test_current_when_read_from_other_thread_then_sees_consistent_version(
+        self,
+        fleet: Fleet
+    ) -> None:
+        store = FleetSnapshotStore()
+        store.publish_fleet(fleet)
+        torn_reads = []
+
+        def read() -> None:
+            for _ in range(50):
+                snapshot = store.current
+                headings = {row.heading for row in snapshot}
+                if len(headings) != 1:
+                    torn_reads.append(snapshot.version)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for _ in range(20):
+            for vehicle in fleet:
+                vehicle.turn(10.0)
+            store.publish_fleet(fleet)
+        reader.join()
+
+        assert torn_reads == []
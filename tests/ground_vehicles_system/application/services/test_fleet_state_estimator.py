@@ -0,0 +1,119 @@
+import pytest
+
+from ground_vehicles_system.application.services.fleet_state_estimator import (
+    FleetStateEstimator
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class TestFleetStateEstimator:
+    def test_init_when_measurement_noise_not_positive_then_raises_exception(
+        self
+    ) -> None:
+        with pytest.raises(ValueError):
+            FleetStateEstimator(measurement_noise_meters=0.0)
+
+    def test_update_when_first_fix_then_estimate_is_the_fix(self) -> None:
+        estimator = FleetStateEstimator()
+
+        estimator.update(["vehicle_1"], [34.0], [-118.0], [0.0], [0.0])
+
+        assert estimator.estimate("vehicle_1") == (34.0, -118.0)
+        assert "vehicle_1" in estimator
+        assert pytest.approx(estimator.uncertainty_meters("vehicle_1")) == 5.0
+
+    def test_predict_when_moving_then_matches_vehicle_motion_model(self) -> None:
+        estimator = FleetStateEstimator()
+        estimator.update(["vehicle_1"], [34.0], [-118.0], [10.0], [45.0])
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(34.0, -118.0),
+            velocity=Velocity(10.0),
+            heading=Heading(45.0),
+            state=VehicleState.DRIVING
+        )
+
+        estimator.predict(3.0)
+
+        expected = vehicle.position_at(3.0)
+        latitude, longitude = estimator.estimate("vehicle_1")
+        assert pytest.approx(latitude) == expected.latitude
+        assert pytest.approx(longitude) == expected.longitude
+
+    def test_predict_when_time_passes_then_uncertainty_grows(self) -> None:
+        estimator = FleetStateEstimator()
+        estimator.update(["vehicle_1"], [34.0], [-118.0], [0.0], [0.0])
+        before = estimator.uncertainty_meters("vehicle_1")
+
+        estimator.predict(10.0)
+
+        assert estimator.uncertainty_meters("vehicle_1") > before
+
+    def test_update_when_noisy_fix_then_estimate_moves_part_of_the_way(
+        self
+    ) -> None:
+        estimator = FleetStateEstimator()
+        estimator.update(["vehicle_1"], [34.0], [-118.0], [0.0], [0.0])
+
+        estimator.update(["vehicle_1"], [34.001], [-118.0], [0.0], [0.0])
+
+        latitude, _ = estimator.estimate("vehicle_1")
+        assert 34.0 < latitude < 34.001
+        assert pytest.approx(latitude) == 34.0005
+
+    def test_update_when_columns_differ_in_length_then_raises_exception(
+        self
+    ) -> None:
+        estimator = FleetStateEstimator()
+
+        with pytest.raises(ValueError):
+            estimator.update(["vehicle_1"], [34.0], [-118.0], [0.0], [])
+
+    def test_apply_when_fleet_then_vehicles_get_estimates(self) -> None:
+        fleet = Fleet.create([
+            Vehicle(
+                vehicle_id="vehicle_1",
+                coordinates=Coordinates(0.0, 0.0),
+                velocity=Velocity(0.0),
+                heading=Heading(0.0),
+                state=VehicleState.STOPPED
+            )
+        ])
+        estimator = FleetStateEstimator()
+        estimator.update(
+            ["vehicle_1", "vehicle_2"],
+            [34.0, 1.0],
+            [-118.0, 1.0],
+            [5.0, 0.0],
+            [90.0, 0.0]
+        )
+
+        estimator.apply(fleet)
+
+        vehicle = fleet.get("vehicle_1")
+        assert vehicle.coordinates == Coordinates(34.0, -118.0)
+        assert vehicle.velocity == Velocity(5.0)
+        assert vehicle.heading == Heading(90.0)
+        assert vehicle.state == VehicleState.DRIVING
+        assert "vehicle_2" not in fleet
+
+    def test_forget_when_vehicle_tracked_then_other_rows_are_kept(self) -> None:
+        estimator = FleetStateEstimator()
+        estimator.update(
+            ["vehicle_1", "vehicle_2", "vehicle_3"],
+            [1.0, 2.0, 3.0],
+            [1.0, 2.0, 3.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0]
+        )
+
+        estimator.forget("vehicle_1")
+
+        assert len(estimator) == 2
+        assert "vehicle_1" not in estimator
+        assert estimator.estimate("vehicle_3") == (3.0, 3.0)
+        assert estimator.estimate("vehicle_2") == (2.0, 2.0)
@@ -0,0 +1,148 @@
+import threading
+
+import pytest
+
+from ground_vehicles_system.application.services.fleet_statistics import (
+    FleetStatistics,
+    SlidingWindowSum
+)
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.vehicle_errors import CrashedVehicleError
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowSum:
+    def test_total_when_values_older_than_window_then_excluded(self) -> None:
+        clock = FakeClock()
+        window = SlidingWindowSum(10.0, buckets=10, clock=clock)
+        window.add(5.0)
+        clock.now = 6.0
+        window.add(3.0)
+
+        clock.now = 12.0
+
+        assert window.total() == 3.0
+
+    def test_total_when_clock_jumps_past_window_then_zero(self) -> None:
+        clock = FakeClock()
+        window = SlidingWindowSum(10.0, buckets=10, clock=clock)
+        window.add(5.0)
+
+        clock.now = 1_000.0
+
+        assert window.total() == 0.0
+
+
+class TestFleetStatistics:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def vehicles(self) -> list[Vehicle]:
+        return [
+            Vehicle.create(Coordinates(34.0, -118.0), Velocity(10.0), "vehicle_1"),
+            Vehicle.create(Coordinates(34.0, -118.0), Velocity(20.0), "vehicle_2"),
+            Vehicle.create(Coordinates(34.0, -118.0), Velocity(0.0), "vehicle_3"),
+        ]
+
+    def test_create_when_vehicles_then_aggregates_match(
+        self,
+        vehicles: list[Vehicle]
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles)
+
+        assert len(statistics) == 3
+        assert statistics.count(VehicleState.DRIVING) == 2
+        assert statistics.count(VehicleState.STOPPED) == 1
+        assert statistics.mean_speed_mps() == pytest.approx(10.0)
+        assert statistics.max_speed_mps() == 20.0
+
+    def test_accelerate_when_tracked_then_aggregates_follow(
+        self,
+        vehicles: list[Vehicle]
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles)
+
+        vehicles[1].brake_to_a_stop()
+        vehicles[2].accelerate(5.0, VelocityUnit.MPS)
+
+        assert statistics.count(VehicleState.DRIVING) == 2
+        assert statistics.count(VehicleState.STOPPED) == 1
+        assert statistics.mean_speed_mps() == pytest.approx(5.0)
+        assert statistics.max_speed_mps() == 10.0
+
+    def test_move_when_tracked_then_distance_accumulates(
+        self,
+        vehicles: list[Vehicle],
+        clock: FakeClock
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles, window_seconds=10.0, clock=clock)
+
+        for vehicle in vehicles:
+            vehicle.move(1.0, obstacle_found=False, will_hit_obstacle=False)
+        clock.now = 30.0
+        vehicles[0].move(1.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert statistics.total_distance_meters() == pytest.approx(40.0)
+        assert statistics.recent_distance_meters() == pytest.approx(10.0)
+
+    def test_move_when_crash_then_recent_entries_count_accident(
+        self,
+        vehicles: list[Vehicle],
+        clock: FakeClock
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles, clock=clock)
+
+        with pytest.raises(CrashedVehicleError):
+            vehicles[0].move(1.0, obstacle_found=True, will_hit_obstacle=True)
+
+        assert statistics.count(VehicleState.ACCIDENTED) == 1
+        assert statistics.recent_entries(VehicleState.ACCIDENTED) == 1
+
+    def test_untrack_when_fastest_vehicle_then_max_speed_drops(
+        self,
+        vehicles: list[Vehicle]
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles)
+
+        statistics.untrack(vehicles[1])
+        vehicles[1].accelerate(50.0, VelocityUnit.MPS)
+
+        assert "vehicle_2" not in statistics
+        assert statistics.max_speed_mps() == 10.0
+        assert statistics.count(VehicleState.DRIVING) == 1
+
+    def test_on_moved_when_notified_from_many_threads_then_no_distance_is_lost(
+        self,
+        vehicles: list[Vehicle]
+    ) -> None:
+        statistics = FleetStatistics.create(vehicles)
+        threads_count = 8
+        moves = 2_000
+        start = threading.Barrier(threads_count)
+
+        def notify() -> None:
+            start.wait()
+            for _ in range(moves):
+                statistics.on_moved(vehicles[0], 1.0)
+                statistics.on_velocity_changed(vehicles[0], 10.0, 10.0)
+
+        threads = [threading.Thread(target=notify) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert statistics.total_distance_meters() == threads_count * moves
+        assert statistics.recent_distance_meters() == threads_count * moves
+        assert statistics.max_speed_mps() == 20.0
@@ -0,0 +1,161 @@
+import threading
+
+import pytest
+
+from ground_vehicles_system.application.services.fleet_stepper import (
+    StepReport,
+    ThreadPoolFleetStepper,
+    free_threading_enabled
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+def make_fleet(size: int) -> Fleet:
+    return Fleet.create(
+        Vehicle(
+            vehicle_id=f"vehicle_{index}",
+            coordinates=Coordinates(34.0522, -118.2437),
+            velocity=Velocity(10.0),
+            heading=Heading(90.0),
+            state=VehicleState.DRIVING
+        )
+        for index in range(size)
+    )
+
+
+class ThreadRecordingObserver(VehicleObserver):
+    def __init__(self) -> None:
+        self.threads: set[int] = set()
+        self.moves: list[tuple[str, float]] = []
+        self.state_changes: list[tuple] = []
+
+    def on_state_changed(self, vehicle, old_state, new_state) -> None:
+        self.threads.add(threading.get_ident())
+        self.state_changes.append((vehicle.vehicle_id, old_state, new_state))
+
+    def on_moved(self, vehicle, distance_meters) -> None:
+        self.threads.add(threading.get_ident())
+        self.moves.append((vehicle.vehicle_id, distance_meters))
+
+
+class TestThreadPoolFleetStepper:
+    def test_init_when_workers_not_positive_then_raises_exception(self) -> None:
+        with pytest.raises(ValueError):
+            ThreadPoolFleetStepper(make_fleet(1), workers=0)
+
+    def test_init_when_workers_not_given_then_depends_on_gil(self) -> None:
+        with ThreadPoolFleetStepper(make_fleet(1)) as stepper:
+            if free_threading_enabled():
+                assert stepper.workers >= 1
+            else:
+                assert stepper.workers == 1
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_step_when_no_obstacles_then_every_vehicle_moves_like_serial_move(
+        self,
+        workers: int
+    ) -> None:
+        fleet = make_fleet(10)
+        expected_coordinates = fleet.get("vehicle_0").position_at(2.0)
+
+        with ThreadPoolFleetStepper(fleet, workers=workers) as stepper:
+            report = stepper.step(2.0)
+
+        assert report == StepReport((), ())
+        assert all(vehicle.coordinates == expected_coordinates for vehicle in fleet)
+
+    def test_step_when_commands_then_applied_before_moving(self) -> None:
+        fleet = make_fleet(4)
+        commands = {
+            "vehicle_1": [lambda vehicle: vehicle.brake_to_a_stop()],
+            "vehicle_2": [lambda vehicle: vehicle.turn(90.0)],
+        }
+
+        with ThreadPoolFleetStepper(fleet, workers=2) as stepper:
+            stepper.step(1.0, commands)
+
+        assert fleet.get("vehicle_1").coordinates == Coordinates(34.0522, -118.2437)
+        assert fleet.get("vehicle_2").heading == Heading(180.0)
+
+    def test_step_when_vehicle_hits_obstacle_then_reported_as_crashed(self) -> None:
+        fleet = make_fleet(4)
+
+        def sensor(vehicle: Vehicle) -> tuple[bool, bool]:
+            hit = vehicle.vehicle_id == "vehicle_3"
+            return hit, hit
+
+        with ThreadPoolFleetStepper(
+            fleet, workers=2, obstacle_sensor=sensor
+        ) as stepper:
+            report = stepper.step(1.0)
+
+        assert report.crashed == ("vehicle_3",)
+        assert fleet.get("vehicle_3").state == VehicleState.ACCIDENTED
+
+    def test_step_when_command_targets_accidented_vehicle_then_rejected(
+        self
+    ) -> None:
+        fleet = make_fleet(2)
+        fleet.get("vehicle_0")._state = VehicleState.ACCIDENTED
+        commands = {
+            "vehicle_0": [
+                lambda vehicle: vehicle.accelerate(5.0, VelocityUnit.MPS)
+            ],
+        }
+
+        with ThreadPoolFleetStepper(fleet, workers=2) as stepper:
+            report = stepper.step(1.0, commands)
+
+        assert report.rejected_commands == ("vehicle_0",)
+
+    def test_step_when_observer_shared_by_workers_then_notified_on_calling_thread(
+        self
+    ) -> None:
+        fleet = make_fleet(30)
+        observer = ThreadRecordingObserver()
+        for vehicle in fleet:
+            vehicle.add_observer(observer)
+        commands = {"vehicle_4": [lambda vehicle: vehicle.brake_to_a_stop()]}
+
+        with ThreadPoolFleetStepper(fleet, workers=3) as stepper:
+            stepper.step(1.0, commands)
+
+        assert observer.threads == {threading.get_ident()}
+        assert [vehicle_id for vehicle_id, _ in observer.moves] == [
+            vehicle.vehicle_id for vehicle in fleet if vehicle.vehicle_id != "vehicle_4"
+        ]
+        assert observer.state_changes == [
+            ("vehicle_4", VehicleState.DRIVING, VehicleState.STOPPED)
+        ]
+        assert all(len(vehicle._observers) == 1 for vehicle in fleet)
+
+    def test_step_when_chunk_fails_then_moves_replayed_before_raising(
+        self
+    ) -> None:
+        fleet = make_fleet(30)
+        observer = ThreadRecordingObserver()
+        for vehicle in fleet:
+            vehicle.add_observer(observer)
+
+        def sensor(vehicle: Vehicle) -> tuple[bool, bool]:
+            if vehicle.vehicle_id == "vehicle_15":
+                raise RuntimeError("sensor failure")
+            return False, False
+
+        with ThreadPoolFleetStepper(
+            fleet, workers=3, obstacle_sensor=sensor
+        ) as stepper:
+            with pytest.raises(RuntimeError):
+                stepper.step(1.0)
+
+        moved = [
+            vehicle.vehicle_id for vehicle in fleet if vehicle.odometer_meters > 0
+        ]
+        assert len(moved) == 25
+        assert [vehicle_id for vehicle_id, _ in observer.moves] == moved
+        assert all(len(vehicle._observers) == 1 for vehicle in fleet)
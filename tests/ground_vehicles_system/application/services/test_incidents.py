@@ -0,0 +1,174 @@
+import pytest
+
+from ground_vehicles_system.application.services.incidents import (
+    IncidentStatus,
+    IncidentStore
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.incident_errors import (
+    IncidentNotFoundError,
+    InvalidIncidentTransitionError
+)
+from ground_vehicles_system.domain.errors.vehicle_errors import CrashedVehicleError
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _crash(vehicle: Vehicle) -> None:
+    with pytest.raises(CrashedVehicleError):
+        vehicle.move(1.0, obstacle_found=True, will_hit_obstacle=True)
+
+
+class TestIncidentStore:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            Vehicle.create(
+                Coordinates(34.0 + index * 0.1, -118.0),
+                Velocity(12.0),
+                vehicle_id=f"vehicle_{index}",
+                heading=Heading(90.0),
+            )
+            for index in range(3)
+        ])
+
+    @pytest.fixture
+    def store(self, fleet: Fleet, clock: FakeClock) -> IncidentStore:
+        return IncidentStore(fleet, clock=clock)
+
+    def test_on_state_changed_when_vehicle_crashes_then_incident_recorded(
+        self,
+        fleet: Fleet,
+        clock: FakeClock,
+        store: IncidentStore
+    ) -> None:
+        clock.now = 100.0
+
+        _crash(fleet.get("vehicle_1"))
+
+        incident = store.open_incident_of("vehicle_1")
+        assert incident is not None
+        assert incident.occurred_at == 100.0
+        assert (incident.latitude, incident.longitude) == (34.1, -118.0)
+        assert incident.speed_mps == 12.0
+        assert incident.heading_degrees == 90.0
+        assert incident.status == IncidentStatus.OPEN
+
+    def test_resolve_when_towed_then_vehicle_recovered(
+        self,
+        fleet: Fleet,
+        store: IncidentStore
+    ) -> None:
+        _crash(fleet.get("vehicle_0"))
+        incident = store.open_incident_of("vehicle_0")
+
+        store.dispatch_tow(incident.incident_id)
+        resolved = store.resolve(incident.incident_id)
+
+        assert resolved.status == IncidentStatus.RESOLVED
+        assert store.open_incident_of("vehicle_0") is None
+        assert fleet.get("vehicle_0").state == VehicleState.STOPPED
+
+    def test_record_when_vehicle_crashes_again_then_earlier_incident_resolved(
+        self,
+        fleet: Fleet,
+        clock: FakeClock,
+        store: IncidentStore
+    ) -> None:
+        vehicle = fleet.get("vehicle_0")
+        _crash(vehicle)
+        first = store.open_incident_of("vehicle_0")
+        vehicle.recover()
+        vehicle.accelerate(5.0, VelocityUnit.MPS)
+        clock.now = 50.0
+
+        _crash(vehicle)
+
+        second = store.open_incident_of("vehicle_0")
+        assert second.incident_id != first.incident_id
+        assert second.previous_incident_id == first.incident_id
+        assert store.get(first.incident_id).status == IncidentStatus.RESOLVED
+        assert store.get(first.incident_id).resolved_at == 50.0
+        assert vehicle.state == VehicleState.ACCIDENTED
+
+    def test_dispatch_tow_when_resolved_then_raises_exception(
+        self,
+        fleet: Fleet,
+        store: IncidentStore
+    ) -> None:
+        _crash(fleet.get("vehicle_0"))
+        incident_id = store.open_incident_of("vehicle_0").incident_id
+        store.resolve(incident_id)
+
+        with pytest.raises(InvalidIncidentTransitionError):
+            store.dispatch_tow(incident_id)
+
+    def test_get_when_unknown_then_raises_exception(
+        self,
+        store: IncidentStore
+    ) -> None:
+        with pytest.raises(IncidentNotFoundError):
+            store.get(42)
+
+    def test_recent_in_area_when_old_and_distant_incidents_then_excluded(
+        self,
+        fleet: Fleet,
+        clock: FakeClock,
+        store: IncidentStore
+    ) -> None:
+        _crash(fleet.get("vehicle_0"))
+        clock.now = 4_000.0
+        _crash(fleet.get("vehicle_1"))
+        clock.now = 5_000.0
+        _crash(fleet.get("vehicle_2"))
+        clock.now = 6_000.0
+        box = BoundingBox(33.95, -118.05, 34.15, -117.95)
+
+        incidents = store.recent_in_area(box, 3_600.0)
+
+        assert [incident.vehicle_id for incident in incidents] == ["vehicle_1"]
+
+    def test_in_area_when_many_incidents_then_same_from_both_indexes(
+        self,
+        clock: FakeClock
+    ) -> None:
+        store = IncidentStore(clock=clock)
+        vehicles = [
+            Vehicle.create(
+                Coordinates(34.0 + (index % 20) * 0.01, -118.0),
+                Velocity(10.0),
+                vehicle_id=f"vehicle_{index}",
+            )
+            for index in range(200)
+        ]
+        for index, vehicle in enumerate(vehicles):
+            clock.now = float(index)
+            store.record(vehicle)
+        small_box = BoundingBox(34.0, -118.01, 34.0, -117.99)
+        large_box = BoundingBox(33.0, -119.0, 35.0, -117.0)
+
+        small = store.in_area(small_box, 0.0, 199.0)
+        large = store.in_area(large_box, 50.0, 59.0)
+
+        assert [incident.occurred_at for incident in small] == [
+            float(index) for index in range(0, 200, 20)
+        ]
+        assert [incident.occurred_at for incident in large] == [
+            float(index) for index in range(50, 60)
+        ]
+        assert len(store.between(10.0, 19.0)) == 10
@@ -0,0 +1,147 @@
+import pytest
+
+from ground_vehicles_system.application.services.intersection_control import (
+    IntersectionController,
+    Junction,
+    JunctionControl,
+    SignalPhase
+)
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.junction_errors import (
+    DuplicateJunctionError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+METERS = 1 / GeodeticConstants.METERS_PER_DEGREE_LATITUDE
+
+
+def _vehicle(
+    vehicle_id: str,
+    north_meters: float,
+    east_meters: float,
+    heading_degrees: float,
+    speed_mps: float = 10.0
+) -> Vehicle:
+    return Vehicle.create(
+        Coordinates(north_meters * METERS, east_meters * METERS),
+        Velocity(speed_mps),
+        vehicle_id=vehicle_id,
+        heading=Heading(heading_degrees),
+    )
+
+
+class TestIntersectionController:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            _vehicle("northbound", -30.0, 0.0, 0.0),
+            _vehicle("eastbound", 0.0, -30.0, 90.0),
+            _vehicle("leaving", 30.0, 0.0, 0.0),
+            _vehicle("far", -500.0, 0.0, 0.0),
+        ])
+
+    @pytest.fixture
+    def controller(self, fleet: Fleet) -> IntersectionController:
+        controller = IntersectionController(fleet, slot_seconds=1.0)
+        controller.add_junction(Junction("junction", 0.0, 0.0, green_seconds=10.0))
+        return controller
+
+    def test_add_junction_when_vehicles_heading_towards_it_then_approaching(
+        self,
+        controller: IntersectionController
+    ) -> None:
+        assert controller.approaching("junction") == ["northbound", "eastbound"]
+
+    def test_add_junction_when_duplicate_then_raises_exception(
+        self,
+        controller: IntersectionController
+    ) -> None:
+        with pytest.raises(DuplicateJunctionError):
+            controller.add_junction(Junction("junction", 1.0, 1.0))
+
+    def test_decide_when_red_then_brakes_only_cross_traffic(
+        self,
+        controller: IntersectionController
+    ) -> None:
+        decisions = controller.decide()
+
+        assert decisions.brake == ["eastbound"]
+        assert decisions.go == []
+
+    def test_tick_when_phase_flips_then_stopped_vehicle_goes(
+        self,
+        fleet: Fleet,
+        controller: IntersectionController
+    ) -> None:
+        controller.apply(controller.decide())
+
+        decisions = controller.tick(10.0)
+
+        assert controller.phase("junction") == SignalPhase.EAST_WEST
+        assert decisions.brake == ["northbound"]
+        assert decisions.go == ["eastbound"]
+        controller.apply(decisions)
+        assert fleet.get("eastbound").velocity.to_mps() == 5.0
+        assert fleet.get("northbound").velocity.to_mps() == 0.0
+
+    def test_on_moved_when_vehicle_passes_junction_then_leaves_approach(
+        self,
+        fleet: Fleet,
+        controller: IntersectionController
+    ) -> None:
+        fleet.get("northbound").move(
+            6.0, obstacle_found=False, will_hit_obstacle=False
+        )
+
+        assert controller.approaching("junction") == ["eastbound"]
+
+    def test_decide_when_stop_sign_then_first_stopped_vehicle_goes_alone(
+        self,
+        fleet: Fleet
+    ) -> None:
+        controller = IntersectionController(fleet)
+        controller.add_junction(
+            Junction("junction", 0.0, 0.0, control=JunctionControl.STOP_SIGN)
+        )
+
+        first = controller.decide()
+        controller.apply(first)
+        second = controller.decide()
+        controller.apply(second)
+        third = controller.decide()
+
+        assert first.brake == ["northbound", "eastbound"]
+        assert second.go == ["northbound"]
+        assert third.go == []
+
+    def test_decide_when_parked_or_stopped_on_their_own_then_not_released(
+        self
+    ) -> None:
+        parked = _vehicle("parked", -30.0, 0.0, 0.0, speed_mps=0.0)
+        parked.park()
+        fleet = Fleet.create([
+            parked,
+            _vehicle("waiting", -20.0, 0.0, 0.0, speed_mps=0.0),
+        ])
+        controller = IntersectionController(fleet)
+        controller.add_junction(Junction("junction", 0.0, 0.0))
+
+        decisions = controller.decide()
+
+        assert sorted(controller.approaching("junction")) == ["parked", "waiting"]
+        assert decisions.brake == []
+        assert decisions.go == []
+        assert parked.state == VehicleState.PARKING
+
+    def test_bounding_box_when_near_pole_then_within_valid_coordinates(
+        self
+    ) -> None:
+        box = Junction("polar", 89.999_99, 179.9).bounding_box
+
+        assert box.min_longitude >= -180.0
+        assert box.max_longitude == 180.0
+        assert box.max_latitude == 90.0
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ground_vehicles_system.application.services.parking import (
+    ParkingAllocator,
+    ParkingLot,
+    ParkingSpot
+)
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.parking_errors import (
+    DuplicateParkingSpotError,
+    NoFreeParkingSpotError
+)
+from ground_vehicles_system.domain.errors.vehicle_errors import (
+    CannotParkMovingVehicleError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class TestParkingAllocator:
+    @pytest.fixture
+    def allocator(self) -> ParkingAllocator:
+        allocator = ParkingAllocator(cell_size_degrees=0.001)
+        allocator.add_lot(ParkingLot("depot", (
+            ParkingSpot("depot_1", 34.0000, -118.0000),
+            ParkingSpot("depot_2", 34.0001, -118.0000),
+        )))
+        allocator.add_lot(ParkingLot("street", (
+            ParkingSpot("street_1", 34.0100, -118.0000),
+        )))
+        return allocator
+
+    def test_add_lot_when_spot_id_taken_then_raises_exception(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        with pytest.raises(DuplicateParkingSpotError):
+            allocator.add_lot(
+                ParkingLot("other", (ParkingSpot("depot_1", 0.0, 0.0),))
+            )
+
+    def test_reserve_when_free_spots_then_nearest_one(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        spot = allocator.reserve("vehicle_1", 34.0099, -118.0)
+
+        assert spot.spot_id == "street_1"
+        assert allocator.lot_of(spot).lot_id == "street"
+        assert allocator.occupancy("street") == (1, 1)
+        assert allocator.free_count == 2
+
+    def test_reserve_when_nearest_taken_then_next_nearest(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        allocator.reserve("vehicle_1", 34.0, -118.0)
+
+        spot = allocator.reserve("vehicle_2", 34.0, -118.0)
+
+        assert spot.spot_id == "depot_2"
+
+    def test_reserve_when_all_taken_then_raises_exception(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        for index in range(3):
+            allocator.reserve(f"vehicle_{index}", 34.0, -118.0)
+
+        with pytest.raises(NoFreeParkingSpotError):
+            allocator.reserve("vehicle_3", 34.0, -118.0)
+
+    def test_release_when_reserved_then_spot_free_again(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        allocator.reserve("vehicle_1", 34.0, -118.0)
+
+        released = allocator.release("vehicle_1")
+
+        assert released is not None and released.spot_id == "depot_1"
+        assert allocator.spot_of("vehicle_1") is None
+        assert allocator.reserve("vehicle_2", 34.0, -118.0).spot_id == "depot_1"
+
+    def test_reserve_when_concurrent_requests_then_each_spot_once(self) -> None:
+        allocator = ParkingAllocator()
+        allocator.add_lot(ParkingLot("lot", tuple(
+            ParkingSpot(f"spot_{index}", 34.0 + index * 0.0001, -118.0)
+            for index in range(50)
+        )))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            spots = list(executor.map(
+                lambda index: allocator.reserve(f"vehicle_{index}", 34.0, -118.0),
+                range(50)
+            ))
+
+        assert len({spot.spot_id for spot in spots}) == 50
+        assert allocator.free_count == 0
+
+    def test_park_when_vehicle_stopped_then_parks_and_releases_on_leave(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        vehicle = Vehicle.create(
+            Coordinates(34.0, -118.0), Velocity(0.0), vehicle_id="vehicle_1"
+        )
+
+        spot = allocator.park(vehicle)
+
+        assert spot.spot_id == "depot_1"
+        assert vehicle.state == VehicleState.PARKING
+        vehicle.accelerate(5.0, VelocityUnit.MPS)
+        assert allocator.spot_of("vehicle_1") is None
+        assert allocator.occupancy("depot") == (0, 2)
+
+    def test_park_when_vehicle_moving_then_reservation_undone(
+        self,
+        allocator: ParkingAllocator
+    ) -> None:
+        vehicle = Vehicle.create(
+            Coordinates(34.0, -118.0), Velocity(5.0), vehicle_id="vehicle_1"
+        )
+
+        with pytest.raises(CannotParkMovingVehicleError):
+            allocator.park(vehicle)
+
+        assert allocator.free_count == 3
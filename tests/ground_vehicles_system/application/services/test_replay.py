@@ -0,0 +1,181 @@
+import pytest
+
+from ground_vehicles_system.application.services.replay import (
+    AccelerateCommand,
+    ChecksumMark,
+    MoveTick,
+    RecordedEvent,
+    ReplayEngine,
+    StopEngineCommand,
+    TelemetryFix,
+    TurnCommand,
+    fleet_checksum
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+def make_fleet() -> Fleet:
+    return Fleet.create([
+        Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(34.0522, -118.2437),
+            velocity=Velocity(0.0),
+            heading=Heading(0.0),
+            state=VehicleState.STOPPED
+        )
+    ])
+
+
+def make_session() -> list[RecordedEvent]:
+    return [
+        RecordedEvent(0.0, AccelerateCommand("vehicle_1", 10.0, VelocityUnit.MPS)),
+        RecordedEvent(1.0, MoveTick(1.0)),
+        RecordedEvent(2.0, TurnCommand("vehicle_1", 90.0)),
+        RecordedEvent(2.0, MoveTick(1.0)),
+        RecordedEvent(3.0, MoveTick(1.0, hitting_vehicle_ids=frozenset({"vehicle_1"}))),
+        RecordedEvent(4.0, AccelerateCommand("vehicle_1", 5.0, VelocityUnit.MPS)),
+        RecordedEvent(5.0, StopEngineCommand("vehicle_1")),
+        RecordedEvent(6.0, TelemetryFix("vehicle_1", 34.1, -118.3, 0.0, 0.0)),
+    ]
+
+
+class FakeWallClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestReplayEngine:
+    def test_init_when_events_not_sorted_then_raises_exception(self) -> None:
+        events = [
+            RecordedEvent(2.0, MoveTick(1.0)),
+            RecordedEvent(1.0, MoveTick(1.0)),
+        ]
+
+        with pytest.raises(ValueError):
+            ReplayEngine(events, make_fleet())
+
+    def test_run_when_session_then_reports_crash_and_rejected_command(
+        self
+    ) -> None:
+        engine = ReplayEngine(make_session(), make_fleet())
+
+        report = engine.run()
+
+        assert report.events_applied == 8
+        assert report.crashes == [(3.0, "vehicle_1")]
+        assert report.rejected_commands == [(4.0, "vehicle_1")]
+        assert engine.finished
+        assert engine.clock.now == 6.0
+        assert engine.fleet.get("vehicle_1").coordinates == Coordinates(34.1, -118.3)
+
+    def test_run_when_events_invalid_then_rejected_and_replay_continues(
+        self
+    ) -> None:
+        events = [
+            RecordedEvent(0.0, AccelerateCommand("ghost", 10.0, VelocityUnit.MPS)),
+            RecordedEvent(1.0, TelemetryFix("vehicle_1", 91.0, 0.0, 0.0, 0.0)),
+            RecordedEvent(2.0, TelemetryFix("vehicle_1", 1.0, 181.0, 3.0, 0.0)),
+            RecordedEvent(3.0, TelemetryFix("vehicle_1", 1.0, 2.0, 3.0, 0.0)),
+        ]
+        engine = ReplayEngine(events, make_fleet())
+
+        report = engine.run()
+
+        assert report.events_applied == 4
+        assert report.rejected_commands == [
+            (0.0, "ghost"),
+            (1.0, "vehicle_1"),
+            (2.0, "vehicle_1"),
+        ]
+        assert engine.fleet.get("vehicle_1").coordinates == Coordinates(1.0, 2.0)
+
+    def test_run_when_until_then_stops_after_that_time(self) -> None:
+        engine = ReplayEngine(make_session(), make_fleet())
+
+        report = engine.run(until=2.0)
+
+        assert report.events_applied == 4
+        assert engine.fleet.get("vehicle_1").heading == Heading(90.0)
+
+    def test_run_when_speed_then_paced_by_wall_clock(self) -> None:
+        wall_clock = FakeWallClock()
+        engine = ReplayEngine(
+            make_session(),
+            make_fleet(),
+            speed=2.0,
+            wall_clock=wall_clock,
+            sleep=wall_clock.sleep,
+        )
+
+        engine.run()
+
+        assert pytest.approx(sum(wall_clock.sleeps)) == 3.0
+
+    def test_run_when_checksums_recorded_then_mismatches_reported(self) -> None:
+        reference = make_fleet()
+        reference.get("vehicle_1").accelerate(10.0, VelocityUnit.MPS)
+        events = [
+            RecordedEvent(0.0, AccelerateCommand("vehicle_1", 10.0, VelocityUnit.MPS)),
+            RecordedEvent(0.0, ChecksumMark(fleet_checksum(reference))),
+            RecordedEvent(1.0, MoveTick(1.0)),
+            RecordedEvent(1.0, ChecksumMark(fleet_checksum(reference))),
+        ]
+        engine = ReplayEngine(events, make_fleet())
+
+        report = engine.run()
+
+        assert [mismatch.timestamp for mismatch in report.mismatches] == [1.0]
+
+    def test_seek_when_backwards_then_restores_earlier_state(self) -> None:
+        engine = ReplayEngine(make_session(), make_fleet(), checkpoint_interval=2)
+        engine.run(until=2.0)
+        expected_checksum = fleet_checksum(engine.fleet)
+        engine.run()
+
+        engine.seek(2.0)
+
+        assert fleet_checksum(engine.fleet) == expected_checksum
+        assert engine.fleet.get("vehicle_1").state == VehicleState.DRIVING
+        assert engine.clock.now == 2.0
+
+    def test_seek_when_backwards_then_restores_odometry(self) -> None:
+        engine = ReplayEngine(make_session(), make_fleet(), checkpoint_interval=2)
+        engine.run(until=2.0)
+        vehicle = engine.fleet.get("vehicle_1")
+        expected = (
+            vehicle.odometer_meters, vehicle.driving_seconds, vehicle.idle_seconds
+        )
+        engine.run()
+
+        engine.seek(2.0)
+
+        restored = engine.fleet.get("vehicle_1")
+        assert expected[0] > 0.0
+        assert (
+            restored.odometer_meters, restored.driving_seconds, restored.idle_seconds
+        ) == expected
+
+    def test_seek_when_forward_then_uses_checkpoint_or_replays(self) -> None:
+        session = make_session()
+        reference = ReplayEngine(session, make_fleet())
+        reference.run(until=5.0)
+        engine = ReplayEngine(session, make_fleet(), checkpoint_interval=3)
+        engine.run()
+        engine.seek(0.0)
+
+        report = engine.seek(5.0)
+
+        assert fleet_checksum(engine.fleet) == fleet_checksum(reference.fleet)
+        assert report.events_applied < 7
@@ -0,0 +1,141 @@
+import pytest
+
+from ground_vehicles_system.application.services.viewport_fanout import (
+    ViewportFanout
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class TestViewportFanout:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            Vehicle.create(
+                Coordinates(10.0, 20.0),
+                Velocity(100.0),
+                vehicle_id="inside",
+                heading=Heading(0.0),
+            ),
+            Vehicle.create(Coordinates(50.0, 50.0), Velocity(0.0), "far_away"),
+        ])
+
+    @pytest.fixture
+    def box(self) -> BoundingBox:
+        return BoundingBox(9.99, 19.99, 10.01, 20.01)
+
+    def test_subscribe_when_vehicles_in_viewport_then_queued(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+
+        subscription = fanout.subscribe(box, update_rate_hz=4.0)
+
+        assert set(subscription.drain()) == {"inside"}
+        assert subscription.update_interval_seconds == 0.25
+
+    def test_subscribe_when_viewport_is_the_whole_world_then_sees_every_vehicle(
+        self,
+        fleet: Fleet
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+
+        subscription = fanout.subscribe(
+            BoundingBox(-90.0, -180.0, 90.0, 180.0), update_rate_hz=1.0
+        )
+        assert set(subscription.drain()) == {"inside", "far_away"}
+
+        fleet.get("inside").move(1.0, False, False)
+        assert set(subscription.drain()) == {"inside"}
+
+        fanout.unsubscribe(subscription)
+        assert len(fanout) == 0
+
+    def test_changes_when_many_before_drain_then_coalesced(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+        subscription = fanout.subscribe(box, update_rate_hz=1.0)
+        subscription.drain()
+        vehicle = fleet.get("inside")
+
+        vehicle.turn(10.0)
+        vehicle.accelerate(1.0, VelocityUnit.MPS)
+        vehicle.turn(-10.0)
+
+        assert subscription.drain() == {"inside": vehicle}
+
+    def test_change_when_outside_viewport_then_not_queued(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+        subscription = fanout.subscribe(box, update_rate_hz=1.0)
+        subscription.drain()
+
+        fleet.get("far_away").accelerate(5.0, VelocityUnit.MPS)
+
+        assert not subscription.has_pending()
+
+    def test_move_when_vehicle_leaves_viewport_then_queued_as_removed(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+        subscription = fanout.subscribe(box, update_rate_hz=1.0)
+        subscription.drain()
+
+        fleet.get("inside").move(60.0, False, False)
+
+        assert subscription.drain() == {"inside": None}
+
+    def test_move_viewport_when_moved_away_then_old_vehicles_removed(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+        subscription = fanout.subscribe(box, update_rate_hz=1.0)
+        subscription.drain()
+
+        fanout.move_viewport(subscription, BoundingBox(49.99, 49.99, 50.01, 50.01))
+
+        assert subscription.drain() == {
+            "inside": None,
+            "far_away": fleet.get("far_away"),
+        }
+
+    def test_unsubscribe_when_vehicle_changes_then_not_queued(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+        subscription = fanout.subscribe(box, update_rate_hz=1.0)
+        fanout.unsubscribe(subscription)
+        subscription.drain()
+
+        fleet.get("inside").turn(5.0)
+
+        assert not subscription.has_pending()
+        assert len(fanout) == 0
+
+    def test_subscribe_when_rate_not_positive_then_raises_exception(
+        self,
+        fleet: Fleet,
+        box: BoundingBox
+    ) -> None:
+        fanout = ViewportFanout(fleet)
+
+        with pytest.raises(ValueError):
+            fanout.subscribe(box, update_rate_hz=0.0)
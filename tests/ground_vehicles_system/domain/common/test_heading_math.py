@@ -0,0 +1,79 @@
+import pytest
+
+from ground_vehicles_system.domain.common.heading_math import (
+    bearing_degrees,
+    bearings_degrees,
+    normalize_degrees,
+    signed_difference,
+    signed_differences,
+    turn_headings
+)
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class TestHeadingMath:
+    def test_normalize_degrees_when_out_of_range_then_wrapped(self):
+        headings = normalize_degrees([-90.0, 360.0, 725.0])
+
+        assert list(headings) == [270.0, 0.0, 5.0]
+
+    def test_turn_headings_when_scalar_delta_then_matches_heading_turn(self):
+        headings = turn_headings([0.0, 350.0], 20.0)
+
+        expected = [Heading(0.0).turn(20.0).degrees, Heading(350.0).turn(20.0).degrees]
+        assert list(headings) == expected
+
+    def test_turn_headings_when_lengths_differ_then_raises_exception(self):
+        with pytest.raises(ValueError):
+            turn_headings([0.0, 1.0], [1.0])
+
+    @pytest.mark.parametrize(("origin", "target", "expected"), [
+        (10.0, 350.0, -20.0),
+        (350.0, 10.0, 20.0),
+        (0.0, 180.0, -180.0),
+        (90.0, 90.0, 0.0),
+    ])
+    def test_signed_difference_when_headings_then_shortest_turn(
+        self,
+        origin: float,
+        target: float,
+        expected: float
+    ):
+        assert signed_difference(origin, target) == expected
+
+    def test_signed_differences_when_columns_then_element_wise(self):
+        differences = signed_differences([10.0, 350.0], [350.0, 10.0])
+
+        assert list(differences) == [-20.0, 20.0]
+
+    def test_bearing_degrees_when_target_due_west_then_270(self):
+        bearing = bearing_degrees(10.0, 20.0, 10.0, 19.0)
+
+        expected = 270.0
+        assert pytest.approx(bearing) == expected
+
+    def test_bearing_degrees_when_driven_along_then_reaches_target(self):
+        bearing = bearing_degrees(34.0, -118.0, 34.01, -117.99)
+        vehicle = Vehicle.create(
+            Coordinates(34.0, -118.0), Velocity(10.0), heading=Heading(bearing)
+        )
+        seconds = ground_distance_meters(34.0, -118.0, 34.01, -117.99) / 10.0
+
+        arrival = vehicle.position_at(seconds)
+
+        assert pytest.approx(arrival.latitude, abs=1e-6) == 34.01
+        assert pytest.approx(arrival.longitude, abs=1e-6) == -117.99
+
+    def test_bearings_degrees_when_columns_then_matches_scalar(self):
+        bearings = bearings_degrees(
+            [10.0, -5.0], [20.0, 3.0], [11.0, -6.0], [21.0, 3.0]
+        )
+
+        assert list(bearings) == pytest.approx([
+            bearing_degrees(10.0, 20.0, 11.0, 21.0),
+            bearing_degrees(-5.0, 3.0, -6.0, 3.0),
+        ])
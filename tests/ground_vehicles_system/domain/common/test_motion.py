@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from ground_vehicles_system.domain.common.motion import (
+    ground_distance_meters,
+    latitude_rate,
+    longitude_rate
+)
+
+
+class TestMotion:
+    def test_latitude_rate_when_heading_north_then_full_speed_in_degrees(self):
+        rate = latitude_rate(111139.0, 1.0)
+
+        expected = 1.0
+        assert rate == expected
+
+    def test_latitude_rate_when_heading_east_then_zero(self):
+        rate = latitude_rate(10.0, math.cos(math.pi / 2))
+
+        assert pytest.approx(rate, abs=1e-12) == 0.0
+
+    def test_longitude_rate_when_at_60_degrees_latitude_then_doubled(self):
+        rate = longitude_rate(111139.0, 1.0, 60.0)
+
+        expected = 2.0
+        assert pytest.approx(rate) == expected
+
+    def test_ground_distance_meters_when_one_degree_north_then_degree_length(self):
+        distance = ground_distance_meters(10.0, 20.0, 11.0, 20.0)
+
+        expected = 111139.0
+        assert pytest.approx(distance) == expected
+
+    def test_ground_distance_meters_when_east_at_60_degrees_then_halved(self):
+        distance = ground_distance_meters(60.0, 0.0, 60.0, 1.0)
+
+        expected = 111139.0 / 2
+        assert pytest.approx(distance) == expected
@@ -1,4 +1,4 @@
-from ground_vehicles_system.domain.entities.base_entity import Entity
+from ground_vehicles_system.domain.entities.base_entity import Entity, new_entity_id
 
 
 class DumbEntity(Entity[int]):
@@ -38,3 +38,11 @@ class TestEntity:
         entity = DumbEntity(1)
 
         assert entity.id == 1
+
+    def test_new_entity_id_when_called_twice_then_returns_distinct_hex_ids(self):
+        first = new_entity_id()
+        second = new_entity_id()
+
+        assert first != second
+        assert len(first) == 32
+        int(first, 16)
@@ -0,0 +1,192 @@
+import pytest
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import (
+    CommandOutcome,
+    Vehicle,
+    VehicleState
+)
+from ground_vehicles_system.domain.errors.fleet_errors import (
+    DuplicateVehicleError,
+    VehicleNotFoundError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+
+
+class TestFleet:
+    @pytest.fixture
+    def driving_vehicle(self) -> Vehicle:
+        return Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(34.0522, -118.2437),
+            velocity=Velocity(10.0),
+            heading=Heading(90.0),
+            state=VehicleState.DRIVING
+        )
+
+    @pytest.fixture
+    def stopped_vehicle(self) -> Vehicle:
+        return Vehicle(
+            vehicle_id="vehicle_2",
+            coordinates=Coordinates(40.7128, -74.0060),
+            velocity=Velocity(0.0),
+            heading=Heading(0.0),
+            state=VehicleState.STOPPED
+        )
+
+    def test_create_when_fleet_id_is_none_then_generate_id(self) -> None:
+        fleet = Fleet.create()
+
+        assert fleet.fleet_id is not None
+
+    def test_create_when_vehicles_then_vehicles_are_added(
+        self,
+        driving_vehicle: Vehicle,
+        stopped_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle, stopped_vehicle], fleet_id="fleet_1")
+
+        expected_length = 2
+        assert len(fleet) == expected_length
+        assert "vehicle_1" in fleet
+        assert list(fleet) == [driving_vehicle, stopped_vehicle]
+
+    def test_add_when_id_already_in_fleet_then_raises_exception(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        with pytest.raises(DuplicateVehicleError):
+            fleet.add(driving_vehicle)
+
+    def test_get_when_id_not_in_fleet_then_raises_exception(self) -> None:
+        fleet = Fleet.create()
+
+        with pytest.raises(VehicleNotFoundError):
+            fleet.get("vehicle_1")
+
+    def test_remove_when_id_in_fleet_then_vehicle_is_removed(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        removed = fleet.remove("vehicle_1")
+
+        assert removed == driving_vehicle
+        assert "vehicle_1" not in fleet
+
+    def test_remove_when_id_not_in_fleet_then_raises_exception(self) -> None:
+        fleet = Fleet.create()
+
+        with pytest.raises(VehicleNotFoundError):
+            fleet.remove("vehicle_1")
+
+    def test_find_when_id_in_fleet_then_returns_vehicle(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        assert fleet.find("vehicle_1") is driving_vehicle
+
+    def test_find_when_id_not_in_fleet_then_returns_none(self) -> None:
+        fleet = Fleet.create()
+
+        assert fleet.find("vehicle_1") is None
+
+    def test_position_at_when_driving_then_delegates_to_vehicle(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        position = fleet.position_at("vehicle_1", 3.0)
+
+        expected_position = driving_vehicle.position_at(3.0)
+        assert position == expected_position
+
+    def test_positions_at_when_many_queries_then_matches_scalar_query(
+        self,
+        driving_vehicle: Vehicle,
+        stopped_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle, stopped_vehicle])
+        vehicle_ids = ["vehicle_1", "vehicle_2", "vehicle_1", "vehicle_1"]
+        elapsed_seconds = [0.0, 5.0, 1.5, 10.0]
+
+        latitudes, longitudes = fleet.positions_at(vehicle_ids, elapsed_seconds)
+
+        for index, (vehicle_id, seconds) in enumerate(
+            zip(vehicle_ids, elapsed_seconds)
+        ):
+            expected_position = fleet.position_at(vehicle_id, seconds)
+            assert pytest.approx(latitudes[index]) == expected_position.latitude
+            assert pytest.approx(longitudes[index]) == expected_position.longitude
+
+    def test_positions_at_when_lengths_differ_then_raises_exception(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        with pytest.raises(ValueError):
+            fleet.positions_at(["vehicle_1"], [1.0, 2.0])
+
+    def test_odometry_columns_when_moved_then_counters_per_vehicle(
+        self,
+        driving_vehicle: Vehicle,
+        stopped_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle, stopped_vehicle])
+        for vehicle in fleet:
+            vehicle.move(3.0, obstacle_found=False, will_hit_obstacle=False)
+
+        vehicle_ids, odometers, driving, idle = fleet.odometry_columns()
+
+        assert vehicle_ids == ["vehicle_1", "vehicle_2"]
+        assert list(odometers) == [30.0, 0.0]
+        assert list(driving) == [3.0, 0.0]
+        assert list(idle) == [0.0, 3.0]
+
+    def test_move_all_when_vehicle_crashes_then_outcome_instead_of_exception(
+        self,
+        driving_vehicle: Vehicle,
+        stopped_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle, stopped_vehicle])
+
+        vehicle_ids, outcomes = fleet.move_all(
+            1.0, obstacles={"vehicle_1": (True, True)}
+        )
+
+        assert vehicle_ids == ["vehicle_1", "vehicle_2"]
+        assert list(outcomes) == [CommandOutcome.CRASHED, CommandOutcome.OK]
+        assert driving_vehicle.state == VehicleState.ACCIDENTED
+
+    def test_accelerate_many_when_accidented_vehicle_then_rejected_row(
+        self,
+        driving_vehicle: Vehicle,
+        stopped_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle, stopped_vehicle])
+        fleet.move_all(1.0, obstacles={"vehicle_1": (True, True)})
+
+        outcomes = fleet.accelerate_many(
+            ["vehicle_1", "vehicle_2"], [5.0, 5.0], VelocityUnit.MPS
+        )
+
+        assert list(outcomes) == [CommandOutcome.REJECTED, CommandOutcome.OK]
+        assert stopped_vehicle.velocity.to_mps() == 5.0
+
+    def test_turn_many_when_lengths_differ_then_raises_exception(
+        self,
+        driving_vehicle: Vehicle
+    ) -> None:
+        fleet = Fleet.create([driving_vehicle])
+
+        with pytest.raises(ValueError):
+            fleet.turn_many(["vehicle_1"], [10.0, 20.0])
@@ -1,15 +1,36 @@
 import pytest
 
-from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle import (
+    CommandOutcome,
+    Vehicle,
+    VehicleState
+)
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
 from ground_vehicles_system.domain.errors.vehicle_errors import (
     CannotChangeVelocityOfAccidentedVehicle,
-    CrashedVehicleError
+    CannotParkMovingVehicleError,
+    CrashedVehicleError,
+    VehicleNotAccidentedError
 )
 from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
 from ground_vehicles_system.domain.value_objects.heading import Heading
 from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
 
 
+class RecordingObserver(VehicleObserver):
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_state_changed(self, vehicle, old_state, new_state) -> None:
+        self.events.append(("state", old_state, new_state))
+
+    def on_velocity_changed(self, vehicle, old_mps, new_mps) -> None:
+        self.events.append(("velocity", old_mps, new_mps))
+
+    def on_moved(self, vehicle, distance_meters) -> None:
+        self.events.append(("moved", distance_meters))
+
+
 class TestVehicle:
     @pytest.fixture
     def coordinates(self) -> Coordinates:
@@ -169,6 +190,22 @@ class TestVehicle:
         expected_heading = Heading(0.0)
         assert heading == expected_heading
 
+    def test_state_property(
+        self, coordinates: Coordinates, velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_123",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(0.0),
+            state=VehicleState.PARKING
+        )
+
+        state = vehicle.state
+
+        expected_state = VehicleState.PARKING
+        assert state == expected_state
+
     def test_accelerate_when_accidented_then_raises_exception(
         self,
         coordinates: Coordinates,
@@ -1162,3 +1199,393 @@ class TestVehicle:
 
         expected_coordinates = Coordinates(34.0522, -118.2437)
         assert vehicle._coordinates == expected_coordinates
+
+    def test_position_at_when_driving_then_matches_move(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(45.0),
+            state=VehicleState.DRIVING
+        )
+
+        position = vehicle.position_at(2.5)
+        vehicle.move(2.5, False, False)
+
+        expected_coordinates = vehicle.coordinates
+        assert position == expected_coordinates
+
+    def test_position_at_when_driving_then_vehicle_is_not_changed(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(45.0),
+            state=VehicleState.DRIVING
+        )
+
+        vehicle.position_at(2.5)
+
+        assert vehicle.coordinates == coordinates
+
+    def test_position_at_when_not_driving_then_current_coordinates(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(45.0),
+            state=VehicleState.STOPPED
+        )
+
+        position = vehicle.position_at(10.0)
+
+        assert position == coordinates
+
+    def test_coordinate_rates_when_heading_north_then_only_latitude_changes(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(0.0),
+            state=VehicleState.DRIVING
+        )
+
+        delta_lat_per_second, delta_lon_per_second = vehicle.coordinate_rates()
+
+        expected_delta_lat_per_second = 10.0 / 111139.0
+        assert pytest.approx(delta_lat_per_second) == expected_delta_lat_per_second
+        assert delta_lon_per_second == 0.0
+
+    def test_update_from_telemetry_when_speed_positive_then_state_driving(
+        self,
+        coordinates: Coordinates,
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=Velocity(0.0),
+            heading=Heading(90.0),
+            state=VehicleState.STOPPED
+        )
+        new_coordinates = Coordinates(34.06, -118.25)
+
+        vehicle.update_from_telemetry(new_coordinates, Velocity(5.0), Heading(10.0))
+
+        assert vehicle._coordinates == new_coordinates
+        assert vehicle._velocity == Velocity(5.0)
+        assert vehicle._heading == Heading(10.0)
+        assert vehicle._state == VehicleState.DRIVING
+
+    def test_update_from_telemetry_when_speed_zero_and_parking_then_state_parking(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(90.0),
+            state=VehicleState.PARKING
+        )
+
+        vehicle.update_from_telemetry(coordinates, Velocity(0.0), Heading(90.0))
+
+        assert vehicle._state == VehicleState.PARKING
+
+    def test_update_from_telemetry_when_speed_zero_and_driving_then_state_stopped(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(90.0),
+            state=VehicleState.DRIVING
+        )
+
+        vehicle.update_from_telemetry(coordinates, Velocity(0.0), Heading(90.0))
+
+        assert vehicle._state == VehicleState.STOPPED
+
+    def test_update_from_telemetry_when_accidented_then_state_accidented(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(90.0),
+            state=VehicleState.ACCIDENTED
+        )
+
+        vehicle.update_from_telemetry(coordinates, Velocity(5.0), Heading(90.0))
+
+        assert vehicle._state == VehicleState.ACCIDENTED
+
+    def test_accelerate_when_observed_then_notify_velocity_and_state(
+        self,
+        coordinates: Coordinates
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, Velocity(0.0), vehicle_id="vehicle_1")
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+
+        vehicle.accelerate(10.0, VelocityUnit.MPS)
+
+        assert observer.events == [
+            ("velocity", 0.0, 10.0),
+            ("state", VehicleState.STOPPED, VehicleState.DRIVING),
+        ]
+
+    def test_move_when_observed_then_notify_distance(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+
+        vehicle.move(2.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert observer.events == [("moved", 20.0)]
+
+    def test_move_when_observed_and_hit_obstacle_then_notify_accident(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+
+        with pytest.raises(CrashedVehicleError):
+            vehicle.move(1.0, obstacle_found=True, will_hit_obstacle=True)
+
+        assert observer.events == [
+            ("state", VehicleState.DRIVING, VehicleState.ACCIDENTED)
+        ]
+
+    def test_stop_engine_when_observer_removed_then_not_notified(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+        vehicle.remove_observer(observer)
+
+        vehicle.stop_engine()
+
+        assert observer.events == []
+
+    def test_replace_observers_when_called_then_only_new_ones_are_notified(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        replaced = RecordingObserver()
+        replacement = RecordingObserver()
+        vehicle.add_observer(replaced)
+
+        assert vehicle.replace_observers((replacement,)) == (replaced,)
+        vehicle.move(1.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert replaced.events == []
+        assert replacement.events == [("moved", 10.0)]
+
+    def test_move_when_driving_then_odometer_and_driving_time_grow(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        vehicle.move(2.0, obstacle_found=False, will_hit_obstacle=False)
+        vehicle.move(1.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert vehicle.odometer_meters == 30.0
+        assert vehicle.driving_seconds == 3.0
+        assert vehicle.idle_seconds == 0.0
+
+    def test_move_when_stopped_then_idle_time_grows(
+        self,
+        coordinates: Coordinates
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, Velocity(0.0), vehicle_id="vehicle_1")
+
+        vehicle.move(4.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert vehicle.idle_seconds == 4.0
+        assert vehicle.odometer_meters == 0.0
+
+    def test_move_when_accidented_then_no_time_accounted(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=velocity,
+            heading=Heading(0.0),
+            state=VehicleState.ACCIDENTED
+        )
+
+        vehicle.move(4.0, obstacle_found=False, will_hit_obstacle=False)
+
+        assert vehicle.idle_seconds == 0.0
+        assert vehicle.driving_seconds == 0.0
+
+    def test_park_when_stopped_then_state_changes_to_parking(
+        self,
+        coordinates: Coordinates
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, Velocity(0.0), vehicle_id="vehicle_1")
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+
+        vehicle.park()
+
+        assert vehicle.state == VehicleState.PARKING
+        assert observer.events == [
+            ("state", VehicleState.STOPPED, VehicleState.PARKING)
+        ]
+
+    def test_park_when_moving_then_raises_exception(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        with pytest.raises(CannotParkMovingVehicleError):
+            vehicle.park()
+
+        assert vehicle.state == VehicleState.DRIVING
+
+    def test_park_when_accidented_then_raises_exception(
+        self,
+        coordinates: Coordinates
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=coordinates,
+            velocity=Velocity(0.0),
+            heading=Heading(0.0),
+            state=VehicleState.ACCIDENTED
+        )
+
+        with pytest.raises(CrashedVehicleError):
+            vehicle.park()
+
+    def test_accelerate_when_parking_then_drives_away(
+        self,
+        coordinates: Coordinates
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, Velocity(0.0), vehicle_id="vehicle_1")
+        vehicle.park()
+
+        vehicle.accelerate(5.0, VelocityUnit.MPS)
+
+        assert vehicle.state == VehicleState.DRIVING
+
+    def test_recover_when_accidented_then_stopped_and_can_drive(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        with pytest.raises(CrashedVehicleError):
+            vehicle.move(1.0, obstacle_found=True, will_hit_obstacle=True)
+        observer = RecordingObserver()
+        vehicle.add_observer(observer)
+
+        vehicle.recover()
+        vehicle.accelerate(5.0, VelocityUnit.MPS)
+
+        assert observer.events[:2] == [
+            ("velocity", 10.0, 0.0),
+            ("state", VehicleState.ACCIDENTED, VehicleState.STOPPED),
+        ]
+        assert vehicle.state == VehicleState.DRIVING
+
+    def test_recover_when_not_accidented_then_raises_exception(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        with pytest.raises(VehicleNotAccidentedError):
+            vehicle.recover()
+
+    def test_try_move_when_hits_obstacle_then_crashed_outcome(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        outcome = vehicle.try_move(1.0, obstacle_found=True, will_hit_obstacle=True)
+
+        assert outcome is CommandOutcome.CRASHED
+        assert vehicle.state == VehicleState.ACCIDENTED
+
+    def test_try_accelerate_when_accidented_then_rejected_outcome(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+        vehicle.try_move(1.0, obstacle_found=True, will_hit_obstacle=True)
+
+        assert vehicle.try_accelerate(1.0, VelocityUnit.MPS) is CommandOutcome.REJECTED
+        assert vehicle.try_turn(10.0) is CommandOutcome.REJECTED
+        assert vehicle.velocity == velocity
+
+    def test_try_turn_when_driving_then_ok_outcome(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        outcome = vehicle.try_turn(10.0)
+
+        assert outcome is CommandOutcome.OK
+        assert vehicle.heading == Heading(10.0)
+
+    def test_brake_to_a_stop_when_driving_then_shared_zero_velocity(
+        self,
+        coordinates: Coordinates,
+        velocity: Velocity
+    ) -> None:
+        vehicle = Vehicle.create(coordinates, velocity, vehicle_id="vehicle_1")
+
+        vehicle.brake_to_a_stop()
+
+        assert vehicle.velocity is Velocity.zero()
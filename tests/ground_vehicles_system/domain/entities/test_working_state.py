@@ -0,0 +1,98 @@
+import pytest
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.entities.vehicle_observer import VehicleObserver
+from ground_vehicles_system.domain.entities.working_state import FleetWorkingState
+from ground_vehicles_system.domain.errors.coordinates_errors import (
+    InvalidLatitudeError
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+class MoveCounter(VehicleObserver):
+    def __init__(self) -> None:
+        self.distances: list[float] = []
+
+    def on_moved(self, vehicle, distance_meters) -> None:
+        self.distances.append(distance_meters)
+
+
+def _vehicles() -> list[Vehicle]:
+    return [
+        Vehicle.create(
+            Coordinates(34.0 + index * 0.01, -118.0),
+            Velocity(float(index)),
+            vehicle_id=f"vehicle_{index}",
+            heading=Heading(index * 37.0),
+        )
+        for index in range(5)
+    ]
+
+
+class TestFleetWorkingState:
+    def test_commit_when_stepped_then_same_as_moving_each_vehicle(self) -> None:
+        expected_vehicles = _vehicles()
+        vehicles = _vehicles()
+        for _ in range(50):
+            for vehicle in expected_vehicles:
+                vehicle.move(0.1, obstacle_found=False, will_hit_obstacle=False)
+
+        working_state = FleetWorkingState(vehicles)
+        for _ in range(50):
+            working_state.step(0.1)
+        working_state.commit()
+
+        for vehicle, expected in zip(vehicles, expected_vehicles):
+            assert vehicle.coordinates == expected.coordinates
+            assert vehicle.odometer_meters == expected.odometer_meters
+            assert vehicle.driving_seconds == expected.driving_seconds
+            assert vehicle.idle_seconds == expected.idle_seconds
+
+    def test_step_when_not_committed_then_vehicles_unchanged(self) -> None:
+        vehicles = _vehicles()
+        working_state = FleetWorkingState(vehicles)
+
+        working_state.step(10.0)
+
+        assert vehicles[1].coordinates == Coordinates(34.01, -118.0)
+        assert working_state.latitudes[1] != 34.01
+
+    def test_commit_when_observed_then_one_notification_per_vehicle(self) -> None:
+        vehicle = _vehicles()[2]
+        observer = MoveCounter()
+        vehicle.add_observer(observer)
+        working_state = FleetWorkingState([vehicle])
+
+        for _ in range(10):
+            working_state.step(1.0)
+        working_state.commit()
+
+        assert observer.distances == [pytest.approx(20.0)]
+
+    def test_step_when_accidented_then_no_time_accounted(self) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(0.0, 0.0),
+            velocity=Velocity(5.0),
+            heading=Heading(0.0),
+            state=VehicleState.ACCIDENTED
+        )
+        working_state = FleetWorkingState([vehicle])
+
+        working_state.step(1.0)
+        working_state.commit()
+
+        assert vehicle.idle_seconds == 0.0
+        assert vehicle.coordinates == Coordinates(0.0, 0.0)
+
+    def test_commit_when_driven_out_of_range_then_raises_exception(self) -> None:
+        vehicle = Vehicle.create(
+            Coordinates(89.9999, 0.0), Velocity(100.0), vehicle_id="vehicle_1"
+        )
+        working_state = FleetWorkingState([vehicle])
+        working_state.step(100.0)
+
+        with pytest.raises(InvalidLatitudeError):
+            working_state.commit()
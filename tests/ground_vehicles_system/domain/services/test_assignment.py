@@ -0,0 +1,64 @@
+from itertools import permutations
+import math
+import random
+
+from ground_vehicles_system.domain.services.assignment import (
+    UNASSIGNED,
+    greedy_assignment,
+    solve_assignment
+)
+
+
+def _total(costs: list[list[float]], assigned: list[int]) -> float:
+    return sum(
+        costs[row][column]
+        for row, column in enumerate(assigned)
+        if column != UNASSIGNED
+    )
+
+
+class TestSolveAssignment:
+    def test_solve_assignment_when_square_then_minimal_total(self) -> None:
+        generator = random.Random(3)
+        costs = [[generator.uniform(0, 100) for _ in range(5)] for _ in range(5)]
+
+        assigned = solve_assignment(costs)
+
+        expected_total = min(
+            sum(costs[row][column] for row, column in enumerate(permutation))
+            for permutation in permutations(range(5))
+        )
+        assert sorted(assigned) == [0, 1, 2, 3, 4]
+        assert math.isclose(_total(costs, assigned), expected_total)
+
+    def test_solve_assignment_when_greedy_is_wrong_then_optimal(self) -> None:
+        costs = [[1.0, 2.0], [2.0, 100.0]]
+
+        assigned = solve_assignment(costs)
+
+        assert assigned == [1, 0]
+
+    def test_solve_assignment_when_more_rows_than_columns_then_some_unassigned(
+        self
+    ) -> None:
+        costs = [[5.0], [1.0], [3.0]]
+
+        assigned = solve_assignment(costs)
+
+        assert assigned == [UNASSIGNED, 0, UNASSIGNED]
+
+    def test_solve_assignment_when_forbidden_pairs_then_never_chosen(self) -> None:
+        costs = [[math.inf, math.inf], [1.0, math.inf]]
+
+        assigned = solve_assignment(costs)
+
+        assert assigned == [UNASSIGNED, 0]
+
+
+class TestGreedyAssignment:
+    def test_greedy_assignment_when_edges_then_cheapest_first(self) -> None:
+        edges = [(1.0, 0, 0), (2.0, 0, 1), (2.0, 1, 0)]
+
+        assigned = greedy_assignment(edges, 3)
+
+        assert assigned == [0, UNASSIGNED, UNASSIGNED]
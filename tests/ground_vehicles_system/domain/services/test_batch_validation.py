@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+from ground_vehicles_system.domain.errors.coordinates_errors import (
+    InvalidLatitudeError,
+    InvalidLongitudeError
+)
+from ground_vehicles_system.domain.errors.velocity_errors import InvalidVelocityError
+from ground_vehicles_system.domain.services.batch_validation import (
+    RejectionReason,
+    validate_coordinates,
+    validate_fixes,
+    validate_speeds
+)
+
+
+class TestValidateCoordinates:
+    def test_validate_coordinates_when_mixed_rows_then_mask_and_reasons(self):
+        validation = validate_coordinates(
+            [0.0, 91.0, math.nan, 10.0, -90.0],
+            [0.0, 0.0, 0.0, 180.5, -180.0],
+        )
+
+        assert list(validation.mask) == [1, 0, 0, 0, 1]
+        assert [validation.reason(row) for row in range(5)] == [
+            RejectionReason.VALID,
+            RejectionReason.INVALID_LATITUDE,
+            RejectionReason.INVALID_LATITUDE,
+            RejectionReason.INVALID_LONGITUDE,
+            RejectionReason.VALID,
+        ]
+        assert validation.valid_rows() == [0, 4]
+        assert validation.invalid_rows() == [1, 2, 3]
+
+    def test_error_when_rejected_then_matches_value_object_error(self):
+        validation = validate_coordinates([91.0, 0.0], [0.0, 181.0])
+
+        assert isinstance(validation.error(0), InvalidLatitudeError)
+        assert isinstance(validation.error(1), InvalidLongitudeError)
+
+    def test_validate_coordinates_when_lengths_differ_then_raises_exception(self):
+        with pytest.raises(ValueError):
+            validate_coordinates([0.0], [0.0, 1.0])
+
+
+class TestValidateSpeeds:
+    def test_validate_speeds_when_negative_nan_or_inf_then_invalid(self):
+        validation = validate_speeds([0.0, -1.0, math.nan, math.inf, 12.5])
+
+        assert list(validation.mask) == [1, 0, 0, 0, 1]
+        assert validation.counts() == {RejectionReason.INVALID_VELOCITY: 3}
+        assert isinstance(validation.error(1), InvalidVelocityError)
+
+
+class TestValidateFixes:
+    def test_validate_fixes_when_several_checks_fail_then_first_reason(self):
+        validation = validate_fixes(
+            [91.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [-1.0, -1.0, 1.0],
+            [0.0, 0.0, math.inf],
+        )
+
+        assert validation.counts() == {
+            RejectionReason.INVALID_LATITUDE: 1,
+            RejectionReason.INVALID_VELOCITY: 1,
+            RejectionReason.INVALID_HEADING: 1,
+        }
+        assert validation.valid_count == 0
@@ -0,0 +1,160 @@
+import pytest
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.errors.geofence_errors import (
+    DuplicateZoneError,
+    ZoneNotFoundError
+)
+from ground_vehicles_system.domain.services.geofencing import (
+    GeofenceEngine,
+    GeofenceEvent,
+    GeofenceTransition,
+    GeofenceZone
+)
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.polygon import Polygon
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+
+
+def square(min_latitude: float, min_longitude: float, size: float) -> Polygon:
+    return Polygon((
+        Coordinates(min_latitude, min_longitude),
+        Coordinates(min_latitude, min_longitude + size),
+        Coordinates(min_latitude + size, min_longitude + size),
+        Coordinates(min_latitude + size, min_longitude),
+    ))
+
+
+class TestGeofenceEngine:
+    @pytest.fixture
+    def engine(self) -> GeofenceEngine:
+        engine = GeofenceEngine(cell_size_degrees=0.5)
+        engine.add_zone(GeofenceZone("depot", square(0.0, 0.0, 1.0)))
+        engine.add_zone(GeofenceZone("city", square(0.5, 0.5, 1.0)))
+        return engine
+
+    def test_add_zone_when_id_already_registered_then_raises_exception(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        with pytest.raises(DuplicateZoneError):
+            engine.add_zone(GeofenceZone("depot", square(5.0, 5.0, 1.0)))
+
+    def test_remove_zone_when_id_not_registered_then_raises_exception(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        with pytest.raises(ZoneNotFoundError):
+            engine.remove_zone("airport")
+
+    def test_zones_containing_when_zones_overlap_then_returns_both(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        zone_ids = engine.zones_containing(0.75, 0.75)
+
+        assert zone_ids == {"depot", "city"}
+
+    def test_update_positions_when_vehicle_enters_then_enter_events(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        events = engine.update_positions(["vehicle_1"], [0.75], [0.75])
+
+        expected_events = [
+            GeofenceEvent("vehicle_1", "city", GeofenceTransition.ENTER),
+            GeofenceEvent("vehicle_1", "depot", GeofenceTransition.ENTER),
+        ]
+        assert events == expected_events
+        assert engine.membership("vehicle_1") == {"depot", "city"}
+
+    def test_update_positions_when_vehicle_stays_inside_then_no_events(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        engine.update_positions(["vehicle_1"], [0.2], [0.2])
+
+        events = engine.update_positions(["vehicle_1"], [0.3], [0.3])
+
+        assert events == []
+
+    def test_update_positions_when_vehicle_leaves_then_exit_event(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        engine.update_positions(["vehicle_1"], [0.2], [0.2])
+
+        events = engine.update_positions(["vehicle_1"], [3.0], [3.0])
+
+        expected_events = [
+            GeofenceEvent("vehicle_1", "depot", GeofenceTransition.EXIT)
+        ]
+        assert events == expected_events
+        assert engine.membership("vehicle_1") == frozenset()
+
+    def test_update_positions_when_columns_differ_in_length_then_raises_exception(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        with pytest.raises(ValueError):
+            engine.update_positions(["vehicle_1"], [0.2, 0.3], [0.2])
+
+    def test_add_zone_when_vehicle_already_inside_then_next_update_enters(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        engine.update_positions(["vehicle_1"], [5.2], [5.2])
+        engine.add_zone(GeofenceZone("airport", square(5.0, 5.0, 1.0)))
+
+        events = engine.update_positions(["vehicle_1"], [5.2], [5.2])
+
+        expected_events = [
+            GeofenceEvent("vehicle_1", "airport", GeofenceTransition.ENTER)
+        ]
+        assert events == expected_events
+
+    def test_remove_zone_when_vehicle_inside_then_exit_event(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        engine.update_positions(["vehicle_1"], [0.2], [0.2])
+
+        events = engine.remove_zone("depot")
+
+        expected_events = [
+            GeofenceEvent("vehicle_1", "depot", GeofenceTransition.EXIT)
+        ]
+        assert events == expected_events
+        assert engine.membership("vehicle_1") == frozenset()
+
+    def test_forget_when_vehicle_inside_then_exit_events(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        engine.update_positions(["vehicle_1"], [0.75], [0.75])
+
+        events = engine.forget("vehicle_1")
+
+        expected_zone_ids = ["city", "depot"]
+        assert [event.zone_id for event in events] == expected_zone_ids
+        assert all(event.transition == GeofenceTransition.EXIT for event in events)
+
+    def test_update_when_vehicles_then_uses_their_coordinates(
+        self,
+        engine: GeofenceEngine
+    ) -> None:
+        vehicle = Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(0.2, 0.2),
+            velocity=Velocity(0.0),
+            heading=Heading(0.0),
+            state=VehicleState.STOPPED
+        )
+
+        events = engine.update([vehicle])
+
+        expected_events = [
+            GeofenceEvent("vehicle_1", "depot", GeofenceTransition.ENTER)
+        ]
+        assert events == expected_events
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from ground_vehicles_system.domain.services.sorted_blocks import SortedBlockList
+
+
+class TestSortedBlockList:
+    def test_init_when_keys_unsorted_then_iterates_in_order_once(self) -> None:
+        keys = SortedBlockList(["c", "a", "b", "a"], block_size=2)
+
+        assert list(keys) == ["a", "b", "c"]
+        assert len(keys) == 3
+
+    def test_add_when_blocks_overflow_then_order_is_kept(self) -> None:
+        keys: SortedBlockList[int] = SortedBlockList(block_size=4)
+        values = list(range(200))
+        random.Random(7).shuffle(values)
+
+        for value in values:
+            keys.add(value)
+        keys.add(10)
+
+        assert list(keys) == list(range(200))
+        assert len(keys) == 200
+
+    def test_discard_when_keys_removed_then_gone_and_others_kept(self) -> None:
+        keys = SortedBlockList(range(100), block_size=4)
+
+        for value in range(0, 100, 3):
+            keys.discard(value)
+        keys.discard(1_000)
+
+        assert list(keys) == [value for value in range(100) if value % 3]
+        assert 3 not in keys
+        assert 4 in keys
+
+    def test_after_when_key_given_then_yields_greater_keys(self) -> None:
+        keys = SortedBlockList(range(0, 20, 2), block_size=3)
+
+        assert list(keys.after(7)) == [8, 10, 12, 14, 16, 18]
+        assert list(keys.after(8)) == [10, 12, 14, 16, 18]
+        assert list(keys.after(18)) == []
+        assert list(keys.after(None)) == list(range(0, 20, 2))
+
+    def test_starting_at_when_key_given_then_yields_keys_from_it(self) -> None:
+        keys = SortedBlockList(range(0, 20, 2), block_size=3)
+
+        assert list(keys.starting_at(7)) == [8, 10, 12, 14, 16, 18]
+        assert list(keys.starting_at(8)) == [8, 10, 12, 14, 16, 18]
+        assert list(keys.starting_at(19)) == []
+
+    def test_init_when_block_size_not_positive_then_raises_exception(self) -> None:
+        with pytest.raises(ValueError):
+            SortedBlockList(block_size=0)
@@ -0,0 +1,223 @@
+import random
+
+import pytest
+
+from ground_vehicles_system.domain.common.motion import ground_distance_meters
+from ground_vehicles_system.domain.services.spatial_index import (
+    BoxGridIndex,
+    PointGridIndex,
+    cell_of
+)
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+
+class TestCellOf:
+    def test_cell_of_when_negative_coordinates_then_floors_towards_minus_infinity(
+        self
+    ):
+        cell = cell_of(-0.5, -1.5, 1.0)
+
+        expected_cell = (-1, -2)
+        assert cell == expected_cell
+
+
+class TestBoxGridIndex:
+    def test_init_when_cell_size_not_positive_then_raises_exception(self):
+        with pytest.raises(ValueError):
+            BoxGridIndex(0.0)
+
+    def test_candidates_at_when_box_covers_point_then_returns_key(self):
+        index: BoxGridIndex[str] = BoxGridIndex(1.0)
+        index.insert("zone_1", BoundingBox(0.0, 0.0, 2.5, 2.5))
+
+        candidates = index.candidates_at(2.2, 1.1)
+
+        assert set(candidates) == {"zone_1"}
+
+    def test_candidates_at_when_no_box_then_empty(self):
+        index: BoxGridIndex[str] = BoxGridIndex(1.0)
+        index.insert("zone_1", BoundingBox(0.0, 0.0, 1.5, 1.5))
+
+        candidates = index.candidates_at(5.0, 5.0)
+
+        assert not candidates
+
+    def test_insert_when_key_exists_then_replaces_box(self):
+        index: BoxGridIndex[str] = BoxGridIndex(1.0)
+        index.insert("zone_1", BoundingBox(0.0, 0.0, 0.5, 0.5))
+
+        index.insert("zone_1", BoundingBox(5.0, 5.0, 5.5, 5.5))
+
+        assert not index.candidates_at(0.2, 0.2)
+        assert set(index.candidates_at(5.2, 5.2)) == {"zone_1"}
+        assert len(index) == 1
+
+    def test_remove_when_key_exists_then_cells_are_released(self):
+        index: BoxGridIndex[str] = BoxGridIndex(1.0)
+        index.insert("zone_1", BoundingBox(0.0, 0.0, 1.5, 1.5))
+
+        index.remove("zone_1")
+
+        assert "zone_1" not in index
+        assert not index.candidates_at(0.2, 0.2)
+
+    def test_insert_when_box_spans_too_many_cells_then_candidate_everywhere(self):
+        index: BoxGridIndex[str] = BoxGridIndex(0.01, max_cells_per_box=100)
+        index.insert("world", BoundingBox(-90.0, -180.0, 90.0, 180.0))
+        index.insert("zone_1", BoundingBox(0.0, 0.0, 0.005, 0.005))
+
+        assert set(index.candidates_at(0.001, 0.001)) == {"world", "zone_1"}
+        assert set(index.candidates_at(-45.0, 170.0)) == {"world"}
+
+        index.remove("world")
+
+        assert not index.candidates_at(-45.0, 170.0)
+        assert "world" not in index
+
+
+class TestPointGridIndex:
+    def test_insert_when_key_moves_to_other_cell_then_old_cell_released(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        index.insert("vehicle_1", 0.5, 0.5)
+
+        index.insert("vehicle_1", 3.5, 3.5)
+
+        assert not index.keys_in_cell((0, 0))
+        assert set(index.keys_in_cell((3, 3))) == {"vehicle_1"}
+        assert index.position_of("vehicle_1") == (3.5, 3.5)
+
+    def test_cells_in_box_when_small_box_then_occupied_cells_in_order(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        index.insert("vehicle_1", 1.5, 0.5)
+        index.insert("vehicle_2", 0.5, 1.5)
+        index.insert("vehicle_3", 9.5, 9.5)
+
+        cells = index.cells_in_box(BoundingBox(0.0, 0.0, 2.0, 2.0))
+
+        expected_cells = [(0, 1), (1, 0)]
+        assert cells == expected_cells
+
+    def test_cells_in_box_when_box_spans_many_cells_then_same_as_small_box(self):
+        index: PointGridIndex[str] = PointGridIndex(0.001)
+        index.insert("vehicle_1", 1.5, 0.5)
+        index.insert("vehicle_2", -40.0, 100.0)
+
+        cells = index.cells_in_box(BoundingBox(-90.0, -180.0, 90.0, 180.0))
+
+        expected_cells = [(-40000, 100000), (1500, 500)]
+        assert cells == expected_cells
+
+    def test_occupied_cells_in_box_when_start_then_resumes_inside_columns(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        for key, latitude, longitude in (
+            ("left", 1.5, -5.5),
+            ("first", 1.5, 0.5),
+            ("second", 1.5, 1.5),
+            ("right", 1.5, 9.5),
+            ("third", 2.5, 0.5),
+            ("above", 9.5, 0.5),
+        ):
+            index.insert(key, latitude, longitude)
+        box = BoundingBox(0.0, 0.0, 3.0, 2.0)
+
+        cells = list(index.occupied_cells_in_box(box, start=(1, 1)))
+
+        expected_cells = [(1, 1), (2, 0)]
+        assert cells == expected_cells
+        assert list(index.occupied_cells_in_box(box)) == [(1, 0), (1, 1), (2, 0)]
+
+    def test_remove_when_last_key_of_cell_then_cell_not_listed(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        index.insert("vehicle_1", 0.5, 0.5)
+        index.insert("vehicle_1", 1.5, 0.5)
+
+        cells = list(index.occupied_cells_in_box(BoundingBox(0.0, 0.0, 2.0, 2.0)))
+
+        assert cells == [(1, 0)]
+
+    def test_cells_between_when_range_spans_many_cells_then_occupied_only(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        index.insert("vehicle_1", 1.5, -500_000.5)
+        index.insert("vehicle_2", 2.5, 0.5)
+        index.insert("vehicle_3", 5.5, 0.5)
+
+        cells = index.cells_between((0, -1_000_000), (3, 1_000_000))
+
+        expected_cells = [(1, -500_001), (2, 0)]
+        assert cells == expected_cells
+
+    def test_remove_when_key_exists_then_not_contained(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+        index.insert("vehicle_1", 0.5, 0.5)
+
+        index.remove("vehicle_1")
+
+        assert "vehicle_1" not in index
+        assert not index.keys_in_cell((0, 0))
+
+    def test_nearest_when_empty_then_none(self):
+        index: PointGridIndex[str] = PointGridIndex(1.0)
+
+        assert index.nearest(0.0, 0.0) is None
+
+    def test_nearest_when_many_points_then_same_as_brute_force(self):
+        generator = random.Random(7)
+        index: PointGridIndex[int] = PointGridIndex(0.001)
+        points = {
+            key: (
+                34.0 + generator.uniform(-0.01, 0.01),
+                -118.0 + generator.uniform(-0.01, 0.01)
+            )
+            for key in range(300)
+        }
+        for key, (latitude, longitude) in points.items():
+            index.insert(key, latitude, longitude)
+
+        for _ in range(50):
+            latitude = 34.0 + generator.uniform(-0.02, 0.02)
+            longitude = -118.0 + generator.uniform(-0.02, 0.02)
+
+            expected_key = min(
+                points,
+                key=lambda key: ground_distance_meters(
+                    latitude, longitude, *points[key]
+                )
+            )
+            assert index.nearest(latitude, longitude) == expected_key
+
+    def test_nearest_many_when_max_distance_then_closest_within_it(self):
+        index: PointGridIndex[str] = PointGridIndex(0.001)
+        index.insert("near", 0.0, 0.0001)
+        index.insert("middle", 0.0, 0.0003)
+        index.insert("far", 0.0, 0.01)
+
+        found = index.nearest_many(0.0, 0.0, 5, max_distance_meters=100.0)
+
+        assert [key for _, key in found] == ["near", "middle"]
+        assert found[0][0] < found[1][0]
+
+    def test_nearest_many_when_many_points_then_same_as_brute_force(self):
+        generator = random.Random(11)
+        index: PointGridIndex[int] = PointGridIndex(0.001)
+        points = {
+            key: (
+                34.0 + generator.uniform(-0.01, 0.01),
+                -118.0 + generator.uniform(-0.01, 0.01)
+            )
+            for key in range(300)
+        }
+        for key, (latitude, longitude) in points.items():
+            index.insert(key, latitude, longitude)
+
+        for _ in range(20):
+            latitude = 34.0 + generator.uniform(-0.02, 0.02)
+            longitude = -118.0 + generator.uniform(-0.02, 0.02)
+
+            expected_keys = sorted(
+                points,
+                key=lambda key: ground_distance_meters(
+                    latitude, longitude, *points[key]
+                )
+            )[:5]
+            found = index.nearest_many(latitude, longitude, 5)
+            assert [key for _, key in found] == expected_keys
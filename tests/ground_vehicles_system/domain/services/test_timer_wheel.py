@@ -0,0 +1,51 @@
+import pytest
+
+from ground_vehicles_system.domain.services.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    def test_advance_when_deadlines_pass_then_fires_in_deadline_order(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(1.0, slots=8)
+        wheel.schedule("late", 5.0)
+        wheel.schedule("early", 2.0)
+        wheel.schedule("never", 50.0)
+
+        fired = wheel.advance(6.0)
+
+        assert fired == ["early", "late"]
+        assert "never" in wheel
+
+    def test_advance_when_deadline_not_reached_then_nothing_fires(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(1.0, slots=8)
+        wheel.schedule("timer", 3.0)
+
+        assert wheel.advance(2.5) == []
+        assert wheel.advance(0.5) == ["timer"]
+
+    def test_advance_when_more_than_a_turn_then_fires_later_rounds(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(1.0, slots=4)
+        wheel.schedule("timer", 10.0)
+
+        assert wheel.advance(9.0) == []
+        assert wheel.advance(1.0) == ["timer"]
+        assert len(wheel) == 0
+
+    def test_schedule_when_rescheduled_then_only_new_deadline_fires(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(1.0, slots=8)
+        wheel.schedule("timer", 2.0)
+        wheel.schedule("timer", 4.0)
+
+        assert wheel.advance(3.0) == []
+        assert wheel.advance(1.0) == ["timer"]
+
+    def test_cancel_when_scheduled_then_never_fires(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(1.0, slots=8)
+        wheel.schedule("timer", 2.0)
+
+        wheel.cancel("timer")
+
+        assert wheel.advance(10.0) == []
+
+    def test_init_when_slot_seconds_not_positive_then_raises_exception(self) -> None:
+        with pytest.raises(ValueError):
+            TimerWheel(0.0)
@@ -0,0 +1,35 @@
+import pytest
+
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+
+
+class TestBoundingBox:
+    def test_init_when_min_latitude_bigger_than_max_then_raises_exception(self):
+        with pytest.raises(ValueError):
+            BoundingBox(10.0, 0.0, 5.0, 1.0)
+
+    def test_init_when_min_longitude_bigger_than_max_then_raises_exception(self):
+        with pytest.raises(ValueError):
+            BoundingBox(0.0, 10.0, 1.0, 5.0)
+
+    def test_contains_when_point_on_border_then_true(self):
+        box = BoundingBox(0.0, 0.0, 1.0, 1.0)
+
+        assert box.contains(1.0, 0.5)
+
+    def test_contains_when_point_outside_then_false(self):
+        box = BoundingBox(0.0, 0.0, 1.0, 1.0)
+
+        assert not box.contains(1.5, 0.5)
+
+    def test_intersects_when_boxes_overlap_then_true(self):
+        box = BoundingBox(0.0, 0.0, 1.0, 1.0)
+        other = BoundingBox(0.5, 0.5, 2.0, 2.0)
+
+        assert box.intersects(other)
+
+    def test_intersects_when_boxes_are_apart_then_false(self):
+        box = BoundingBox(0.0, 0.0, 1.0, 1.0)
+        other = BoundingBox(2.0, 2.0, 3.0, 3.0)
+
+        assert not box.intersects(other)
@@ -66,3 +66,12 @@ class TestCoordinates:
         expected_longitude = -118.3437
         assert new_coordinates.latitude == expected_latitude
         assert pytest.approx(new_coordinates.longitude) == expected_longitude
+
+    def test_from_validated_when_values_then_equal_to_validated_coordinates(self):
+        actual_latitude = 34.0522
+        actual_longitude = -118.2437
+
+        coordinates = Coordinates.from_validated(actual_latitude, actual_longitude)
+
+        expected_coordinates = Coordinates(34.0522, -118.2437)
+        assert coordinates == expected_coordinates
@@ -41,3 +41,31 @@ class TestHeading:
 
         expected = 10.0
         assert new_heading.degrees == expected
+
+    def test_sin_and_cos_when_heading_is_90_then_east_unit_vector(self):
+        heading = Heading(90.0)
+
+        assert heading.sin == 1.0
+        assert abs(heading.cos) < 1e-15
+
+    def test_radians_when_read_twice_then_cached(self):
+        heading = Heading(45.0)
+
+        first = heading.radians
+
+        assert heading.__dict__["radians"] == first
+        assert heading == Heading(45.0)
+
+    def test_difference_to_when_crossing_north_then_shortest_turn(self):
+        difference = Heading(350.0).difference_to(Heading(10.0))
+
+        expected = 20.0
+        assert difference == expected
+
+    def test_turn_when_landing_on_cardinal_heading_then_shared_instance(self):
+        heading = Heading(45.0)
+
+        turned = heading.turn(45.0)
+
+        assert turned is Heading.of(90.0)
+        assert Heading.of(10.0) == Heading(10.0)
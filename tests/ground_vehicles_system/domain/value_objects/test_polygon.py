@@ -0,0 +1,64 @@
+import pytest
+
+from ground_vehicles_system.domain.errors.polygon_errors import InvalidPolygonError
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.polygon import Polygon
+
+
+class TestPolygon:
+    @pytest.fixture
+    def concave_polygon(self) -> Polygon:
+        # An "L" shape: the square (0, 0)-(2, 2) minus its top-right quarter.
+        return Polygon((
+            Coordinates(0.0, 0.0),
+            Coordinates(0.0, 2.0),
+            Coordinates(1.0, 2.0),
+            Coordinates(1.0, 1.0),
+            Coordinates(2.0, 1.0),
+            Coordinates(2.0, 0.0),
+        ))
+
+    def test_init_when_less_than_three_vertices_then_raises_exception(self):
+        with pytest.raises(InvalidPolygonError):
+            Polygon((Coordinates(0.0, 0.0), Coordinates(1.0, 1.0)))
+
+    def test_bounding_box_when_polygon_then_box_covers_vertices(
+        self,
+        concave_polygon: Polygon
+    ):
+        box = concave_polygon.bounding_box
+
+        expected_box = BoundingBox(0.0, 0.0, 2.0, 2.0)
+        assert box == expected_box
+
+    def test_contains_when_point_inside_then_true(self, concave_polygon: Polygon):
+        assert concave_polygon.contains(0.5, 1.5)
+
+    def test_contains_when_point_in_concave_notch_then_false(
+        self,
+        concave_polygon: Polygon
+    ):
+        assert not concave_polygon.contains(1.5, 1.5)
+
+    def test_contains_when_point_outside_bounding_box_then_false(
+        self,
+        concave_polygon: Polygon
+    ):
+        assert not concave_polygon.contains(5.0, 5.0)
+
+    def test_contains_many_when_points_then_matches_contains(
+        self,
+        concave_polygon: Polygon
+    ):
+        latitudes = [0.5, 1.5, 1.5, 5.0, 0.1]
+        longitudes = [1.5, 1.5, 0.5, 5.0, 0.1]
+
+        result = concave_polygon.contains_many(latitudes, longitudes)
+
+        expected = [
+            concave_polygon.contains(latitude, longitude)
+            for latitude, longitude in zip(latitudes, longitudes)
+        ]
+        assert result == expected
+        assert result == [True, False, True, False, True]
@@ -1,6 +1,16 @@
 import pytest
 
-from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+from ground_vehicles_system.domain.common.constants import GeodeticConstants
+from ground_vehicles_system.domain.value_objects.velocity import (
+    UNIT_CODES,
+    Velocity,
+    VelocityConstants,
+    VelocityUnit,
+    conversion_factor,
+    convert_speeds,
+    speeds_to_mps,
+    unit_code
+)
 
 
 class TestVelocity:
@@ -159,3 +169,57 @@ class TestVelocity:
 
         with pytest.raises(AttributeError):
             velocity.new_attribute = "test" # type: ignore
+
+
+class TestConversionMatrix:
+    @pytest.mark.parametrize("from_unit", list(VelocityUnit))
+    @pytest.mark.parametrize("to_unit", list(VelocityUnit))
+    def test_conversion_factor_when_round_trip_then_identity(
+        self,
+        from_unit: VelocityUnit,
+        to_unit: VelocityUnit
+    ) -> None:
+        factor = conversion_factor(from_unit, to_unit)
+
+        assert pytest.approx(factor * conversion_factor(to_unit, from_unit)) == 1.0
+
+    def test_km_per_mph_when_compared_then_matches_velocity_constants(self) -> None:
+        expected = VelocityConstants.MILES_PER_HOUR_TO_KILOMETERS_PER_HOUR
+
+        assert pytest.approx(GeodeticConstants.KM_PER_MPH, rel=1e-12) == expected
+
+    def test_convert_speeds_when_kph_to_mph_then_each_value_converted(self) -> None:
+        speeds = convert_speeds(
+            [0.0, 1.609344, 160.9344], VelocityUnit.KPH, VelocityUnit.MPH
+        )
+
+        assert list(speeds) == pytest.approx([0.0, 1.0, 100.0])
+
+    def test_speeds_to_mps_when_mixed_units_then_all_in_mps(self) -> None:
+        codes = [unit_code(VelocityUnit.MPS), unit_code(VelocityUnit.KPH)]
+
+        speeds = speeds_to_mps([5.0, 36.0], codes)
+
+        assert list(speeds) == pytest.approx([5.0, 10.0])
+        assert UNIT_CODES[codes[1]] == VelocityUnit.KPH
+
+    def test_many_from_units_when_mixed_units_then_velocities_in_mps(self) -> None:
+        velocities = Velocity.many_from_units(
+            [10.0, 36.0, 22.369362920544024],
+            [VelocityUnit.MPS, VelocityUnit.KPH, VelocityUnit.MPH],
+        )
+
+        assert [velocity.to_mps() for velocity in velocities] == pytest.approx(
+            [10.0, 10.0, 10.0]
+        )
+
+    def test_to_when_unit_given_then_matches_named_conversions(self) -> None:
+        velocity = Velocity(10.0)
+
+        assert velocity.to(VelocityUnit.KPH) == velocity.to_kph()
+        assert velocity.to(VelocityUnit.MPH) == velocity.to_mph()
+        assert velocity.to(VelocityUnit.MPS) == 10.0
+
+    def test_zero_when_called_twice_then_shared_instance(self) -> None:
+        assert Velocity.zero() is Velocity.zero()
+        assert Velocity.zero() == Velocity(0.0)
@@ -0,0 +1,233 @@
+import math
+
+import pytest
+
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+from ground_vehicles_system.infrastructure.codecs.vehicle_frame_codec import (
+    STATE_CODES,
+    FrameColumns,
+    VehicleFrameDecoder,
+    VehicleFrameEncoder
+)
+from ground_vehicles_system.infrastructure.errors.codec_errors import (
+    FrameDecodeError,
+    FrameEncodeError
+)
+
+
+def make_vehicles() -> list[Vehicle]:
+    return [
+        Vehicle(
+            vehicle_id="vehicle_1",
+            coordinates=Coordinates(34.0522, -118.2437),
+            velocity=Velocity(12.34),
+            heading=Heading(90.5),
+            state=VehicleState.DRIVING
+        ),
+        Vehicle(
+            vehicle_id="vehicle_2",
+            coordinates=Coordinates(-33.8688, 151.2093),
+            velocity=Velocity(0.0),
+            heading=Heading(359.99),
+            state=VehicleState.PARKING
+        ),
+    ]
+
+
+class TestVehicleFrameCodec:
+    def test_decode_when_frame_encoded_then_round_trips_quantized_state(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        buffer = bytearray()
+
+        length = VehicleFrameEncoder().encode(vehicles, buffer)
+        columns = VehicleFrameDecoder().decode(memoryview(buffer)[:length])
+
+        expected_size = 2
+        assert columns.size == expected_size
+        assert columns.vehicle_ids[:2] == ["vehicle_1", "vehicle_2"]
+        assert list(columns.latitudes[:2]) == [34.0522, -33.8688]
+        assert list(columns.longitudes[:2]) == [-118.2437, 151.2093]
+        assert list(columns.speeds_mps[:2]) == [12.34, 0.0]
+        assert list(columns.headings_degrees[:2]) == [90.5, 359.99]
+        assert columns.states[:2] == [VehicleState.DRIVING, VehicleState.PARKING]
+
+    def test_decode_when_vehicle_has_driven_then_round_trips_odometry(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        vehicles[0].move(2.5, False, False)
+        vehicles[1].move(1.25, False, False)
+        buffer = bytearray()
+
+        length = VehicleFrameEncoder().encode(vehicles, buffer)
+        columns = VehicleFrameDecoder().decode(buffer[:length])
+
+        assert list(columns.odometers_meters[:2]) == [
+            round(vehicles[0].odometer_meters, 2), 0.0
+        ]
+        assert list(columns.driving_seconds[:2]) == [2.5, 0.0]
+        assert list(columns.idle_seconds[:2]) == [0.0, 1.25]
+
+    def test_encode_when_vehicles_barely_moved_then_delta_frame_is_smaller(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        buffer = bytearray()
+        first_length = encoder.encode(vehicles, buffer)
+
+        vehicles[0].move(1.0, False, False)
+        second_length = encoder.encode(vehicles, buffer)
+
+        assert second_length < first_length
+        expected_delta_length = 2 + 2 * 11
+        assert second_length <= expected_delta_length
+
+    def test_decode_when_frames_in_sequence_then_tracks_each_vehicle(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        decoder = VehicleFrameDecoder()
+        buffer = bytearray()
+        columns = FrameColumns()
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer)], columns)
+
+        vehicles[0].move(10.0, False, False)
+        length = encoder.encode(vehicles, buffer)
+        decoder.decode(buffer[:length], columns)
+
+        assert columns.latitudes[0] == round(
+            vehicles[0].coordinates.latitude, 6
+        )
+        assert columns.longitudes[0] == round(
+            vehicles[0].coordinates.longitude, 6
+        )
+
+    def test_decode_when_keyframe_then_decoder_resynchronizes(self) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        buffer = bytearray()
+        encoder.encode(vehicles, buffer)
+
+        length = encoder.encode(vehicles[1:], buffer, keyframe=True)
+        columns = VehicleFrameDecoder().decode(buffer[:length])
+
+        assert columns.size == 1
+        assert columns.vehicle_ids[0] == "vehicle_2"
+        assert columns.latitudes[0] == -33.8688
+
+    def test_decode_when_columns_reused_then_arrays_are_not_reallocated(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        decoder = VehicleFrameDecoder()
+        buffer = bytearray()
+        columns = FrameColumns()
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer)], columns)
+        latitudes = columns.latitudes
+
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer)], columns)
+
+        assert columns.latitudes is latitudes
+        assert len(columns.latitudes) == 2
+
+    def test_decode_when_frame_is_truncated_then_raises_exception(self) -> None:
+        buffer = bytearray()
+        length = VehicleFrameEncoder().encode(make_vehicles(), buffer)
+
+        with pytest.raises(FrameDecodeError):
+            VehicleFrameDecoder().decode(buffer[:length - 1])
+
+    def test_decode_when_slot_is_unknown_then_raises_exception(self) -> None:
+        frame = bytes([0, 1, 5] + [0] * 8)
+
+        with pytest.raises(FrameDecodeError, match="unknown slot"):
+            VehicleFrameDecoder().decode(frame)
+
+    def test_decode_when_record_count_exceeds_frame_then_raises_before_allocating(
+        self
+    ) -> None:
+        frame = bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0x0F])
+        columns = FrameColumns()
+
+        with pytest.raises(FrameDecodeError):
+            VehicleFrameDecoder().decode(frame, columns)
+
+        assert len(columns.latitudes) == 0
+
+    def test_decode_when_frame_fails_midway_then_next_frame_still_decodes(
+        self
+    ) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        decoder = VehicleFrameDecoder()
+        buffer = bytearray()
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer)])
+        vehicles[0].move(10.0, False, False)
+        length = encoder.encode(vehicles, buffer)
+        frame = bytes(buffer[:length])
+        corrupted = frame[:-1] + bytes([len(STATE_CODES)])
+
+        with pytest.raises(FrameDecodeError):
+            decoder.decode(corrupted)
+        columns = decoder.decode(frame)
+
+        assert columns.latitudes[0] == round(vehicles[0].coordinates.latitude, 6)
+        assert columns.vehicle_ids[:2] == ["vehicle_1", "vehicle_2"]
+
+    def test_decode_when_frame_is_empty_then_raises_exception(self) -> None:
+        with pytest.raises(FrameDecodeError):
+            VehicleFrameDecoder().decode(b"")
+
+    def test_decode_when_varint_too_long_then_raises_exception(self) -> None:
+        frame = bytes([0, 1, 0] + [0xFF] * 20)
+
+        with pytest.raises(FrameDecodeError, match="varint longer"):
+            VehicleFrameDecoder().decode(frame)
+
+    def test_decode_when_delta_overflows_int64_then_rolls_back(self) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        decoder = VehicleFrameDecoder()
+        buffer = bytearray()
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer, keyframe=True)])
+        # Slot 1, a zero latitude delta, then a longitude delta of 2**63.
+        overflowing = bytes([0, 1, 1, 0] + [0x80] * 9 + [0x02] + [0] * 5 + [0])
+
+        with pytest.raises(FrameDecodeError, match="out of range"):
+            decoder.decode(overflowing)
+        columns = decoder.decode(buffer[:encoder.encode(vehicles, buffer)])
+
+        assert columns.longitudes[1] == vehicles[1].coordinates.longitude
+
+    def test_encode_when_value_is_nan_then_raises_and_stays_in_sync(self) -> None:
+        vehicles = make_vehicles()
+        encoder = VehicleFrameEncoder()
+        decoder = VehicleFrameDecoder()
+        buffer = bytearray()
+        decoder.decode(buffer[:encoder.encode(vehicles, buffer, keyframe=True)])
+
+        with pytest.raises(FrameEncodeError):
+            encoder.encode_columns(
+                ["vehicle_1", "vehicle_2"],
+                [1.0, 2.0],
+                [1.0, 2.0],
+                [1.0, math.nan],
+                [0.0, 0.0],
+                [VehicleState.DRIVING, VehicleState.DRIVING],
+                [0.0, 0.0],
+                [0.0, 0.0],
+                [0.0, 0.0],
+                buffer,
+            )
+        columns = decoder.decode(buffer[:encoder.encode(vehicles, buffer)])
+
+        assert columns.latitudes[0] == vehicles[0].coordinates.latitude
+        assert columns.speeds_mps[1] == 0.0
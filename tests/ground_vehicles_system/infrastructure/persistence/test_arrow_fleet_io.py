@@ -0,0 +1,169 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.services.batch_validation import RejectionReason
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+from ground_vehicles_system.infrastructure.persistence.arrow_fleet_io import (
+    ArrowFleetImporter,
+    fleet_record_batches,
+    fleet_schema,
+    fleet_to_table,
+    write_fleet_ipc,
+    write_fleet_parquet
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+class TestArrowFleetIo:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        fleet = Fleet.create(
+            Vehicle.create(
+                Coordinates(34.0 + index * 0.000_000_1, -118.0),
+                Velocity(index * 0.1),
+                vehicle_id=f"vehicle_{index}",
+                heading=Heading(float(index)),
+            )
+            for index in range(10)
+        )
+        for vehicle in fleet:
+            vehicle.move(2.0, obstacle_found=False, will_hit_obstacle=False)
+        return fleet
+
+    def test_fleet_record_batches_when_batch_rows_then_bounded_batches(
+        self,
+        fleet: Fleet
+    ) -> None:
+        batches = list(fleet_record_batches(fleet, batch_rows=4))
+
+        assert [batch.num_rows for batch in batches] == [4, 4, 2]
+        assert batches[0].schema == fleet_schema()
+
+    def test_import_table_when_exported_then_round_trips_exactly(
+        self,
+        fleet: Fleet
+    ) -> None:
+        imported = Fleet.create()
+
+        report = ArrowFleetImporter(imported).import_table(
+            fleet_to_table(fleet, include_odometry=True)
+        )
+
+        assert report.imported == 10
+        for vehicle in fleet:
+            copy = imported.get(vehicle.vehicle_id)
+            assert copy.coordinates == vehicle.coordinates
+            assert copy.velocity == vehicle.velocity
+            assert copy.state == vehicle.state
+            assert copy.odometer_meters == vehicle.odometer_meters
+
+    def test_import_parquet_when_written_in_batches_then_all_vehicles(
+        self,
+        fleet: Fleet,
+        tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "fleet.parquet")
+        write_fleet_parquet(fleet, path, batch_rows=3)
+        imported = Fleet.create()
+
+        report = ArrowFleetImporter(imported).import_parquet(path, batch_rows=4)
+
+        assert report.imported == 10
+        assert len(imported) == 10
+
+    def test_import_ipc_when_written_then_all_vehicles(
+        self,
+        fleet: Fleet,
+        tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "fleet.arrows")
+        write_fleet_ipc(fleet, path, batch_rows=3)
+        imported = Fleet.create()
+
+        report = ArrowFleetImporter(imported).import_ipc(path)
+
+        assert report.imported == 10
+
+    def test_import_batches_when_invalid_rows_then_reported_and_skipped(
+        self
+    ) -> None:
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "vehicle_id": ["ok", "latitude", "speed", "state", "nan"],
+                "latitude": [1.0, 91.0, 1.0, 1.0, math.nan],
+                "longitude": [1.0, 1.0, 1.0, 1.0, 1.0],
+                "speed_mps": [1.0, 1.0, -1.0, 1.0, 1.0],
+                "heading_degrees": [0.0, 0.0, 0.0, 0.0, 0.0],
+                "state": ["driving", "driving", "driving", "flying", "driving"],
+            },
+            schema=fleet_schema(),
+        )
+        imported = Fleet.create()
+
+        report = ArrowFleetImporter(imported).import_batches([batch])
+
+        assert report.imported == 1
+        assert report.rejected_rows == [1, 2, 3, 4]
+        assert report.rejections == {
+            RejectionReason.INVALID_LATITUDE: 2,
+            RejectionReason.INVALID_VELOCITY: 1,
+            RejectionReason.INVALID_STATE: 1,
+        }
+        assert imported.get("ok").state == VehicleState.DRIVING
+
+    def test_import_batches_when_invalid_odometry_then_rejected(self) -> None:
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "vehicle_id": ["ok", "negative", "infinite", "nan"],
+                "latitude": [1.0, 1.0, 1.0, 1.0],
+                "longitude": [1.0, 1.0, 1.0, 1.0],
+                "speed_mps": [1.0, 1.0, 1.0, 1.0],
+                "heading_degrees": [0.0, 0.0, 0.0, 0.0],
+                "state": ["driving", "driving", "driving", "driving"],
+                "odometer_meters": [10.0, -1.0, 10.0, 10.0],
+                "driving_seconds": [5.0, 5.0, math.inf, 5.0],
+                "idle_seconds": [0.0, 0.0, 0.0, math.nan],
+            },
+            schema=fleet_schema(include_odometry=True),
+        )
+        imported = Fleet.create()
+
+        report = ArrowFleetImporter(imported).import_batches([batch])
+
+        assert report.imported == 1
+        assert report.rejected_rows == [1, 2, 3]
+        assert report.rejections == {RejectionReason.INVALID_ODOMETRY: 3}
+        assert imported.get("ok").odometer_meters == 10.0
+
+    def test_import_batches_when_duplicate_ids_then_rejected_without_raising(
+        self,
+        fleet: Fleet
+    ) -> None:
+        imported = Fleet.create()
+        ArrowFleetImporter(imported).import_table(fleet_to_table(fleet))
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "vehicle_id": ["vehicle_0", "new", "new", "other"],
+                "latitude": [1.0, 1.0, 2.0, 1.0],
+                "longitude": [1.0, 1.0, 1.0, 1.0],
+                "speed_mps": [1.0, 1.0, 1.0, 1.0],
+                "heading_degrees": [0.0, 0.0, 0.0, 0.0],
+                "state": ["driving", "driving", "driving", "driving"],
+            },
+            schema=fleet_schema(),
+        )
+
+        report = ArrowFleetImporter(imported).import_batches([batch])
+
+        assert report.imported == 2
+        assert report.rejected_rows == [0, 2]
+        assert report.rejections == {RejectionReason.DUPLICATE_VEHICLE_ID: 2}
+        assert imported.get("new").coordinates.latitude == 1.0
+        assert "other" in imported
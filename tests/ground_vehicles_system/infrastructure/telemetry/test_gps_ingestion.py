@@ -0,0 +1,219 @@
+import io
+import socket
+import threading
+
+import pytest
+
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle, VehicleState
+from ground_vehicles_system.domain.services.batch_validation import RejectionReason
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.heading import Heading
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+from ground_vehicles_system.infrastructure.telemetry.gps_ingestion import (
+    BINARY_FIX,
+    GpsTelemetryIngestor,
+    IngestionReport,
+    encode_binary_fix
+)
+
+
+class TestGpsTelemetryIngestor:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            Vehicle(
+                vehicle_id="vehicle_1",
+                coordinates=Coordinates(34.0522, -118.2437),
+                velocity=Velocity(0.0),
+                heading=Heading(0.0),
+                state=VehicleState.STOPPED
+            )
+        ])
+
+    def test_ingest_lines_when_known_vehicle_then_updated_in_place(
+        self,
+        fleet: Fleet
+    ) -> None:
+        vehicle = fleet.get("vehicle_1")
+
+        report = GpsTelemetryIngestor(fleet).ingest_lines(
+            ["vehicle_1,34.06,-118.25,12.5,370\n"]
+        )
+
+        assert report == IngestionReport(updated=1)
+        assert fleet.get("vehicle_1") is vehicle
+        assert vehicle.coordinates == Coordinates(34.06, -118.25)
+        assert vehicle.velocity == Velocity(12.5)
+        assert vehicle.heading == Heading(10.0)
+        assert vehicle.state == VehicleState.DRIVING
+
+    def test_ingest_lines_when_unknown_vehicle_then_created(
+        self,
+        fleet: Fleet
+    ) -> None:
+        report = GpsTelemetryIngestor(fleet).ingest_lines(
+            [b"vehicle_2,1.0,2.0,0.0,90.0\n"]
+        )
+
+        assert report.created == 1
+        assert fleet.get("vehicle_2").state == VehicleState.STOPPED
+
+    def test_ingest_lines_when_creation_disabled_then_unknown_vehicle_dropped(
+        self,
+        fleet: Fleet
+    ) -> None:
+        ingestor = GpsTelemetryIngestor(fleet, create_missing=False)
+
+        report = ingestor.ingest_lines(["vehicle_2,1.0,2.0,0.0,90.0"])
+
+        assert report == IngestionReport(dropped=1)
+        assert "vehicle_2" not in fleet
+
+    def test_ingest_lines_when_bad_records_then_counted(
+        self,
+        fleet: Fleet
+    ) -> None:
+        lines = [
+            "vehicle_1,not-a-number,2.0,0.0,0.0",
+            "vehicle_1,1.0,2.0",
+            ",1.0,2.0,0.0,0.0",
+            b"\xff\xfe,1.0,2.0,0.0,0.0",
+            "vehicle_1,91.0,2.0,0.0,0.0",
+            "vehicle_1,1.0,2.0,-3.0,0.0",
+            "vehicle_1,nan,2.0,3.0,0.0",
+            "\n",
+            "vehicle_1,1.0,2.0,3.0,0.0",
+        ]
+
+        report = GpsTelemetryIngestor(fleet).ingest_lines(lines)
+
+        assert report == IngestionReport(
+            updated=1,
+            malformed=4,
+            dropped=3,
+            rejections={
+                RejectionReason.INVALID_LATITUDE: 2,
+                RejectionReason.INVALID_VELOCITY: 1,
+            },
+        )
+        assert report.accepted == 1
+
+    def test_ingest_text_stream_when_file_then_reads_until_eof(
+        self,
+        fleet: Fleet
+    ) -> None:
+        stream = io.BytesIO(
+            b"vehicle_1,1.0,2.0,3.0,0.0\nvehicle_2,1.0,2.0,3.0,0.0\n"
+        )
+
+        report = GpsTelemetryIngestor(fleet).ingest_text_stream(stream)
+
+        assert report == IngestionReport(created=1, updated=1)
+
+    def test_ingest_binary_stream_when_records_then_upserts(
+        self,
+        fleet: Fleet
+    ) -> None:
+        stream = io.BytesIO(
+            encode_binary_fix("vehicle_1", 1.5, 2.5, 4.0, 45.0)
+            + encode_binary_fix("vehicle_2", -1.5, -2.5, 0.0, 0.0)
+            + b"\x00" * 10
+        )
+
+        report = GpsTelemetryIngestor(fleet).ingest_binary_stream(
+            stream, batch_records=1
+        )
+
+        assert report == IngestionReport(created=1, updated=1, malformed=1)
+        assert fleet.get("vehicle_1").coordinates == Coordinates(1.5, 2.5)
+        assert fleet.get("vehicle_2").coordinates == Coordinates(-1.5, -2.5)
+
+    def test_ingest_binary_stream_when_id_is_empty_then_counted_malformed(
+        self,
+        fleet: Fleet
+    ) -> None:
+        stream = io.BytesIO(BINARY_FIX.pack(b"", 1.5, 2.5, 4.0, 45.0))
+
+        report = GpsTelemetryIngestor(fleet).ingest_binary_stream(stream)
+
+        assert report == IngestionReport(malformed=1)
+        assert len(fleet) == 1
+
+    @pytest.mark.parametrize("vehicle_id", ["", "v" * 33, "é" * 17])
+    def test_encode_binary_fix_when_id_does_not_fit_then_raises_exception(
+        self,
+        vehicle_id: str
+    ) -> None:
+        with pytest.raises(ValueError):
+            encode_binary_fix(vehicle_id, 1.5, 2.5, 4.0, 45.0)
+
+    def test_ingest_socket_when_peer_sends_lines_then_upserts(
+        self,
+        fleet: Fleet
+    ) -> None:
+        receiver, sender = socket.socketpair()
+
+        def send() -> None:
+            with sender:
+                sender.sendall(b"vehicle_1,1.0,2.0,3.0,0.0\n")
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        with receiver:
+            report = GpsTelemetryIngestor(fleet).ingest_socket(receiver)
+        thread.join()
+
+        assert report == IngestionReport(updated=1)
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_ingest_socket_when_feed_is_slow_then_applied_before_close(
+        self,
+        fleet: Fleet,
+        binary: bool
+    ) -> None:
+        receiver, sender = socket.socketpair()
+        ingestor = GpsTelemetryIngestor(fleet)
+        thread = threading.Thread(
+            target=ingestor.ingest_socket, args=(receiver, binary)
+        )
+        thread.start()
+        record = (
+            encode_binary_fix("vehicle_1", 1.5, 2.5, 4.0, 45.0)
+            if binary
+            else b"vehicle_1,1.5,2.5,4.0,45.0\n"
+        )
+
+        with sender:
+            # Sent in two parts, so the first read ends mid-record.
+            sender.sendall(record[:7])
+            sender.sendall(record[7:])
+            for _ in range(500):
+                if fleet.get("vehicle_1").coordinates == Coordinates(1.5, 2.5):
+                    break
+                threading.Event().wait(0.01)
+            applied_while_open = fleet.get("vehicle_1").coordinates
+        thread.join()
+        receiver.close()
+
+        assert applied_while_open == Coordinates(1.5, 2.5)
+
+    def test_ingest_text_stream_when_last_line_unterminated_then_ingested(
+        self,
+        fleet: Fleet
+    ) -> None:
+        stream = io.BytesIO(b"vehicle_1,1.0,2.0,3.0,0.0\nvehicle_2,1.0,2.0,3.0,0.0")
+
+        report = GpsTelemetryIngestor(fleet).ingest_text_stream(stream)
+
+        assert report == IngestionReport(created=1, updated=1)
+
+    def test_ingest_lines_when_vehicle_accidented_then_state_is_kept(
+        self,
+        fleet: Fleet
+    ) -> None:
+        fleet.get("vehicle_1")._state = VehicleState.ACCIDENTED
+
+        GpsTelemetryIngestor(fleet).ingest_lines(["vehicle_1,1.0,2.0,3.0,0.0"])
+
+        assert fleet.get("vehicle_1").state == VehicleState.ACCIDENTED
@@ -0,0 +1,185 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from ground_vehicles_system.application.services.fleet_queries import (
+    FleetQueryIndex
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity
+from ground_vehicles_system.presentation.http import fleet_http_api
+from ground_vehicles_system.presentation.http.fleet_http_api import (
+    FleetHttpApi,
+    HttpResponse
+)
+from ground_vehicles_system.presentation.http.http_server import HttpServer
+from ground_vehicles_system.presentation.http.local_client import (
+    ClientResponse,
+    LocalHttpClient
+)
+
+
+def get(api: FleetHttpApi, target: str) -> ClientResponse:
+    async def request() -> ClientResponse:
+        async with HttpServer(api) as server:
+            return await LocalHttpClient(*server.address).get(target)
+
+    return asyncio.run(request())
+
+
+class FailingBodyApi:
+    def handle(self, method: str, target: str) -> HttpResponse:
+        def body() -> Iterator[bytes]:
+            yield b'{"vehicles":['
+            raise RuntimeError("index failed")
+
+        return HttpResponse(200, body())
+
+
+class TestFleetHttpApi:
+    @pytest.fixture
+    def api(self) -> FleetHttpApi:
+        fleet = Fleet.create(
+            Vehicle.create(
+                Coordinates(10.0 + index * 0.001, 20.0),
+                Velocity(10.0 if index % 2 else 0.0),
+                vehicle_id=f"vehicle_{index:02d}",
+            )
+            for index in range(20)
+        )
+        return FleetHttpApi(FleetQueryIndex(fleet))
+
+    def test_get_vehicle_when_known_then_returns_vehicle(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = get(api, "/vehicles/vehicle_01")
+
+        assert response.status == 200
+        assert response.json()["state"] == "driving"
+        assert response.json()["speed_mps"] == 10.0
+
+    def test_get_vehicle_when_unknown_then_not_found(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = get(api, "/vehicles/missing")
+
+        assert response.status == 404
+
+    def test_list_when_limit_spans_pages_then_streamed_in_chunks(
+        self,
+        api: FleetHttpApi,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(fleet_http_api, "STREAM_PAGE_SIZE", 4)
+
+        response = get(api, "/vehicles?limit=10")
+
+        body = response.json()
+        assert [vehicle["vehicle_id"] for vehicle in body["vehicles"]] == [
+            f"vehicle_{index:02d}" for index in range(10)
+        ]
+        assert body["next_cursor"] == "vehicle_09"
+        assert response.chunk_count == 5
+
+    def test_list_when_vehicle_removed_midway_then_body_ends_with_cursor(
+        self,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(fleet_http_api, "STREAM_PAGE_SIZE", 4)
+        fleet = Fleet.create(
+            Vehicle.create(
+                Coordinates(10.0, 20.0), Velocity(0.0), f"vehicle_{index:02d}"
+            )
+            for index in range(10)
+        )
+        api = FleetHttpApi(FleetQueryIndex(fleet))
+        fleet.remove("vehicle_05")
+
+        response = get(api, "/vehicles?limit=10")
+
+        body = response.json()
+        assert response.status == 200
+        assert len(body["vehicles"]) == 4
+        assert body["next_cursor"] == "vehicle_03"
+        assert "vehicle_05" in body["error"]
+
+    def test_serve_when_body_fails_midway_then_response_is_left_incomplete(
+        self
+    ) -> None:
+        async def request() -> None:
+            async with HttpServer(FailingBodyApi()) as server:
+                await LocalHttpClient(*server.address).get("/vehicles")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(request())
+
+    def test_list_when_state_and_cursor_then_next_page_of_state(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = get(api, "/vehicles?state=driving&after=vehicle_15&limit=10")
+
+        body = response.json()
+        assert [vehicle["vehicle_id"] for vehicle in body["vehicles"]] == [
+            "vehicle_17",
+            "vehicle_19",
+        ]
+        assert body["next_cursor"] is None
+
+    def test_list_when_bbox_then_vehicles_inside(self, api: FleetHttpApi) -> None:
+        response = get(api, "/vehicles?bbox=9.9995,19.999,10.0015,20.001")
+
+        body = response.json()
+        assert [vehicle["vehicle_id"] for vehicle in body["vehicles"]] == [
+            "vehicle_00",
+            "vehicle_01",
+        ]
+
+    def test_list_when_near_then_vehicles_within_radius(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = get(api, "/vehicles?near=10.019,20.0&radius_m=150")
+
+        body = response.json()
+        assert [vehicle["vehicle_id"] for vehicle in body["vehicles"]] == [
+            "vehicle_18",
+            "vehicle_19",
+        ]
+
+    @pytest.mark.parametrize("query", [
+        "bbox=-inf,-inf,inf,inf",
+        "bbox=nan,0,1,1",
+        "bbox=0,0,91,1",
+        "near=inf,0&radius_m=10",
+        "near=10,20&radius_m=inf",
+    ])
+    def test_list_when_bounds_not_finite_or_out_of_range_then_bad_request(
+        self,
+        api: FleetHttpApi,
+        query: str
+    ) -> None:
+        response = api.handle("GET", f"/vehicles?{query}")
+
+        assert response.status == 400
+
+    def test_list_when_state_unknown_then_bad_request(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = get(api, "/vehicles?state=flying")
+
+        assert response.status == 400
+
+    def test_handle_when_not_get_then_method_not_allowed(
+        self,
+        api: FleetHttpApi
+    ) -> None:
+        response = api.handle("POST", "/vehicles")
+
+        assert response.status == 405
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from ground_vehicles_system.application.services.viewport_fanout import (
+    ViewportFanout
+)
+from ground_vehicles_system.domain.entities.fleet import Fleet
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+from ground_vehicles_system.domain.value_objects.bounding_box import BoundingBox
+from ground_vehicles_system.domain.value_objects.coordinates import Coordinates
+from ground_vehicles_system.domain.value_objects.velocity import Velocity, VelocityUnit
+from ground_vehicles_system.presentation.streaming.local_client import (
+    LocalStreamClient
+)
+from ground_vehicles_system.presentation.streaming.subscription_server import (
+    MAX_RATE_HZ,
+    SubscriptionServer,
+    parse_viewport
+)
+
+
+class TestParseViewport:
+    def test_parse_viewport_when_valid_then_box_and_rate(self) -> None:
+        box, rate_hz = parse_viewport(b'{"bbox": [1, 2, 3, 4], "rate_hz": 10}')
+
+        assert box == BoundingBox(1.0, 2.0, 3.0, 4.0)
+        assert rate_hz == 10.0
+
+    @pytest.mark.parametrize("line", [
+        b"not json",
+        b'{"rate_hz": 1}',
+        b'{"bbox": [1, 2, 3]}',
+        b'{"bbox": [1, 2, 3, 4], "rate_hz": 0}',
+        b'{"bbox": [1, 2, 3, 4], "rate_hz": 1e999}',
+        b'{"bbox": [-1e999, -1e999, 1e999, 1e999]}',
+        b'{"bbox": [NaN, 2, 3, 4]}',
+        b'{"bbox": [-91, 2, 3, 4]}',
+        b"[1, 2, 3, 4]",
+    ])
+    def test_parse_viewport_when_malformed_then_raises_exception(
+        self,
+        line: bytes
+    ) -> None:
+        with pytest.raises(ValueError):
+            parse_viewport(line)
+
+
+    def test_parse_viewport_when_rate_too_high_then_capped(self) -> None:
+        _, rate_hz = parse_viewport(b'{"bbox": [1, 2, 3, 4], "rate_hz": 1e6}')
+
+        assert rate_hz == MAX_RATE_HZ
+
+
+class TestSubscriptionServer:
+    @pytest.fixture
+    def fleet(self) -> Fleet:
+        return Fleet.create([
+            Vehicle.create(Coordinates(10.0, 20.0), Velocity(0.0), "inside"),
+            Vehicle.create(Coordinates(50.0, 50.0), Velocity(0.0), "far_away"),
+        ])
+
+    def test_subscribe_when_vehicle_changes_then_latest_state_streamed(
+        self,
+        fleet: Fleet
+    ) -> None:
+        async def scenario() -> list[dict]:
+            async with SubscriptionServer(ViewportFanout(fleet)) as server:
+                async with LocalStreamClient(*server.address) as client:
+                    await client.subscribe(
+                        BoundingBox(9.99, 19.99, 10.01, 20.01), rate_hz=50.0
+                    )
+                    initial = await client.receive(timeout=5.0)
+
+                    fleet.get("far_away").accelerate(3.0, VelocityUnit.MPS)
+                    for _ in range(3):
+                        fleet.get("inside").accelerate(1.0, VelocityUnit.MPS)
+                    update = await client.receive(timeout=5.0)
+
+                    return [initial, update]
+
+        initial, update = asyncio.run(scenario())
+
+        assert initial["type"] == "update"
+        assert initial["vehicle"]["speed_mps"] == 0.0
+        assert update["vehicle"]["vehicle_id"] == "inside"
+        assert update["vehicle"]["speed_mps"] == 3.0
+
+    def test_subscribe_when_viewport_moved_then_removal_streamed(
+        self,
+        fleet: Fleet
+    ) -> None:
+        async def scenario() -> list[dict]:
+            async with SubscriptionServer(ViewportFanout(fleet)) as server:
+                async with LocalStreamClient(*server.address) as client:
+                    await client.subscribe(BoundingBox(9.99, 19.99, 10.01, 20.01))
+                    await client.receive(timeout=5.0)
+
+                    await client.subscribe(BoundingBox(49.99, 49.99, 50.01, 50.01))
+                    return [
+                        await client.receive(timeout=5.0),
+                        await client.receive(timeout=5.0),
+                    ]
+
+        messages = asyncio.run(scenario())
+
+        assert {"type": "remove", "vehicle_id": "inside"} in messages
+        assert any(
+            message["type"] == "update"
+            and message["vehicle"]["vehicle_id"] == "far_away"
+            for message in messages
+        )
+
+    def test_subscribe_when_malformed_then_error_message(
+        self,
+        fleet: Fleet
+    ) -> None:
+        async def scenario() -> bytes:
+            async with SubscriptionServer(ViewportFanout(fleet)) as server:
+                reader, writer = await asyncio.open_connection(*server.address)
+                writer.write(b"garbage\n")
+                await writer.drain()
+                message = await asyncio.wait_for(reader.readline(), 5.0)
+                writer.close()
+                await writer.wait_closed()
+                return message
+
+        message = asyncio.run(scenario())
+
+        assert b'"type": "error"' in message
+
+    def test_subscribe_when_infinite_bounds_then_error_and_connection_kept(
+        self,
+        fleet: Fleet
+    ) -> None:
+        async def scenario() -> list[bytes]:
+            async with SubscriptionServer(ViewportFanout(fleet)) as server:
+                reader, writer = await asyncio.open_connection(*server.address)
+                writer.write(b'{"bbox": [-1e999, -1e999, 1e999, 1e999]}\n')
+                writer.write(b'{"bbox": [9, 19, 11, 21], "rate_hz": 100}\n')
+                await writer.drain()
+                messages = [
+                    await asyncio.wait_for(reader.readline(), 5.0)
+                    for _ in range(2)
+                ]
+                writer.close()
+                await writer.wait_closed()
+                return messages
+
+        error, update = asyncio.run(scenario())
+
+        assert b'"type": "error"' in error
+        assert b'"inside"' in update
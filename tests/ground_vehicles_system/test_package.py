@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ground_vehicles_system
+from ground_vehicles_system.domain.entities.vehicle import Vehicle
+
+
+def _modules_loaded_by(code: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestPackage:
+    def test_import_when_no_export_is_used_then_domain_is_not_loaded(self) -> None:
+        modules = _modules_loaded_by("import ground_vehicles_system")
+
+        assert "ground_vehicles_system.domain.entities.vehicle" not in modules
+        assert "uuid" not in modules
+
+    def test_import_vehicle_module_when_no_id_is_generated_then_uuid_is_not_loaded(
+        self
+    ) -> None:
+        modules = _modules_loaded_by(
+            "import ground_vehicles_system.domain.entities.fleet"
+        )
+
+        assert "uuid" not in modules
+
+    def test_getattr_when_name_is_exported_then_returns_the_domain_class(
+        self
+    ) -> None:
+        assert ground_vehicles_system.Vehicle is Vehicle
+        assert "Vehicle" in dir(ground_vehicles_system)
+
+    def test_getattr_when_name_is_not_exported_then_raises_attribute_error(
+        self
+    ) -> None:
+        with pytest.raises(AttributeError):
+            ground_vehicles_system.Missing
+
+    def test_all_when_listed_then_every_name_resolves(self) -> None:
+        for name in ground_vehicles_system.__all__:
+            assert getattr(ground_vehicles_system, name) is not None
+
+        assert sorted(ground_vehicles_system.__all__) == sorted(
+            ground_vehicles_system._EXPORTS
+        )